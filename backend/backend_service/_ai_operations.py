@@ -2,23 +2,162 @@
 AI Operations Module - All LLM/AI operations
 Handles Ollama integration for enhanced analysis
 """
+import asyncio
+import functools
+import hashlib
 import json
 import re
-from typing import Dict, Any, Optional, List
+import time
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
+
+try:
+    import xxhash
+    _fast_hash = xxhash.xxh3_64_hexdigest
+except ImportError:
+    def _fast_hash(data: bytes) -> str:
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
 from .entities.analysis import AnalysisResult, ExtractedEntities
 from .entities.risk import RiskClassification
+from .utils.cache import TTLCache, SemanticCache, load_embedder
 from .llm_globals import (
     LLM_PROVIDER,
     OLLAMA_BASE,
     OLLAMA_MODEL,
     LLM_TIMEOUT,
+    OLLAMA_NUM_PARALLEL,
+    LLM_CACHE_SIZE,
+    LLM_CACHE_TTL,
+    LLM_SEMANTIC_CACHE,
+    LLM_SEMANTIC_CACHE_SIZE,
+    LLM_SEMANTIC_CACHE_THRESHOLD,
+    LLM_SEMANTIC_CACHE_MODEL,
     CLASSIFICATION_PROMPT,
     ENTITY_EXTRACTION_PROMPT,
-    EXPLANATION_PROMPT
+    EXPLANATION_PROMPT,
+    BATCH_ANALYSIS_PROMPT,
+    ANALYSIS_ITEM_TEMPLATE
+)
+
+_ENTITY_FIELDS = (
+    'weapon_types', 'weapon_models', 'locations', 'contact_methods',
+    'prices', 'quantities', 'time_references'
 )
 
+# Seconds to reuse the last is_available() probe result
+AVAILABILITY_TTL = 5.0
+
+# Seconds between background health probes in AsyncLLMOperations
+HEALTH_CHECK_INTERVAL = 5.0
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _compile_prompt(template: str, *fields: str):
+    """
+    Pre-split a prompt template on its {field} placeholders
+    
+    The templates embed literal JSON braces, so str.format cannot be used
+    on them. Splitting once at import leaves a plain join per call.
+    
+    Args:
+        template: Prompt template containing {field} placeholders
+        fields: Placeholder names to substitute
+    
+    Returns:
+        Function taking the field values as keyword arguments
+    """
+    placeholder = re.compile("(" + "|".join(re.escape("{%s}" % f) for f in fields) + ")")
+    pieces = placeholder.split(template)
+    literals = pieces[0::2]
+    names = [p[1:-1] for p in pieces[1::2]]
+    
+    def render(**values) -> str:
+        out = [literals[0]]
+        for name, literal in zip(names, literals[1:]):
+            out.append(str(values[name]))
+            out.append(literal)
+        return "".join(out)
+    
+    return render
+
+
+_render_classification = _compile_prompt(
+    CLASSIFICATION_PROMPT, "text", "rule_flags", "keywords", "patterns", "rule_risk"
+)
+_render_entity_extraction = _compile_prompt(ENTITY_EXTRACTION_PROMPT, "text")
+_render_explanation = _compile_prompt(EXPLANATION_PROMPT, "text", "flags")
+_render_batch_analysis = _compile_prompt(BATCH_ANALYSIS_PROMPT, "items")
+_render_analysis_item = _compile_prompt(
+    ANALYSIS_ITEM_TEMPLATE, "index", "text", "rule_flags", "keywords", "patterns", "rule_risk"
+)
+
+
+_FENCED_JSON = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
+
+def _extract_json_object(text: str) -> Optional[str]:
+    """
+    Find the first balanced {...} object in text with a single forward scan
+    
+    Tracks brace depth while skipping braces inside JSON strings, so the
+    cost is linear in the length of the text.
+    
+    Args:
+        text: Raw text that may contain a JSON object
+    
+    Returns:
+        The object substring, or None if no balanced object is found
+    """
+    start = text.find('{')
+    if start < 0:
+        return None
+    
+    depth = 0
+    in_str = False
+    escaped = False
+    
+    for i in range(start, len(text)):
+        c = text[i]
+        if in_str:
+            if escaped:
+                escaped = False
+            elif c == '\\':
+                escaped = True
+            elif c == '"':
+                in_str = False
+        elif c == '"':
+            in_str = True
+        elif c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    
+    return None
+
+
+def _fallback_response() -> Dict[str, Any]:
+    """Neutral verdict used when an LLM reply holds no parseable JSON"""
+    return {
+        "final_label": "MEDIUM",
+        "risk_adjustment": 0.0,
+        "reasons": ["fallback-parser"],
+        "evidence_spans": [],
+        "misclassification_risk": "MEDIUM"
+    }
+
 
 class LLMOperations:
     """
@@ -37,13 +176,84 @@ class LLMOperations:
         self.base_url = base_url or OLLAMA_BASE
         self.model = model or OLLAMA_MODEL
         self._requests = None
+        self._session = None
+        self._cache = TTLCache(maxsize=LLM_CACHE_SIZE, ttl=LLM_CACHE_TTL)
+        self._semantic = self._build_semantic_caches() if LLM_SEMANTIC_CACHE else None
+        # (checked_at, available) from the last health probe
+        self._avail_cache = (0.0, False)
+        # Per-instance constants, built once instead of on every call
+        self._chat_url = f"{self.base_url}/api/chat"
+        self._tags_url = f"{self.base_url}/api/tags"
+        self._base_body = {
+            "model": self.model,
+            "options": {"temperature": 0},
+            "stream": False
+        }
+        self._post_chat = None
         
         try:
             import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
             self._requests = requests
+            
+            # One pooled keep-alive session for all calls to Ollama
+            adapter = HTTPAdapter(
+                pool_connections=64,
+                pool_maxsize=64,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.2,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=frozenset({"GET", "POST"})
+                )
+            )
+            self._session = requests.Session()
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+            self._post_chat = functools.partial(
+                self._session.post,
+                self._chat_url,
+                headers=_JSON_HEADERS,
+                timeout=LLM_TIMEOUT
+            )
         except ImportError:
             print("Warning: requests library not installed. LLM operations unavailable.")
     
+    def _build_semantic_caches(self) -> Dict[str, SemanticCache]:
+        """Create per-operation near-duplicate caches"""
+        embed = load_embedder(LLM_SEMANTIC_CACHE_MODEL)
+        return {
+            operation: SemanticCache(
+                maxsize=LLM_SEMANTIC_CACHE_SIZE,
+                threshold=LLM_SEMANTIC_CACHE_THRESHOLD,
+                embed=embed
+            )
+            for operation in ("classify", "entities")
+        }
+    
+    def _semantic_lookup(self, operation: str, text: str) -> Optional[Dict[str, Any]]:
+        """Cached LLM result for a near-duplicate text, if enabled"""
+        if self._semantic is None:
+            return None
+        cached = self._semantic[operation].get(text)
+        return None if cached is None else _json_loads(cached)
+    
+    def _semantic_store(self, operation: str, text: str, result: Dict[str, Any]):
+        if self._semantic is not None:
+            self._semantic[operation].set(text, _json_dumps(result))
+    
+    def __enter__(self) -> 'LLMOperations':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def close(self):
+        """Release pooled HTTP connections"""
+        if self._session is not None:
+            self._session.close()
+    
     def _call_ollama(self, prompt: str, system_prompt: str = None) -> Dict[str, Any]:
         """
         Make a call to Ollama API
@@ -55,30 +265,54 @@ class LLMOperations:
         Returns:
             Parsed JSON response
         """
+        result = self._call_ollama_parsed(prompt, system_prompt)
+        return _fallback_response() if result is None else result
+    
+    def _call_ollama_parsed(self, prompt: str, system_prompt: str = None) -> Optional[Dict[str, Any]]:
+        """Like _call_ollama, but None when the reply holds no JSON object"""
         if not self._requests:
             raise RuntimeError("requests library not installed")
         
-        messages = []
-        if system_prompt:
-            messages.append({"role": "system", "content": system_prompt})
-        messages.append({"role": "user", "content": prompt})
-        
-        response = self._requests.post(
-            f"{self.base_url}/api/chat",
-            json={
-                "model": self.model,
-                "messages": messages,
-                "options": {"temperature": 0},
-                "stream": False
-            },
-            timeout=LLM_TIMEOUT
-        )
+        key = self._cache_key(prompt, system_prompt)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return _json_loads(cached)
+        
+        response = self._post_chat(data=_json_dumps(self._chat_body(prompt, system_prompt)))
         response.raise_for_status()
         
-        data = response.json()
+        data = _json_loads(response.content)
         content = data.get("message", {}).get("content", "{}")
         
-        return self._safe_json_parse(content)
+        return self._parse_and_cache(key, content)
+    
+    def _parse_and_cache(self, key: str, content: str) -> Optional[Dict[str, Any]]:
+        """Parse a reply and cache it only if it held real JSON"""
+        result = self._parse_json_reply(content)
+        if result is not None:
+            # Cached serialized so every hit decodes a fresh dict; callers
+            # hand results to API clients that are free to mutate them
+            self._cache.set(key, _json_dumps(result))
+        return result
+    
+    def _cache_key(self, prompt: str, system_prompt: str = None) -> str:
+        """In-process cache key for a request: fast hash of model, system prompt and prompt"""
+        body = "\x00".join((self.model, system_prompt or "", prompt))
+        return _fast_hash(body.encode())
+    
+    def _chat_body(self, prompt: str, system_prompt: str = None) -> Dict[str, Any]:
+        """Build the /api/chat request body"""
+        if system_prompt:
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt}
+            ]
+        else:
+            messages = [{"role": "user", "content": prompt}]
+        
+        body = self._base_body.copy()
+        body["messages"] = messages
+        return body
     
     def _safe_json_parse(self, text: str) -> Dict[str, Any]:
         """
@@ -90,28 +324,35 @@ class LLMOperations:
         Returns:
             Parsed dictionary
         """
-        # Try direct parse
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            pass
+        result = self._parse_json_reply(text)
+        return _fallback_response() if result is None else result
+    
+    def _parse_json_reply(self, text: str) -> Optional[Dict[str, Any]]:
+        """Parse JSON from an LLM reply, or None if it holds none"""
+        # Chat models commonly wrap JSON in ```json fences; probe that
+        # shape first instead of failing a direct parse on every reply
+        if "```" in text:
+            fenced = _FENCED_JSON.search(text)
+            if fenced:
+                try:
+                    return _json_loads(fenced.group(1))
+                except json.JSONDecodeError:
+                    pass
+        else:
+            try:
+                return _json_loads(text)
+            except json.JSONDecodeError:
+                pass
         
         # Try to find JSON object in text
-        match = re.search(r'\{[\s\S]*\}', text)
-        if match:
+        candidate = _extract_json_object(text)
+        if candidate:
             try:
-                return json.loads(match.group(0))
+                return _json_loads(candidate)
             except json.JSONDecodeError:
                 pass
         
-        # Return fallback
-        return {
-            "final_label": "MEDIUM",
-            "risk_adjustment": 0.0,
-            "reasons": ["fallback-parser"],
-            "evidence_spans": [],
-            "misclassification_risk": "MEDIUM"
-        }
+        return None
     
     def classify_risk(
         self, 
@@ -128,20 +369,26 @@ class LLMOperations:
         Returns:
             RiskClassification from LLM
         """
-        prompt = CLASSIFICATION_PROMPT.format(
+        result = self._semantic_lookup("classify", text)
+        if result is None:
+            result = self._call_ollama_parsed(*self._classification_request(text, rule_result))
+            if result is None:
+                result = _fallback_response()
+            else:
+                self._semantic_store("classify", text, result)
+        
+        return RiskClassification.from_llm_response(result)
+    
+    def _classification_request(self, text: str, rule_result: AnalysisResult) -> tuple:
+        """Build (prompt, system_prompt) for risk classification"""
+        prompt = _render_classification(
             text=text[:8000],  # Limit text length
             rule_flags=json.dumps(rule_result.flags, ensure_ascii=False),
             keywords=json.dumps(rule_result.detected_keywords, ensure_ascii=False),
             patterns=json.dumps(rule_result.detected_patterns, ensure_ascii=False),
             rule_risk=round(rule_result.risk_score, 3)
         )
-        
-        result = self._call_ollama(
-            prompt,
-            system_prompt="You are a precise risk classifier that returns strict JSON only."
-        )
-        
-        return RiskClassification.from_llm_response(result)
+        return prompt, "You are a precise risk classifier that returns strict JSON only."
     
     def extract_entities(self, text: str) -> ExtractedEntities:
         """
@@ -153,22 +400,28 @@ class LLMOperations:
         Returns:
             ExtractedEntities object
         """
-        prompt = ENTITY_EXTRACTION_PROMPT.format(text=text[:8000])
-        
-        result = self._call_ollama(
-            prompt,
-            system_prompt="You are an entity extractor that returns strict JSON only."
-        )
-        
-        return ExtractedEntities(
-            weapon_types=result.get('weapon_types', []),
-            weapon_models=result.get('weapon_models', []),
-            locations=result.get('locations', []),
-            contact_methods=result.get('contact_methods', []),
-            prices=result.get('prices', []),
-            quantities=result.get('quantities', []),
-            time_references=result.get('time_references', [])
-        )
+        result = self._semantic_lookup("entities", text)
+        if result is None:
+            result = self._call_ollama_parsed(*self._entities_request(text))
+            if result is None:
+                result = _fallback_response()
+            else:
+                self._semantic_store("entities", text, result)
+        
+        return self._entities_from_response(result)
+        
+    def _entities_request(self, text: str) -> tuple:
+        """Build (prompt, system_prompt) for entity extraction"""
+        prompt = _render_entity_extraction(text=text[:8000])
+        return prompt, "You are an entity extractor that returns strict JSON only."
+    
+    def _entities_from_response(self, result: Dict[str, Any]) -> ExtractedEntities:
+        """Convert an entity extraction response to ExtractedEntities"""
+        # Fresh lists share nothing with the response dict
+        return ExtractedEntities(*(
+            list(result.get(name) or ())
+            for name in _ENTITY_FIELDS
+        ))
     
     def explain_flags(self, text: str, flags: List[str]) -> str:
         """
@@ -181,22 +434,92 @@ class LLMOperations:
         Returns:
             Explanation string
         """
-        prompt = EXPLANATION_PROMPT.format(
+        result = self._call_ollama(*self._explanation_request(text, flags))
+        
+        return self._explanation_from_response(result)
+    
+    def _explanation_request(self, text: str, flags: List[str]) -> tuple:
+        """Build (prompt, system_prompt) for flag explanation"""
+        prompt = _render_explanation(
             text=text[:4000],
             flags=json.dumps(flags, ensure_ascii=False)
         )
+        return prompt, "You are a clear and concise explainer."
         
-        result = self._call_ollama(
-            prompt,
-            system_prompt="You are a clear and concise explainer."
-        )
-        
+    def _explanation_from_response(self, result: Any) -> str:
+        """Extract the explanation string from an LLM response"""
         # If result is a dict, try to get explanation
         if isinstance(result, dict):
             return result.get('explanation', str(result))
         
         return str(result)
     
+    def analyze_batch(
+        self,
+        texts: List[str],
+        rule_results: List[AnalysisResult]
+    ) -> List[Tuple[RiskClassification, ExtractedEntities, str]]:
+        """
+        Classify, extract entities and explain flags for several texts
+        in a single LLM call
+        
+        Args:
+            texts: Contents to analyze
+            rule_results: Rule-based analysis result for each text
+        
+        Returns:
+            One (RiskClassification, ExtractedEntities, explanation) tuple
+            per text, in input order
+        """
+        if not texts:
+            return []
+        
+        items = "\n".join(
+            self._analysis_item(i, text[:2000], rule_result)
+            for i, (text, rule_result) in enumerate(zip(texts, rule_results), start=1)
+        )
+        
+        result = self._call_ollama(
+            _render_batch_analysis(items=items),
+            system_prompt="You are a precise risk analyst that returns strict JSON only."
+        )
+        
+        by_item = {}
+        for position, entry in enumerate(result.get('results', []) or [], start=1):
+            if isinstance(entry, dict):
+                by_item.setdefault(entry.get('item', position), entry)
+        
+        return [
+            self._split_combined_response(by_item.get(i, {}))
+            for i in range(1, len(texts) + 1)
+        ]
+    
+    def _analysis_item(self, index: int, text: str, rule_result: AnalysisResult) -> str:
+        """Render one numbered input item for the combined prompts"""
+        return _render_analysis_item(
+            index=index,
+            text=text,
+            rule_flags=json.dumps(rule_result.flags, ensure_ascii=False),
+            keywords=json.dumps(rule_result.detected_keywords, ensure_ascii=False),
+            patterns=json.dumps(rule_result.detected_patterns, ensure_ascii=False),
+            rule_risk=round(rule_result.risk_score, 3)
+        )
+    
+    def _split_combined_response(
+        self,
+        result: Dict[str, Any]
+    ) -> Tuple[RiskClassification, ExtractedEntities, str]:
+        """Split a combined analysis response into its three parts"""
+        classification = result.get('classification') or {}
+        entities = result.get('entities') or {}
+        explanation = result.get('explanation', '')
+        
+        return (
+            RiskClassification.from_llm_response(classification),
+            self._entities_from_response(entities),
+            explanation if isinstance(explanation, str) else str(explanation)
+        )
+    
     def detect_evasion(self, text: str) -> Dict[str, Any]:
         """
         Detect evasion patterns in text
@@ -314,18 +637,26 @@ Return STRICT JSON:
         return result
     
     def is_available(self) -> bool:
-        """Check if LLM is available"""
+        """Check if LLM is available (result cached for AVAILABILITY_TTL seconds)"""
         if not self._requests:
             return False
         
+        now = time.monotonic()
+        checked_at, available = self._avail_cache
+        if checked_at and now - checked_at < AVAILABILITY_TTL:
+            return available
+        
         try:
-            response = self._requests.get(
-                f"{self.base_url}/api/tags",
+            response = self._session.get(
+                self._tags_url,
                 timeout=3
             )
-            return response.status_code == 200
+            available = response.status_code == 200
         except Exception:
-            return False
+            available = False
+        
+        self._avail_cache = (now, available)
+        return available
     
     def get_status(self) -> Dict[str, Any]:
         """Get LLM status"""
@@ -339,3 +670,210 @@ Return STRICT JSON:
             "timestamp": datetime.now().isoformat()
         }
 
+
+
+class AsyncLLMOperations(LLMOperations):
+    """
+    Async variant of LLMOperations backed by a shared aiohttp session.
+    Independent prompts can be sent concurrently via call_many().
+    
+    Usage:
+        async with AsyncLLMOperations() as llm:
+            classification = await llm.aclassify_risk(text, rule_result)
+    
+    Note: Ollama only serves concurrent requests in parallel when the server
+    runs with OLLAMA_NUM_PARALLEL > 1; otherwise they are queued.
+    """
+    
+    def __init__(
+        self,
+        base_url: str = None,
+        model: str = None,
+        max_concurrency: int = None
+    ):
+        """
+        Initialize async LLM operations
+        
+        Args:
+            base_url: Ollama base URL (defaults to env var)
+            model: Model to use (defaults to env var)
+            max_concurrency: Max in-flight requests (defaults to OLLAMA_NUM_PARALLEL)
+        """
+        super().__init__(base_url, model)
+        self.max_concurrency = max_concurrency or OLLAMA_NUM_PARALLEL
+        self._aiohttp = None
+        self._async_session = None
+        self._available = False
+        self._health_task = None
+        
+        try:
+            import aiohttp
+            self._aiohttp = aiohttp
+        except ImportError:
+            print("Warning: aiohttp library not installed. Async LLM operations unavailable.")
+            return
+        
+        # Inside a running event loop, keep availability fresh in the
+        # background so is_available() never blocks on the network
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self.start_health_monitor()
+    
+    def start_health_monitor(self, interval: float = HEALTH_CHECK_INTERVAL):
+        """
+        Start probing Ollama in the background every `interval` seconds
+        
+        Must be called from within a running event loop.
+        """
+        if self._health_task is None or self._health_task.done():
+            self._health_task = asyncio.get_running_loop().create_task(
+                self._health_loop(interval)
+            )
+    
+    async def _health_loop(self, interval: float):
+        """Periodically refresh the shared availability flag"""
+        while True:
+            self._available = await self._probe()
+            await asyncio.sleep(interval)
+    
+    async def _probe(self) -> bool:
+        """Single async health probe against /api/tags"""
+        try:
+            session = await self._get_async_session()
+            async with session.get(
+                self._tags_url,
+                timeout=self._aiohttp.ClientTimeout(total=1)
+            ) as response:
+                return response.status == 200
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            return False
+    
+    def is_available(self) -> bool:
+        """Check if LLM is available; reads the background probe result when running"""
+        if self._health_task is not None and not self._health_task.done():
+            return self._available
+        return super().is_available()
+    
+    async def __aenter__(self) -> 'AsyncLLMOperations':
+        await self._get_async_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def _get_async_session(self):
+        """Lazily create the shared client session"""
+        if not self._aiohttp:
+            raise RuntimeError("aiohttp library not installed")
+        
+        if self._async_session is None or self._async_session.closed:
+            connector = self._aiohttp.TCPConnector(limit=1000, limit_per_host=100)
+            self._async_session = self._aiohttp.ClientSession(connector=connector)
+        
+        return self._async_session
+    
+    async def aclose(self):
+        """Close the shared client session and pooled sync connections"""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        if self._async_session is not None and not self._async_session.closed:
+            await self._async_session.close()
+        self._async_session = None
+        self.close()
+    
+    async def _acall_ollama(self, prompt: str, system_prompt: str = None) -> Dict[str, Any]:
+        """
+        Make an async call to Ollama API
+        
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+        
+        Returns:
+            Parsed JSON response
+        """
+        result = await self._acall_ollama_parsed(prompt, system_prompt)
+        return _fallback_response() if result is None else result
+    
+    async def _acall_ollama_parsed(self, prompt: str, system_prompt: str = None) -> Optional[Dict[str, Any]]:
+        """Like _acall_ollama, but None when the reply holds no JSON object"""
+        key = self._cache_key(prompt, system_prompt)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return _json_loads(cached)
+        
+        session = await self._get_async_session()
+        
+        async with session.post(
+            self._chat_url,
+            data=_json_dumps(self._chat_body(prompt, system_prompt)),
+            headers=_JSON_HEADERS,
+            timeout=self._aiohttp.ClientTimeout(total=LLM_TIMEOUT)
+        ) as response:
+            response.raise_for_status()
+            data = _json_loads(await response.read())
+        
+        content = data.get("message", {}).get("content", "{}")
+        
+        return self._parse_and_cache(key, content)
+    
+    async def call_many(
+        self,
+        prompts: List[str],
+        system_prompt: str = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Send several independent prompts concurrently
+        
+        Args:
+            prompts: List of user prompts
+            system_prompt: Optional system prompt shared by all prompts
+        
+        Returns:
+            Parsed JSON responses, in the same order as prompts
+        """
+        sem = asyncio.Semaphore(self.max_concurrency)
+        
+        async def _one(prompt: str) -> Dict[str, Any]:
+            async with sem:
+                return await self._acall_ollama(prompt, system_prompt)
+        
+        return await asyncio.gather(*[_one(p) for p in prompts])
+    
+    async def aclassify_risk(
+        self,
+        text: str,
+        rule_result: AnalysisResult
+    ) -> RiskClassification:
+        """Async version of classify_risk"""
+        result = self._semantic_lookup("classify", text)
+        if result is None:
+            result = await self._acall_ollama_parsed(*self._classification_request(text, rule_result))
+            if result is None:
+                result = _fallback_response()
+            else:
+                self._semantic_store("classify", text, result)
+        
+        return RiskClassification.from_llm_response(result)
+    
+    async def aextract_entities(self, text: str) -> ExtractedEntities:
+        """Async version of extract_entities"""
+        result = self._semantic_lookup("entities", text)
+        if result is None:
+            result = await self._acall_ollama_parsed(*self._entities_request(text))
+            if result is None:
+                result = _fallback_response()
+            else:
+                self._semantic_store("entities", text, result)
+        
+        return self._entities_from_response(result)
+    
+    async def aexplain_flags(self, text: str, flags: List[str]) -> str:
+        """Async version of explain_flags"""
+        result = await self._acall_ollama(*self._explanation_request(text, flags))
+        return self._explanation_from_response(result)
@@ -3,8 +3,24 @@ Metrics and telemetry for the backend service
 """
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
-from collections import defaultdict
+from collections import defaultdict, deque
 import threading
+import time
+import weakref
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Number of most recent samples kept per histogram
+HISTOGRAM_SIZE = 1000
+
+
+class _ShardOwner:
+    """Thread-local token; it is released when its thread exits"""
+    __slots__ = ("__weakref__",)
 
 
 class MetricsCollector:
@@ -12,17 +28,97 @@ class MetricsCollector:
     Collects and aggregates metrics for the weapons detection system
     """
     
-    def __init__(self):
-        self._lock = threading.Lock()
-        self._counters: Dict[str, int] = defaultdict(int)
+    def __init__(self, histogram_size: int = HISTOGRAM_SIZE):
+        """
+        Initialize the collector
+        
+        Args:
+            histogram_size: Number of most recent samples kept per histogram
+        """
+        self.histogram_size = histogram_size
+        # Reentrant: a shard may be retired by a finalizer that runs while
+        # the current thread already holds the lock
+        self._lock = threading.RLock()
+        # Counters live in fixed slots: each name is mapped to an index
+        # once, and every thread keeps its own list of slot values so
+        # increment() needs no lock; readers merge every shard. When a
+        # thread exits, its shard is folded into _base_counters.
+        self._slots: Dict[str, int] = {}
+        self._local = threading.local()
+        self._counter_shards: Dict[int, List[int]] = {}
+        self._base_counters: List[int] = []
         self._gauges: Dict[str, float] = {}
-        self._histograms: Dict[str, List[float]] = defaultdict(list)
-        self._start_time = datetime.now()
+        # Bounded to the most recent values; deque appends are atomic
+        self._histograms: Dict[str, deque] = defaultdict(lambda: deque(maxlen=self.histogram_size))
+        self._start_monotonic = time.monotonic()
+        
+        for name in MetricNames.COUNTERS:
+            self.slot(name)
+    
+    def slot(self, name: str) -> int:
+        """
+        Get the slot index for a counter, registering it if new
+        
+        Hot paths can resolve the slot once and call increment_slot()
+        to skip the name lookup on every update.
+        """
+        index = self._slots.get(name)
+        if index is None:
+            with self._lock:
+                index = self._slots.setdefault(name, len(self._slots))
+        return index
+    
+    def _new_counter_shard(self) -> List[int]:
+        """Register a counter shard for the calling thread"""
+        shard = [0] * len(self._slots)
+        owner = _ShardOwner()
+        with self._lock:
+            self._counter_shards[id(shard)] = shard
+        self._local.counters = shard
+        self._local.owner = owner
+        weakref.finalize(owner, self._retire_counter_shard, shard)
+        return shard
+    
+    def _retire_counter_shard(self, shard: List[int]):
+        """Fold an exited thread's shard into the base totals"""
+        with self._lock:
+            base = self._base_counters
+            if len(base) < len(shard):
+                base.extend([0] * (len(shard) - len(base)))
+            for index, value in enumerate(shard):
+                base[index] += value
+            del self._counter_shards[id(shard)]
+    
+    def _merged_counters(self) -> Dict[str, int]:
+        """Sum the base totals and all live per-thread counter shards"""
+        totals = [0] * len(self._slots)
+        for shard in (self._base_counters, *self._counter_shards.values()):
+            for index, value in enumerate(shard[:len(totals)]):
+                totals[index] += value
+        return {
+            name: totals[index]
+            for name, index in self._slots.items()
+            if index < len(totals) and totals[index]
+        }
     
     def increment(self, name: str, value: int = 1):
         """Increment a counter"""
-        with self._lock:
-            self._counters[name] += value
+        index = self._slots.get(name)
+        if index is None:
+            index = self.slot(name)
+        self.increment_slot(index, value)
+    
+    def increment_slot(self, index: int, value: int = 1):
+        """Increment a counter by its slot index (see slot())"""
+        try:
+            shard = self._local.counters
+        except AttributeError:
+            shard = self._new_counter_shard()
+        try:
+            shard[index] += value
+        except IndexError:
+            shard.extend([0] * (len(self._slots) - len(shard)))
+            shard[index] += value
     
     def set_gauge(self, name: str, value: float):
         """Set a gauge value"""
@@ -31,15 +127,23 @@ class MetricsCollector:
     
     def record_histogram(self, name: str, value: float):
         """Record a value in a histogram"""
-        with self._lock:
-            self._histograms[name].append(value)
-            # Keep only last 1000 values
-            if len(self._histograms[name]) > 1000:
-                self._histograms[name] = self._histograms[name][-1000:]
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms[name]
+        histogram.append(value)
     
     def get_counter(self, name: str) -> int:
         """Get counter value"""
-        return self._counters.get(name, 0)
+        index = self._slots.get(name)
+        if index is None:
+            return 0
+        with self._lock:
+            return sum(
+                shard[index]
+                for shard in (self._base_counters, *self._counter_shards.values())
+                if index < len(shard)
+            )
     
     def get_gauge(self, name: str) -> float:
         """Get gauge value"""
@@ -47,20 +151,36 @@ class MetricsCollector:
     
     def get_histogram_stats(self, name: str) -> Dict[str, float]:
         """Get histogram statistics"""
-        values = self._histograms.get(name, [])
+        values = list(self._histograms.get(name, ()))
         if not values:
             return {"count": 0, "min": 0, "max": 0, "avg": 0, "p50": 0, "p95": 0}
         
-        sorted_vals = sorted(values)
-        n = len(sorted_vals)
+        n = len(values)
+        k50 = n // 2
+        k95 = int(n * 0.95) if n > 20 else n - 1
+        
+        if np is not None:
+            # One array conversion, then vectorized reductions; the two
+            # order statistics are selected in O(n) instead of sorting
+            arr = np.fromiter(values, dtype=np.float64, count=n)
+            selected = np.partition(arr, (k50, k95))
+            return {
+                "count": n,
+                "min": float(arr.min()),
+                "max": float(arr.max()),
+                "avg": float(arr.mean()),
+                "p50": float(selected[k50]),
+                "p95": float(selected[k95])
+            }
         
+        sorted_vals = sorted(values)
         return {
             "count": n,
             "min": sorted_vals[0],
             "max": sorted_vals[-1],
             "avg": sum(sorted_vals) / n,
-            "p50": sorted_vals[n // 2],
-            "p95": sorted_vals[int(n * 0.95)] if n > 20 else sorted_vals[-1]
+            "p50": sorted_vals[k50],
+            "p95": sorted_vals[k95]
         }
     
     def get_all_metrics(self) -> Dict[str, Any]:
@@ -68,12 +188,12 @@ class MetricsCollector:
         with self._lock:
             histograms = {
                 name: self.get_histogram_stats(name)
-                for name in self._histograms
+                for name in list(self._histograms)
             }
             
             return {
-                "uptime_seconds": (datetime.now() - self._start_time).total_seconds(),
-                "counters": dict(self._counters),
+                "uptime_seconds": time.monotonic() - self._start_monotonic,
+                "counters": self._merged_counters(),
                 "gauges": dict(self._gauges),
                 "histograms": histograms,
                 "collected_at": datetime.now().isoformat()
@@ -82,10 +202,12 @@ class MetricsCollector:
     def reset(self):
         """Reset all metrics"""
         with self._lock:
-            self._counters.clear()
+            self._base_counters.clear()
+            for shard in self._counter_shards.values():
+                shard[:] = [0] * len(shard)
             self._gauges.clear()
             self._histograms.clear()
-            self._start_time = datetime.now()
+            self._start_monotonic = time.monotonic()
 
 
 # Predefined metric names
@@ -102,6 +224,19 @@ class MetricNames:
     LLM_CALLS_FAILED = "llm_calls_failed"
     ERRORS_TOTAL = "errors_total"
     
+    COUNTERS = (
+        ANALYSES_TOTAL,
+        ANALYSES_HIGH_RISK,
+        ANALYSES_MEDIUM_RISK,
+        ANALYSES_LOW_RISK,
+        COLLECTIONS_TOTAL,
+        COLLECTIONS_REDDIT,
+        COLLECTIONS_TELEGRAM,
+        LLM_CALLS_TOTAL,
+        LLM_CALLS_FAILED,
+        ERRORS_TOTAL,
+    )
+    
     # Gauges
     ACTIVE_CONNECTIONS = "active_connections"
     QUEUE_SIZE = "queue_size"
@@ -34,6 +34,20 @@ def setup_logging(level: str = "INFO", format_type: str = "standard"):
     )
 
 
+class _LazyExtra:
+    """Renders structured extra data only when a record is actually emitted"""
+    
+    __slots__ = ("extra",)
+    
+    def __init__(self, extra: Optional[Dict[str, Any]]):
+        self.extra = extra
+    
+    def __str__(self) -> str:
+        if not self.extra:
+            return ""
+        return " | " + " ".join(f"{k}={v}" for k, v in self.extra.items())
+
+
 class Logger:
     """
     Custom logger with structured logging support
@@ -44,24 +58,28 @@ class Logger:
     
     def _format_extra(self, extra: Optional[Dict[str, Any]] = None) -> str:
         """Format extra data for logging"""
-        if not extra:
-            return ""
-        return " | " + " ".join(f"{k}={v}" for k, v in extra.items())
+        return str(_LazyExtra(extra))
+    
+    def _log(self, level: int, message: str, extra: Optional[Dict[str, Any]]):
+        # Arguments are %-formatted by the handler, so disabled levels cost a
+        # single level check and filtered records never render their extras
+        if self._logger.isEnabledFor(level):
+            self._logger.log(level, "%s%s", message, _LazyExtra(extra))
     
     def debug(self, message: str, extra: Optional[Dict[str, Any]] = None):
-        self._logger.debug(f"{message}{self._format_extra(extra)}")
+        self._log(logging.DEBUG, message, extra)
     
     def info(self, message: str, extra: Optional[Dict[str, Any]] = None):
-        self._logger.info(f"{message}{self._format_extra(extra)}")
+        self._log(logging.INFO, message, extra)
     
     def warning(self, message: str, extra: Optional[Dict[str, Any]] = None):
-        self._logger.warning(f"{message}{self._format_extra(extra)}")
+        self._log(logging.WARNING, message, extra)
     
     def error(self, message: str, extra: Optional[Dict[str, Any]] = None):
-        self._logger.error(f"{message}{self._format_extra(extra)}")
+        self._log(logging.ERROR, message, extra)
     
     def critical(self, message: str, extra: Optional[Dict[str, Any]] = None):
-        self._logger.critical(f"{message}{self._format_extra(extra)}")
+        self._log(logging.CRITICAL, message, extra)
     
     def analysis_complete(
         self, 
@@ -70,6 +88,8 @@ class Logger:
         duration_ms: float
     ):
         """Log analysis completion"""
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         self.info(
             "Analysis completed",
             extra={
@@ -86,6 +106,8 @@ class Logger:
         duration_s: float
     ):
         """Log collection completion"""
+        if not self._logger.isEnabledFor(logging.INFO):
+            return
         self.info(
             "Collection completed",
             extra={
@@ -102,6 +124,8 @@ class Logger:
         latency_ms: float
     ):
         """Log LLM call"""
+        if not self._logger.isEnabledFor(logging.INFO if success else logging.WARNING):
+            return
         level = "info" if success else "warning"
         getattr(self, level)(
             f"LLM {operation}",
@@ -128,30 +152,35 @@ def timed(logger: Logger = None):
         def my_function():
             ...
     """
+    if logger is None:
+        return lambda func: func
+    
     def decorator(func):
+        completed_msg = f"{func.__name__} completed"
+        failed_msg = f"{func.__name__} failed"
+        is_debug = logger._logger.isEnabledFor
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            start = time.time()
+            start = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                duration = (time.time() - start) * 1000
-                if logger:
-                    logger.debug(
-                        f"{func.__name__} completed",
-                        extra={"duration_ms": round(duration, 2)}
-                    )
-                return result
             except Exception as e:
-                duration = (time.time() - start) * 1000
-                if logger:
-                    logger.error(
-                        f"{func.__name__} failed",
-                        extra={
-                            "duration_ms": round(duration, 2),
-                            "error": str(e)
-                        }
-                    )
+                logger.error(
+                    failed_msg,
+                    extra={
+                        "duration_ms": round((time.perf_counter_ns() - start) / 1e6, 2),
+                        "error": str(e)
+                    }
+                )
                 raise
+            # Level is checked per call so runtime level changes still apply
+            if is_debug(logging.DEBUG):
+                logger.debug(
+                    completed_msg,
+                    extra={"duration_ms": round((time.perf_counter_ns() - start) / 1e6, 2)}
+                )
+            return result
         return wrapper
     return decorator
 
@@ -160,30 +189,34 @@ def async_timed(logger: Logger = None):
     """
     Decorator to time async function execution
     """
+    if logger is None:
+        return lambda func: func
+    
     def decorator(func):
+        completed_msg = f"{func.__name__} completed"
+        failed_msg = f"{func.__name__} failed"
+        is_debug = logger._logger.isEnabledFor
+        
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            start = time.time()
+            start = time.perf_counter_ns()
             try:
                 result = await func(*args, **kwargs)
-                duration = (time.time() - start) * 1000
-                if logger:
-                    logger.debug(
-                        f"{func.__name__} completed",
-                        extra={"duration_ms": round(duration, 2)}
-                    )
-                return result
             except Exception as e:
-                duration = (time.time() - start) * 1000
-                if logger:
-                    logger.error(
-                        f"{func.__name__} failed",
-                        extra={
-                            "duration_ms": round(duration, 2),
-                            "error": str(e)
-                        }
-                    )
+                logger.error(
+                    failed_msg,
+                    extra={
+                        "duration_ms": round((time.perf_counter_ns() - start) / 1e6, 2),
+                        "error": str(e)
+                    }
+                )
                 raise
+            if is_debug(logging.DEBUG):
+                logger.debug(
+                    completed_msg,
+                    extra={"duration_ms": round((time.perf_counter_ns() - start) / 1e6, 2)}
+                )
+            return result
         return wrapper
     return decorator
 
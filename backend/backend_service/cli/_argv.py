@@ -0,0 +1,164 @@
+"""
+Minimal argv parser shared by the CLIs
+
+Commands are declared once as Command/Arg specs. The common case (a
+well-formed command line) is parsed by a small hand-written loop; help
+requests and anything the fast path does not understand fall back to an
+argparse parser built from the same specs, so usage and error messages
+are unchanged. argparse is only imported on that fallback path.
+"""
+import re
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+_NEGATIVE_NUMBER = re.compile(r'^-\d+$|^-\d*\.\d+$')
+
+
+class Arg:
+    """A positional argument or option of a command"""
+    
+    def __init__(
+        self,
+        *names: str,
+        help: str = None,
+        flag: bool = False,
+        nargs: str = None,
+        type: Callable[[str], Any] = str,
+        default: Any = None,
+        choices: Sequence[str] = None
+    ):
+        self.names = names
+        self.help = help
+        self.flag = flag
+        self.nargs = nargs
+        self.type = type
+        self.default = default
+        self.choices = choices
+        self.positional = not names[0].startswith('-')
+        long_names = [n for n in names if n.startswith('--')]
+        self.dest = (long_names[0][2:] if long_names else names[0].lstrip('-')).replace('-', '_')
+    
+    def argparse_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for ArgumentParser.add_argument"""
+        if self.flag:
+            return {"action": "store_true", "help": self.help}
+        
+        kwargs = {"help": self.help}
+        if self.nargs:
+            kwargs["nargs"] = self.nargs
+        if self.type is not str:
+            kwargs["type"] = self.type
+        if self.default is not None:
+            kwargs["default"] = self.default
+        if self.choices:
+            kwargs["choices"] = self.choices
+        return kwargs
+
+
+class Command:
+    """A subcommand and its arguments"""
+    
+    def __init__(self, name: str, help: str, args: List[Arg]):
+        self.name = name
+        self.help = help
+        self.args = args
+        self.positionals = [a for a in args if a.positional]
+        self.options = {name: a for a in args if not a.positional for name in a.names}
+
+
+def _is_option(token: str) -> bool:
+    return token.startswith('-') and len(token) > 1 and not _NEGATIVE_NUMBER.match(token)
+
+
+def _convert(arg: Arg, raw: str) -> Any:
+    value = arg.type(raw)
+    if arg.choices and value not in arg.choices:
+        raise ValueError(raw)
+    return value
+
+
+def fast_parse(
+    commands: Dict[str, Command],
+    dest: str,
+    argv: List[str]
+) -> Optional[SimpleNamespace]:
+    """Parse a well-formed command line, or return None to defer to argparse"""
+    if not argv or argv[0] not in commands:
+        return None
+    
+    command = commands[argv[0]]
+    values = {dest: command.name}
+    for arg in command.args:
+        values[arg.dest] = False if arg.flag else (
+            list(arg.default) if isinstance(arg.default, list) else arg.default
+        )
+    
+    positionals = iter(command.positionals)
+    tokens = argv[1:]
+    i = 0
+    try:
+        while i < len(tokens):
+            token = tokens[i]
+            i += 1
+            
+            if token in ('-h', '--help', '--'):
+                return None
+            
+            if not _is_option(token):
+                arg = next(positionals, None)
+                if arg is None:
+                    return None
+                values[arg.dest] = _convert(arg, token)
+                continue
+            
+            name, _, inline = token.partition('=')
+            arg = command.options.get(name)
+            if arg is None:
+                return None
+            
+            if arg.flag:
+                if inline:
+                    return None
+                values[arg.dest] = True
+            elif arg.nargs == '+':
+                items = [inline] if inline else []
+                while i < len(tokens) and not _is_option(tokens[i]):
+                    items.append(tokens[i])
+                    i += 1
+                if not items:
+                    return None
+                values[arg.dest] = [_convert(arg, item) for item in items]
+            else:
+                if not inline:
+                    if i >= len(tokens) or _is_option(tokens[i]):
+                        return None
+                    inline = tokens[i]
+                    i += 1
+                values[arg.dest] = _convert(arg, inline)
+    except (TypeError, ValueError):
+        return None
+    
+    if next(positionals, None) is not None:
+        return None
+    
+    return SimpleNamespace(**values)
+
+
+def build_argparse(
+    prog: str,
+    description: str,
+    dest: str,
+    dest_help: str,
+    commands: Dict[str, Command]
+):
+    """Build the equivalent argparse parser (help and error reporting)"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(prog=prog, description=description)
+    subparsers = parser.add_subparsers(dest=dest, help=dest_help)
+    for command in commands.values():
+        sub = subparsers.add_parser(command.name, help=command.help)
+        for arg in command.args:
+            sub.add_argument(*arg.names, **arg.argparse_kwargs())
+    return parser
@@ -1,97 +1,77 @@
 """
 CLI for batch analysis operations
 """
-import argparse
-import json
+import os
 import sys
-from datetime import datetime
-from typing import List, Optional
+from operator import itemgetter
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
 from pathlib import Path
 
+from ._argv import Arg, Command, build_argparse, fast_parse
+from ..utils import jsonio
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+# Concurrent file reads in 'analyze summary'
+SUMMARY_READ_THREADS = 16
+
+_get_counts = itemgetter('total_posts', 'high_risk_count', 'medium_risk_count', 'low_risk_count')
+_COUNT_KEYS = frozenset(('total_posts', 'high_risk_count', 'medium_risk_count', 'low_risk_count'))
+
+COMMANDS = {
+    command.name: command for command in (
+        Command("file", "Analyze a collected data file", [
+            Arg("input_file", help="Path to JSON file with collected data"),
+            Arg("-o", "--output", help="Output filename (without extension)"),
+            Arg("--use-llm", flag=True, help="Use LLM for enhanced analysis"),
+            Arg("--high-risk-only", flag=True, help="Only output high-risk posts"),
+            Arg("--dedup", flag=True, help="Skip near-duplicate posts (crossposts, forwards)"),
+        ]),
+        Command("text", "Analyze a single text", [
+            Arg("text", help="Text to analyze"),
+            Arg("--use-llm", flag=True, help="Use LLM for enhanced analysis"),
+            Arg("-v", "--verbose", flag=True, help="Show detailed output"),
+        ]),
+        Command("batch", "Analyze multiple files", [
+            Arg("directory", help="Directory containing JSON files"),
+            Arg("-o", "--output-dir", help="Output directory for results"),
+            Arg("--pattern", default="*_raw.json", help="File pattern to match"),
+            Arg("-j", "--jobs", type=int, help="Worker processes (default: CPU count)"),
+        ]),
+        Command("summary", "Generate summary from analyzed files", [
+            Arg("directory", help="Directory containing analyzed JSON files"),
+            Arg("-o", "--output", help="Output filename for summary"),
+        ]),
+    )
+}
+
 
 class AnalysisCLI:
     """
     Command-line interface for batch analysis
     """
     
-    def __init__(self):
-        self.parser = self._create_parser()
+    # Shared by all instances; built on first use
+    _parser = None
     
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create argument parser"""
-        parser = argparse.ArgumentParser(
-            prog="analyze",
-            description="Analyze collected data for weapons trade indicators"
-        )
-        
-        subparsers = parser.add_subparsers(dest="command", help="Analysis command")
-        
-        # Analyze file
-        file_parser = subparsers.add_parser("file", help="Analyze a collected data file")
-        file_parser.add_argument(
-            "input_file",
-            help="Path to JSON file with collected data"
-        )
-        file_parser.add_argument(
-            "-o", "--output",
-            help="Output filename (without extension)"
-        )
-        file_parser.add_argument(
-            "--use-llm",
-            action="store_true",
-            help="Use LLM for enhanced analysis"
-        )
-        file_parser.add_argument(
-            "--high-risk-only",
-            action="store_true",
-            help="Only output high-risk posts"
-        )
-        
-        # Analyze text
-        text_parser = subparsers.add_parser("text", help="Analyze a single text")
-        text_parser.add_argument(
-            "text",
-            help="Text to analyze"
-        )
-        text_parser.add_argument(
-            "--use-llm",
-            action="store_true",
-            help="Use LLM for enhanced analysis"
-        )
-        text_parser.add_argument(
-            "-v", "--verbose",
-            action="store_true",
-            help="Show detailed output"
-        )
-        
-        # Batch analyze
-        batch_parser = subparsers.add_parser("batch", help="Analyze multiple files")
-        batch_parser.add_argument(
-            "directory",
-            help="Directory containing JSON files"
-        )
-        batch_parser.add_argument(
-            "-o", "--output-dir",
-            help="Output directory for results"
-        )
-        batch_parser.add_argument(
-            "--pattern",
-            default="*_raw.json",
-            help="File pattern to match"
-        )
-        
-        # Summary
-        summary_parser = subparsers.add_parser("summary", help="Generate summary from analyzed files")
-        summary_parser.add_argument(
-            "directory",
-            help="Directory containing analyzed JSON files"
-        )
-        summary_parser.add_argument(
-            "-o", "--output",
-            help="Output filename for summary"
-        )
-        
-        return parser
+    @property
+    def parser(self):
+        """argparse parser, built only for help and error reporting"""
+        cls = type(self)
+        if cls._parser is None:
+            cls._parser = build_argparse(
+                "analyze",
+                "Analyze collected data for weapons trade indicators",
+                "command",
+                "Analysis command",
+                COMMANDS
+            )
+        return cls._parser
     
     def run(self, args: List[str] = None):
         """
@@ -100,7 +80,12 @@ class AnalysisCLI:
         Args:
             args: Command-line arguments (uses sys.argv if None)
         """
-        parsed = self.parser.parse_args(args)
+        if args is None:
+            args = sys.argv[1:]
+        
+        parsed = fast_parse(COMMANDS, "command", args)
+        if parsed is None:
+            parsed = self.parser.parse_args(args)
         
         if not parsed.command:
             self.parser.print_help()
@@ -115,11 +100,15 @@ class AnalysisCLI:
         elif parsed.command == "summary":
             self._generate_summary(parsed)
     
-    def _analyze_file(self, args):
-        """Analyze a single file"""
-        from ..handlers.analysis_handler import AnalysisHandler
+    def _analyze_file(self, args, handler=None):
+        """
+        Analyze a single file
+        
+        Args:
+            args: Parsed arguments
+            handler: Shared AnalysisHandler (created from args if None)
+        """
         from ..entities.post import RedditPost, TelegramMessage
-        from dataclasses import asdict
         
         input_path = Path(args.input_file)
         
@@ -128,8 +117,7 @@ class AnalysisCLI:
             sys.exit(1)
         
         print(f"Loading {input_path}...")
-        with open(input_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = jsonio.load_file(input_path)
         
         # Determine post type and extract posts
         posts_data = data.get('posts', data.get('messages', []))
@@ -137,49 +125,57 @@ class AnalysisCLI:
             print("Error: No posts found in file")
             sys.exit(1)
         
-        # Convert to post objects
-        posts = []
-        for p in posts_data:
-            if 'subreddit' in p:
-                # Reddit post
-                post = RedditPost(
-                    id=p.get('id', ''),
-                    title=p.get('title', ''),
-                    content=p.get('content', ''),
-                    subreddit=p.get('subreddit', ''),
-                    author_hash=p.get('author_hash', ''),
-                    score=p.get('score', 0),
-                    num_comments=p.get('num_comments', 0),
-                    created_at=p.get('created_at', p.get('created_utc', 0)),
-                    url=p.get('url', ''),
-                    collected_at=p.get('collected_at', ''),
-                    platform='reddit'
-                )
-            else:
-                # Telegram message
-                post = TelegramMessage(
-                    id=p.get('id', ''),
-                    content=p.get('content', ''),
-                    author_hash=p.get('author_hash', ''),
-                    chat_id=p.get('chat_id', 0),
-                    chat_title=p.get('chat_title', ''),
-                    chat_type=p.get('chat_type', ''),
-                    created_at=p.get('created_at', 0),
-                    url=p.get('url', ''),
-                    collected_at=p.get('collected_at', ''),
-                    platform='telegram'
-                )
-            posts.append(post)
+        # Initialize handler
+        if handler is None:
+            from ..handlers.analysis_handler import AnalysisHandler
+            handler = AnalysisHandler(use_llm=args.use_llm)
+        
+        if args.high_risk_only:
+            # Drop posts no rule can flag before building post objects
+            sniff = handler.detector.analyzer.may_be_high_risk
+            posts_data = [
+                p for p in posts_data
+                if sniff(f"{p.get('title', '')}. {p.get('content', '')}")
+            ]
+            if not posts_data:
+                print("No high-risk candidates found")
+                return
+        
+        if args.dedup:
+            # Keep the first post of each group of SimHash near-duplicates
+            from ..utils.hashing import SimHashIndex, simhash64
+            
+            index = SimHashIndex()
+            unique = [
+                p for p in posts_data
+                if index.add(simhash64(f"{p.get('title', '')} {p.get('content', '')}"))
+            ]
+            dropped = len(posts_data) - len(unique)
+            posts_data = unique
+            if dropped:
+                print(f"Skipped {dropped} near-duplicate posts")
+        
+        # Platform is decided per record: a file may mix Reddit and Telegram
+        posts = [
+            RedditPost.from_dict(p) if 'subreddit' in p else TelegramMessage.from_dict(p)
+            for p in posts_data
+        ]
+        # The posts hold everything needed from here on; drop the parsed
+        # document so its dict tree is freed before analysis and saving
+        del data, posts_data
         
         print(f"Loaded {len(posts)} posts")
         
-        # Initialize handler
-        handler = AnalysisHandler(use_llm=args.use_llm)
-        
         # Analyze
         print("Analyzing posts...")
         analyzed = handler.analyze_posts_batch(posts)
         
+        if args.high_risk_only:
+            analyzed = [
+                p for p in analyzed
+                if p.risk_analysis and p.risk_analysis.get('risk_score', 0) >= 0.7
+            ]
+        
         # Generate output filename
         if args.output:
             output_name = args.output
@@ -239,9 +235,6 @@ class AnalysisCLI:
     
     def _analyze_batch(self, args):
         """Analyze multiple files"""
-        from ..handlers.analysis_handler import AnalysisHandler
-        from glob import glob
-        
         input_dir = Path(args.directory)
         
         if not input_dir.exists():
@@ -249,8 +242,7 @@ class AnalysisCLI:
             sys.exit(1)
         
         # Find files
-        pattern = str(input_dir / args.pattern)
-        files = glob(pattern)
+        files = _match_files(input_dir, args.pattern)
         
         if not files:
             print(f"No files matching pattern: {args.pattern}")
@@ -258,50 +250,55 @@ class AnalysisCLI:
         
         print(f"Found {len(files)} files to analyze")
         
-        for filepath in files:
-            print(f"\nProcessing: {filepath}")
-            # Use file analysis for each
-            fake_args = argparse.Namespace(
-                input_file=filepath,
-                output=None,
-                use_llm=False,
-                high_risk_only=False
-            )
-            self._analyze_file(fake_args)
+        jobs = min(args.jobs or os.cpu_count() or 1, len(files))
+        if jobs <= 1:
+            # One handler (and detector) for every file in the batch
+            _init_worker()
+            for filepath, output in map(_analyze_one_file, files):
+                print(f"\nProcessing: {filepath}")
+                print(output, end="")
+            return
+        
+        # Files are independent and analysis is CPU-bound: fan out to
+        # worker processes; output is printed in input order
+        from concurrent.futures import ProcessPoolExecutor
+        
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+            for filepath, output in executor.map(_analyze_one_file, files):
+                print(f"\nProcessing: {filepath}")
+                print(output, end="")
     
     def _generate_summary(self, args):
         """Generate summary from analyzed files"""
-        from glob import glob
-        
+        from datetime import datetime
         input_dir = Path(args.directory)
         
         if not input_dir.exists():
             print(f"Error: Directory not found: {input_dir}")
             sys.exit(1)
         
-        # Find analyzed files
-        files = glob(str(input_dir / "*_analyzed.json"))
+        # Find analyzed files; inode order keeps reads close to on-disk layout
+        with os.scandir(input_dir) as entries:
+            files = [
+                entry.path for entry in sorted(
+                    (e for e in entries
+                     if e.name.endswith("_analyzed.json") and not e.name.startswith('.')),
+                    key=lambda e: e.inode()
+                )
+            ]
         
         if not files:
             print("No analyzed files found")
             return
         
-        total_posts = 0
-        total_high = 0
-        total_medium = 0
-        total_low = 0
-        all_keywords = []
+        # Reads overlap in threads (file I/O releases the GIL)
+        from concurrent.futures import ThreadPoolExecutor
         
-        for filepath in files:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            if 'analysis_info' in data:
-                info = data['analysis_info']
-                total_posts += info.get('total_posts', 0)
-                total_high += info.get('high_risk_count', len(data.get('high_risk_posts', [])))
-                total_medium += info.get('medium_risk_count', len(data.get('medium_risk_posts', [])))
-                total_low += info.get('low_risk_count', len(data.get('low_risk_posts', [])))
+        with ThreadPoolExecutor(max_workers=min(SUMMARY_READ_THREADS, len(files))) as executor:
+            counts = [c for c in executor.map(self._read_counts, files) if c is not None]
+        total_posts, total_high, total_medium, total_low = (
+            map(sum, zip(*counts)) if counts else (0, 0, 0, 0)
+        )
         
         summary = {
             "summary_timestamp": datetime.now().isoformat(),
@@ -323,9 +320,98 @@ class AnalysisCLI:
         # Save if output specified
         if args.output:
             output_path = Path(args.output)
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2)
+            jsonio.dump_file(summary, output_path)
             print(f"\nSaved to: {output_path}")
+    
+    def _read_counts(self, filepath: str) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Read (total, high, medium, low) post counts of an analyzed file
+        
+        Returns None when the file has no analysis_info block.
+        """
+        if ijson is not None:
+            # Stream just the header object instead of parsing every post
+            with open(filepath, 'rb') as f:
+                info = next(ijson.items(f, 'analysis_info'), None)
+            if info is None:
+                return None
+            if _COUNT_KEYS.issubset(info):
+                return _get_counts(info)
+        
+        data = jsonio.load_file(filepath)
+        info = data.get('analysis_info')
+        if info is None:
+            return None
+        if _COUNT_KEYS.issubset(info):
+            return _get_counts(info)
+        
+        return (
+            info.get('total_posts', 0),
+            info.get('high_risk_count', len(data.get('high_risk_posts', []))),
+            info.get('medium_risk_count', len(data.get('medium_risk_posts', []))),
+            info.get('low_risk_count', len(data.get('low_risk_posts', [])))
+        )
+
+
+def _match_files(directory: Path, pattern: str) -> List[str]:
+    """
+    Files in directory whose names match a glob pattern
+    
+    Scans the directory once with os.scandir and a precompiled pattern;
+    patterns spanning subdirectories are left to glob.
+    """
+    if os.sep in pattern or (os.altsep and os.altsep in pattern):
+        from glob import glob
+        return glob(str(directory / pattern))
+    
+    import fnmatch
+    import re
+    
+    match = re.compile(fnmatch.translate(pattern)).match
+    # Like glob, '*' does not match hidden files
+    show_hidden = pattern.startswith('.')
+    with os.scandir(directory) as entries:
+        return [
+            entry.path for entry in entries
+            if match(entry.name) and (show_hidden or not entry.name.startswith('.'))
+        ]
+
+
+# Per-process handler used by _analyze_batch workers
+_worker_handler = None
+
+
+def _init_worker():
+    """Create this process's AnalysisHandler once"""
+    global _worker_handler
+    from ..handlers.analysis_handler import AnalysisHandler
+    _worker_handler = AnalysisHandler(use_llm=False)
+
+
+def _file_args(filepath: str) -> SimpleNamespace:
+    """Arguments for analyzing one file of a batch"""
+    return SimpleNamespace(
+        input_file=filepath,
+        output=None,
+        use_llm=False,
+        high_risk_only=False,
+        dedup=False
+    )
+
+
+def _analyze_one_file(filepath: str):
+    """Analyze one file of a batch, returning its captured output"""
+    import io
+    from contextlib import redirect_stdout
+    
+    buffer = io.StringIO()
+    with redirect_stdout(buffer):
+        try:
+            AnalysisCLI()._analyze_file(_file_args(filepath), handler=_worker_handler)
+        except SystemExit:
+            # _analyze_file reports its own errors before exiting
+            pass
+    return filepath, buffer.getvalue()
 
 
 def main():
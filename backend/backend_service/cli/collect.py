@@ -1,120 +1,70 @@
 """
 CLI for data collection operations
 """
-import argparse
 import asyncio
 import sys
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import List, Optional
 
+from ._argv import Arg, Command, build_argparse, fast_parse
+
+
+# Local-time stamp used in default output filenames
+_FILENAME_TIME_FORMAT = '%Y%m%d_%H%M%S'
+
+# Subreddits fetched concurrently; requests still share the handler's rate limiter
+REDDIT_COLLECT_WORKERS = 4
+
+COMMANDS = {
+    command.name: command for command in (
+        Command("reddit", "Collect from Reddit", [
+            Arg("-s", "--subreddits", nargs="+", default=["news"], help="Subreddits to collect from"),
+            Arg("-t", "--time-filter", choices=["hour", "day", "week", "month", "year", "all"],
+                default="day", help="Time filter for posts"),
+            Arg("-m", "--sort-method", choices=["hot", "new", "top", "rising"],
+                default="hot", help="Sort method for posts"),
+            Arg("-l", "--limit", type=int, default=25, help="Number of posts per subreddit"),
+            Arg("-k", "--keywords", nargs="+", default=[], help="Keywords to search for"),
+            Arg("--all-defaults", flag=True, help="Use default subreddit list"),
+            Arg("--analyze", flag=True, help="Analyze collected posts"),
+            Arg("-o", "--output", help="Output filename (without extension)"),
+        ]),
+        Command("telegram", "Collect from Telegram", [
+            Arg("-c", "--channels", nargs="+", default=[], help="Channel usernames to collect from"),
+            Arg("-g", "--groups", nargs="+", type=int, default=[], help="Group IDs to collect from"),
+            Arg("-k", "--keywords", nargs="+", default=[], help="Keywords to search for"),
+            Arg("-l", "--limit", type=int, default=50, help="Number of messages per source"),
+            Arg("--search-global", flag=True, help="Search across all accessible chats"),
+            Arg("--analyze", flag=True, help="Analyze collected messages"),
+            Arg("-o", "--output", help="Output filename (without extension)"),
+        ]),
+    )
+}
+
 
 class CollectionCLI:
     """
     Command-line interface for data collection
     """
     
-    def __init__(self):
-        self.parser = self._create_parser()
+    # Shared by all instances; built on first use
+    _parser = None
     
-    def _create_parser(self) -> argparse.ArgumentParser:
-        """Create argument parser"""
-        parser = argparse.ArgumentParser(
-            prog="collect",
-            description="Collect data from Reddit or Telegram for analysis"
-        )
-        
-        subparsers = parser.add_subparsers(dest="platform", help="Platform to collect from")
-        
-        # Reddit subcommand
-        reddit_parser = subparsers.add_parser("reddit", help="Collect from Reddit")
-        reddit_parser.add_argument(
-            "-s", "--subreddits",
-            nargs="+",
-            default=["news"],
-            help="Subreddits to collect from"
-        )
-        reddit_parser.add_argument(
-            "-t", "--time-filter",
-            choices=["hour", "day", "week", "month", "year", "all"],
-            default="day",
-            help="Time filter for posts"
-        )
-        reddit_parser.add_argument(
-            "-m", "--sort-method",
-            choices=["hot", "new", "top", "rising"],
-            default="hot",
-            help="Sort method for posts"
-        )
-        reddit_parser.add_argument(
-            "-l", "--limit",
-            type=int,
-            default=25,
-            help="Number of posts per subreddit"
-        )
-        reddit_parser.add_argument(
-            "-k", "--keywords",
-            nargs="+",
-            default=[],
-            help="Keywords to search for"
-        )
-        reddit_parser.add_argument(
-            "--all-defaults",
-            action="store_true",
-            help="Use default subreddit list"
-        )
-        reddit_parser.add_argument(
-            "--analyze",
-            action="store_true",
-            help="Analyze collected posts"
-        )
-        reddit_parser.add_argument(
-            "-o", "--output",
-            help="Output filename (without extension)"
-        )
-        
-        # Telegram subcommand
-        telegram_parser = subparsers.add_parser("telegram", help="Collect from Telegram")
-        telegram_parser.add_argument(
-            "-c", "--channels",
-            nargs="+",
-            default=[],
-            help="Channel usernames to collect from"
-        )
-        telegram_parser.add_argument(
-            "-g", "--groups",
-            nargs="+",
-            type=int,
-            default=[],
-            help="Group IDs to collect from"
-        )
-        telegram_parser.add_argument(
-            "-k", "--keywords",
-            nargs="+",
-            default=[],
-            help="Keywords to search for"
-        )
-        telegram_parser.add_argument(
-            "-l", "--limit",
-            type=int,
-            default=50,
-            help="Number of messages per source"
-        )
-        telegram_parser.add_argument(
-            "--search-global",
-            action="store_true",
-            help="Search across all accessible chats"
-        )
-        telegram_parser.add_argument(
-            "--analyze",
-            action="store_true",
-            help="Analyze collected messages"
-        )
-        telegram_parser.add_argument(
-            "-o", "--output",
-            help="Output filename (without extension)"
-        )
-        
-        return parser
+    @property
+    def parser(self):
+        """argparse parser, built only for help and error reporting"""
+        cls = type(self)
+        if cls._parser is None:
+            cls._parser = build_argparse(
+                "collect",
+                "Collect data from Reddit or Telegram for analysis",
+                "platform",
+                "Platform to collect from",
+                COMMANDS
+            )
+        return cls._parser
     
     def run(self, args: List[str] = None):
         """
@@ -123,25 +73,30 @@ class CollectionCLI:
         Args:
             args: Command-line arguments (uses sys.argv if None)
         """
-        parsed = self.parser.parse_args(args)
+        if args is None:
+            args = sys.argv[1:]
+        
+        parsed = fast_parse(COMMANDS, "platform", args)
+        if parsed is None:
+            parsed = self.parser.parse_args(args)
         
         if not parsed.platform:
             self.parser.print_help()
             return
         
         if parsed.platform == "reddit":
-            self._collect_reddit(parsed)
+            asyncio.run(self._collect_reddit(parsed))
         elif parsed.platform == "telegram":
             asyncio.run(self._collect_telegram(parsed))
     
-    def _collect_reddit(self, args):
+    async def _collect_reddit(self, args):
         """Collect from Reddit"""
         from ..config import config
         from ..handlers.reddit_handler import RedditHandler
         
         if not config.reddit_configured:
             print("Error: Reddit API not configured")
-            print(f"Missing: {', '.join(config.get_missing_reddit_config())}")
+            print(f"Missing: {', '.join(config.missing_reddit_config)}")
             sys.exit(1)
         
         print("Initializing Reddit collector...")
@@ -164,17 +119,28 @@ class CollectionCLI:
         
         print(f"Collecting from {len(subreddits)} subreddits...")
         
-        all_posts = []
-        for subreddit in subreddits:
+        # PRAW is blocking: overlap the per-subreddit round-trips in a
+        # small thread pool. gather() keeps results in subreddit order.
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=REDDIT_COLLECT_WORKERS) as executor:
             if args.keywords:
-                posts = handler.search_posts_by_keywords(
-                    subreddit, args.keywords, args.time_filter, args.limit
-                )
+                calls = [
+                    lambda s=subreddit: handler.search_posts_by_keywords(
+                        s, args.keywords, args.time_filter, args.limit
+                    )
+                    for subreddit in subreddits
+                ]
             else:
-                posts = handler.collect_subreddit_posts(
-                    subreddit, args.time_filter, args.limit, args.sort_method
-                )
-            all_posts.extend(posts)
+                calls = [
+                    lambda s=subreddit: handler.collect_subreddit_posts(
+                        s, args.time_filter, args.limit, args.sort_method
+                    )
+                    for subreddit in subreddits
+                ]
+            results = await asyncio.gather(
+                *(loop.run_in_executor(executor, call) for call in calls)
+            )
+        all_posts = list(chain.from_iterable(results))
         
         print(f"Total collected: {len(all_posts)} posts")
         
@@ -187,7 +153,7 @@ class CollectionCLI:
         if args.output:
             filename = args.output
         else:
-            filename = f"reddit_{args.time_filter}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            filename = f"reddit_{args.time_filter}_{time.strftime(_FILENAME_TIME_FORMAT)}"
         
         # Save
         files = handler.save_posts(all_posts, f"{filename}_raw")
@@ -206,7 +172,7 @@ class CollectionCLI:
         
         if not config.telegram_configured:
             print("Error: Telegram API not configured")
-            print(f"Missing: {', '.join(config.get_missing_telegram_config())}")
+            print(f"Missing: {', '.join(config.missing_telegram_config)}")
             sys.exit(1)
         
         print("Initializing Telegram collector...")
@@ -254,7 +220,7 @@ class CollectionCLI:
         if args.output:
             filename = args.output
         else:
-            filename = f"telegram_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+            filename = f"telegram_{time.strftime(_FILENAME_TIME_FORMAT)}"
         
         # Save
         files = handler.save_messages(all_messages, filename)
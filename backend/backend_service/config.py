@@ -2,7 +2,8 @@
 Configuration management for the backend service
 """
 import os
-from typing import Optional, List
+from functools import cached_property
+from typing import Optional, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -52,7 +53,10 @@ class Config:
             except ValueError:
                 self.TELEGRAM_API_ID = None
     
-    @property
+    # Derived settings are computed once: the environment is fixed by the
+    # time the global config is created
+    
+    @cached_property
     def reddit_configured(self) -> bool:
         """Check if Reddit API is properly configured"""
         return all([
@@ -61,7 +65,7 @@ class Config:
             self.REDDIT_USER_AGENT
         ])
     
-    @property
+    @cached_property
     def telegram_configured(self) -> bool:
         """Check if Telegram API is properly configured (either user API or bot API)"""
         # Bot API (simpler, just needs token)
@@ -73,30 +77,33 @@ class Config:
             self.TELEGRAM_API_HASH
         ])
     
-    @property
+    @cached_property
     def llm_configured(self) -> bool:
         """Check if LLM is configured"""
         return self.LLM_PROVIDER == 'ollama' and bool(self.OLLAMA_BASE)
     
-    def get_missing_reddit_config(self) -> List[str]:
-        """Get list of missing Reddit configuration items"""
-        missing = []
-        if not self.REDDIT_CLIENT_ID:
-            missing.append('REDDIT_CLIENT_ID')
-        if not self.REDDIT_CLIENT_SECRET:
-            missing.append('REDDIT_CLIENT_SECRET')
-        if not self.REDDIT_USER_AGENT:
-            missing.append('REDDIT_USER_AGENT')
-        return missing
+    @cached_property
+    def missing_reddit_config(self) -> Tuple[str, ...]:
+        """Missing Reddit configuration items"""
+        return tuple(
+            name for name, value in (
+                ('REDDIT_CLIENT_ID', self.REDDIT_CLIENT_ID),
+                ('REDDIT_CLIENT_SECRET', self.REDDIT_CLIENT_SECRET),
+                ('REDDIT_USER_AGENT', self.REDDIT_USER_AGENT),
+            )
+            if not value
+        )
     
-    def get_missing_telegram_config(self) -> List[str]:
-        """Get list of missing Telegram configuration items"""
-        missing = []
-        if not self.TELEGRAM_API_ID:
-            missing.append('TELEGRAM_API_ID')
-        if not self.TELEGRAM_API_HASH:
-            missing.append('TELEGRAM_API_HASH')
-        return missing
+    @cached_property
+    def missing_telegram_config(self) -> Tuple[str, ...]:
+        """Missing Telegram configuration items"""
+        return tuple(
+            name for name, value in (
+                ('TELEGRAM_API_ID', self.TELEGRAM_API_ID),
+                ('TELEGRAM_API_HASH', self.TELEGRAM_API_HASH),
+            )
+            if not value
+        )
 
 
 # Global config instance
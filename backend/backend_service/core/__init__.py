@@ -1,6 +1,7 @@
 """
 Core Module - Core business logic for weapons detection
 """
+import os
 
 from .detector import WeaponsDetector
 from .analyzer import TextAnalyzer
@@ -8,3 +9,7 @@ from .scorer import RiskScorer
 
 __all__ = ["WeaponsDetector", "TextAnalyzer", "RiskScorer"]
 
+# Opt-in: pay rule/pattern setup once at import (e.g. for long-running servers)
+if os.getenv("WEAPONS_DETECTION_PREWARM") == "1":
+    from .detector import _warmup
+    _warmup()
@@ -2,13 +2,135 @@
 Text Analyzer - Rule-based weapons detection
 Refactored from the original text_analyzer.py
 """
+import os
 import re
+import sys
 from datetime import datetime
-from typing import List, Dict, Any
+from functools import lru_cache
+from itertools import repeat
+from typing import List, Dict, Any, Iterable, Optional, Set
 import string
 
 from ..entities.analysis import AnalysisResult
 
+# The stdlib regex parser, used only to read literals out of the rule
+# patterns (sre_parse before Python 3.11)
+try:
+    from re import _parser as _sre_parser, _constants as _sre_constants
+except ImportError:
+    import sre_parse as _sre_parser, sre_constants as _sre_constants
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# google-re2 compiles the rule patterns to linear-time automata; its API
+# mirrors re, so the stdlib engine is the drop-in fallback
+try:
+    import re2 as pattern_engine
+except ImportError:
+    pattern_engine = re
+
+# clean_text() punctuation filter, built once rather than per call
+_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation.replace(' ', ''))
+
+# Every rule term contains an ASCII letter or digit
+_TERM_CHAR_RE = re.compile(r'[a-z0-9]')
+
+
+def _longest_literal(items) -> str:
+    """Longest run of consecutive literal characters in a parsed regex sequence"""
+    longest = run = ""
+    for op, av in items:
+        if op is _sre_constants.LITERAL:
+            run += chr(av)
+            if len(run) > len(longest):
+                longest = run
+        else:
+            run = ""
+    return longest
+
+
+def _literal_anchors(pattern: str) -> List[str]:
+    """
+    Literals of which every match of pattern contains at least one
+    
+    Read from the pattern's last top-level alternation whose alternatives
+    all hold a literal (the longest literal run of each alternative), or
+    else from the pattern's own longest literal run.
+    
+    Raises:
+        ValueError: if the pattern has no such literal
+    """
+    items = list(_sre_parser.parse(pattern).data)
+    for op, av in reversed(items):
+        if op is _sre_constants.SUBPATTERN and len(av[-1].data) == 1:
+            op, av = av[-1].data[0]
+        if op is _sre_constants.BRANCH:
+            runs = [_longest_literal(alternative) for alternative in av[1]]
+            if all(runs):
+                return runs
+    
+    run = _longest_literal(items)
+    if not run:
+        raise ValueError(f"No literal every match of {pattern!r} must contain")
+    return [run]
+
+
+@lru_cache(maxsize=None)
+def _compile(source, engine=pattern_engine):
+    """
+    Compile a rule pattern once per process
+    
+    Handlers each build their own TextAnalyzer (the collection routes one
+    per request); they share the compiled patterns instead of recompiling
+    them, which re2 would otherwise do on every construction.
+    """
+    return engine.compile(source)
+
+
+class _SubstringMatcher:
+    """
+    Finds which of a fixed set of terms occur in a text
+    
+    Matches plain substrings, exactly like `term in text`; callers that
+    need word boundaries filter the result. With pyahocorasick
+    installed one Aho-Corasick pass over the text reports every term;
+    otherwise each distinct term is tested once with str.__contains__, which
+    beats any pure-Python single-pass scan.
+    """
+    
+    def __init__(self, terms: Iterable[str]):
+        self._terms = tuple(dict.fromkeys(terms))
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for term in self._terms:
+                self._automaton.add_word(term, term)
+            self._automaton.make_automaton()
+        else:
+            self._automaton = None
+    
+    def find(self, text: str) -> Set[str]:
+        """Return the set of terms that occur in text"""
+        if self._automaton is not None:
+            return {term for _, term in self._automaton.iter(text)}
+        return {term for term in self._terms if term in text}
+
+
+def _at_word_start(text: str, term: str) -> bool:
+    """True if term occurs in text at the start of a word (so 'ice' is not found in 'nice')"""
+    i = text.find(term)
+    while i > 0 and text[i - 1].isalnum():
+        i = text.find(term, i + 1)
+    return i != -1
+
+
+@lru_cache(maxsize=None)
+def _substring_matcher(terms: tuple) -> _SubstringMatcher:
+    """Shared matcher for a term tuple, so the automaton is built once per process"""
+    return _SubstringMatcher(terms)
+
 
 class TextAnalyzer:
     """
@@ -77,45 +199,183 @@ class TextAnalyzer:
             r'\b(?:self\s+defense|protection|security)\s+(?:weapon|gun|firearm)\b',
             r'\b(?:hunting|sport|target\s+practice)\s+(?:rifle|gun|firearm)\b'
         ]
+        
+        # Compiled once; clean_text() lowercases, so no IGNORECASE needed.
+        # Each set holds a single-scan gate (most posts match no pattern,
+        # so one search over the fused alternation replaces the per-pattern
+        # findall passes) plus the individual high and medium patterns.
+        # ASCII texts are matched as bytes, where \b and \s need no Unicode
+        # lookups; for ASCII input both forms match identically.
+        self._text_patterns = self._compile_patterns(str)
+        self._ascii_patterns = self._compile_patterns(str.encode)
+        
+        # Direct weapon references that force a HIGH score on their own
+        self.weapon_mentions = [
+            'gun', 'pistol', 'rifle', 'glock', 'firearm', 'weapon', 'ak47', 'ar15',
+            'm16', 'm4', 'uzi', 'mp5', 'beretta', 'colt', 'smith', 'wesson', 'sig',
+            'remington', 'winchester', 'mossberg', 'ruger', 'scar', 'fal', 'aug', 'tavor'
+        ]
+        
+        # Transaction words that combine with weapon keywords
+        self.intent_words = ['buy', 'sell', 'trade', 'purchase', 'want', 'need', 'get']
+        
+        # Category keywords flattened into parallel tuples, in category then
+        # list order; each keyword maps to its positions (a few keywords
+        # appear in more than one category)
+        self._all_keywords = tuple(
+            kw for keywords in self.high_risk_keywords.values() for kw in keywords
+        )
+        self._kw_category = tuple(
+            category for category, keywords in self.high_risk_keywords.items() for _ in keywords
+        )
+        self._kw_positions: Dict[str, List[int]] = {}
+        for i, kw in enumerate(self._all_keywords):
+            self._kw_positions.setdefault(kw, []).append(i)
+        # Keyword flags depend only on the position, so they are built once;
+        # interned so every analyzer instance hands out the same objects
+        self._kw_flags = tuple(
+            sys.intern(f"HIGH RISK: Detected {category} keyword '{kw}'")
+            for category, kw in zip(self._kw_category, self._all_keywords)
+        )
+        
+        # Literals the rule patterns are built around, derived from the
+        # patterns themselves: every match contains one of them, so a text
+        # containing none of them cannot reach the pattern gate
+        self.pattern_anchors = list(dict.fromkeys(
+            anchor
+            for pattern in self.high_risk_patterns + self.medium_risk_patterns
+            for anchor in _literal_anchors(pattern)
+        ))
+        
+        # Keyword, mention, intent and pattern-anchor lookups all share one
+        # match set per text
+        terms = (
+            self._all_keywords + tuple(self.weapon_mentions) + tuple(self.intent_words)
+            + tuple(self.pattern_anchors)
+        )
+        self._keyword_matcher = _substring_matcher(terms)
+        # Cleaned texts shorter than this cannot contain any term
+        self.min_keyword_len = min(map(len, terms))
+        self._weapon_mentions = frozenset(self.weapon_mentions)
+        self._intent_set = frozenset(self.intent_words)
+        self._pattern_anchors = frozenset(self.pattern_anchors)
+        
+        # Every rule that can lift a score above zero needs one of these
+        # terms at the start of a word in the cleaned text (the
+        # weapon_mentions list adds 'weapon')
+        seeds = {kw for keywords in self.high_risk_keywords.values() for kw in keywords}
+        seeds.add('weapon')
+        self._seed_regex = _compile(
+            r'(?<!\w)(?:' + '|'.join(map(re.escape, sorted(seeds, key=len, reverse=True))) + ')', re
+        )
+    
+    def _compile_patterns(self, convert) -> tuple:
+        """(gate, high-risk patterns, medium-risk patterns) compiled from convert(pattern)"""
+        gate = '|'.join(f'(?:{p})' for p in self.high_risk_patterns + self.medium_risk_patterns)
+        return (
+            _compile(convert(gate)),
+            [_compile(convert(p)) for p in self.high_risk_patterns],
+            [_compile(convert(p)) for p in self.medium_risk_patterns]
+        )
+    
+    def _find_patterns(self, cleaned_text: str) -> tuple:
+        """findall() results of each high-risk and medium-risk pattern"""
+        if cleaned_text.isascii():
+            subject = cleaned_text.encode('ascii')
+            gate, high_res, medium_res = self._ascii_patterns
+        else:
+            subject = cleaned_text
+            gate, high_res, medium_res = self._text_patterns
+        
+        if gate.search(subject) is None:
+            return (), ()
+        
+        # Patterns can overlap, so matches are still collected per pattern
+        high = [pattern.findall(subject) for pattern in high_res]
+        medium = [pattern.findall(subject) for pattern in medium_res]
+        if subject is not cleaned_text:
+            high = [[m.decode('ascii') for m in matches] for matches in high]
+            medium = [[m.decode('ascii') for m in matches] for matches in medium]
+        return high, medium
+    
+    def may_be_high_risk(self, text: str) -> bool:
+        """
+        Cheap pre-filter: False means analyze_text would score the text 0
+        
+        It is also exact for the HIGH threshold: any keyword hit, or a bare
+        'weapon' mention, lifts the score to at least 0.7, so True means
+        analyze_text would return risk_score >= 0.7.
+        
+        Args:
+            text: Raw text (cleaned the same way analyze_text cleans it)
+        """
+        return self._seed_regex.search(self.clean_text(text)) is not None
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text for analysis"""
-        text = re.sub(r'\s+', ' ', text.lower().strip())
-        text = text.translate(str.maketrans('', '', string.punctuation.replace(' ', '')))
-        return text
+        # split() drops leading/trailing whitespace and collapses runs,
+        # the same whitespace set as \s+ without a regex pass
+        return ' '.join(text.lower().split()).translate(_PUNCTUATION_TABLE)
     
-    def analyze_text(self, text: str) -> AnalysisResult:
+    def analyze_text(self, text: str, analysis_time: Optional[str] = None) -> AnalysisResult:
         """
         Analyze text with aggressive weapons detection
         
         Args:
             text: Text to analyze
+            analysis_time: ISO timestamp to record (default: now)
             
         Returns:
             AnalysisResult with risk score and detected indicators
         """
         cleaned_text = self.clean_text(text)
         
+        # Short replies, emoji-only and non-Latin texts match no rule term,
+        # so they score 0 without the keyword and pattern sweeps
+        if len(cleaned_text) < self.min_keyword_len or _TERM_CHAR_RE.search(cleaned_text) is None:
+            return AnalysisResult(
+                risk_score=0.0,
+                confidence=0.9,
+                flags=[],
+                detected_keywords=[],
+                detected_patterns=[],
+                analysis_time=analysis_time or datetime.now().isoformat(),
+                source="rules"
+            )
+        
         risk_score = 0.0
         flags = []
         detected_keywords = []
         detected_patterns = []
         
-        # Check for high-risk keywords
-        for category, keywords in self.high_risk_keywords.items():
-            found_keywords = []
-            for keyword in keywords:
-                if keyword in cleaned_text:
-                    found_keywords.append(keyword)
-                    risk_score += 0.4
-                    flags.append(f"HIGH RISK: Detected {category} keyword '{keyword}'")
-            
-            if found_keywords:
-                detected_keywords.append(f"{category}: {', '.join(found_keywords)}")
+        # Every term present in the text, looked up once. Keywords, mentions
+        # and intent words count only at the start of a word; the pattern
+        # anchors gate the regexes, which apply their own boundaries
+        found = self._keyword_matcher.find(cleaned_text)
+        words = {term for term in found if _at_word_start(cleaned_text, term)}
+        
+        # Check for high-risk keywords, visiting only the matched positions
+        # (sorted, so flags keep category then keyword-list order)
+        positions = self._kw_positions
+        hits = sorted(i for kw in words if kw in positions for i in positions[kw])
+        found_by_category: Dict[str, List[str]] = {}
+        for i in hits:
+            category, keyword = self._kw_category[i], self._all_keywords[i]
+            found_by_category.setdefault(category, []).append(keyword)
+            risk_score += 0.4
+            flags.append(self._kw_flags[i])
+        
+        for category, found_keywords in found_by_category.items():
+            detected_keywords.append(f"{category}: {', '.join(found_keywords)}")
+        found_categories = found_by_category.keys()
+        
+        if found.isdisjoint(self._pattern_anchors):
+            high_matches, medium_matches = (), ()
+        else:
+            high_matches, medium_matches = self._find_patterns(cleaned_text)
         
         # Check for high-risk patterns
-        for pattern in self.high_risk_patterns:
-            matches = re.findall(pattern, cleaned_text, re.IGNORECASE)
+        for matches in high_matches:
             if matches:
                 for match in matches:
                     detected_patterns.append(match)
@@ -123,8 +383,7 @@ class TextAnalyzer:
                     flags.append(f"HIGH RISK: Suspicious intent pattern detected: '{match}'")
         
         # Check for medium-risk patterns
-        for pattern in self.medium_risk_patterns:
-            matches = re.findall(pattern, cleaned_text, re.IGNORECASE)
+        for matches in medium_matches:
             if matches:
                 for match in matches:
                     detected_patterns.append(match)
@@ -132,20 +391,9 @@ class TextAnalyzer:
                     flags.append(f"MEDIUM RISK: Pattern detected: '{match}'")
         
         # Special combinations that boost risk
-        has_weapon_keyword = any(
-            category in ['firearms', 'explosives'] 
-            for category in self.high_risk_keywords.keys() 
-            if any(kw in cleaned_text for kw in self.high_risk_keywords[category])
-        )
-        
-        has_buy_sell_intent = any(
-            word in cleaned_text 
-            for word in ['buy', 'sell', 'trade', 'purchase', 'want', 'need', 'get']
-        )
-        has_violence_keyword = any(
-            kw in cleaned_text 
-            for kw in self.high_risk_keywords['violence']
-        )
+        has_weapon_keyword = not found_categories.isdisjoint(('firearms', 'explosives'))
+        has_buy_sell_intent = not words.isdisjoint(self._intent_set)
+        has_violence_keyword = 'violence' in found_categories
         
         # Boost score for dangerous combinations
         if has_weapon_keyword and has_buy_sell_intent:
@@ -164,14 +412,12 @@ class TextAnalyzer:
             risk_score = max(risk_score, 0.7)
         
         # Override: Any mention of specific weapons should be HIGH risk
-        weapon_mentions = [
-            'gun', 'pistol', 'rifle', 'glock', 'firearm', 'weapon', 'ak47', 'ar15',
-            'm16', 'm4', 'uzi', 'mp5', 'beretta', 'colt', 'smith', 'wesson', 'sig',
-            'remington', 'winchester', 'mossberg', 'ruger', 'scar', 'fal', 'aug', 'tavor'
-        ]
-        if any(weapon in cleaned_text for weapon in weapon_mentions):
+        if not words.isdisjoint(self._weapon_mentions):
             risk_score = max(risk_score, 0.8)
-            if not any("HIGH RISK" in flag for flag in flags):
+            # HIGH RISK flags come only from keyword hits and high-risk
+            # patterns; every mention but 'weapon' is itself a firearms
+            # keyword, so this fires only for a bare 'weapon'
+            if not hits and not any(high_matches):
                 flags.append("HIGH RISK: Direct weapon reference detected")
         
         return AnalysisResult(
@@ -180,19 +426,37 @@ class TextAnalyzer:
             flags=flags,
             detected_keywords=detected_keywords,
             detected_patterns=detected_patterns,
-            analysis_time=datetime.now().isoformat(),
+            analysis_time=analysis_time or datetime.now().isoformat(),
             source="rules"
         )
     
-    def analyze_batch(self, texts: List[str]) -> List[AnalysisResult]:
+    def analyze_batch(self, texts: List[str], max_workers: Optional[int] = None) -> List[AnalysisResult]:
         """
         Analyze multiple texts
         
+        analyze_text only reads analyzer state, so texts can be analyzed from
+        several threads. Threads only pay off when matching runs in parallel
+        (free-threaded CPython builds), so by default they are used only there.
+        
         Args:
             texts: List of texts to analyze
+            max_workers: Analysis threads (default: CPU count without a GIL, else 1)
             
         Returns:
-            List of AnalysisResults
+            List of AnalysisResults, in input order
         """
-        return [self.analyze_text(text) for text in texts]
+        if max_workers is None:
+            gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+            max_workers = 1 if gil_enabled else (os.cpu_count() or 1)
+        
+        # One timestamp for the whole batch instead of one per text
+        analysis_time = datetime.now().isoformat()
+        
+        if max_workers <= 1 or len(texts) <= 1:
+            return [self.analyze_text(text, analysis_time) for text in texts]
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.analyze_text, texts, repeat(analysis_time)))
 
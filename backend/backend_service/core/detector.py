@@ -2,14 +2,47 @@
 Weapons Detector - Main detection orchestrator
 Coordinates rule-based analysis and LLM validation
 """
-from typing import Dict, Any, Optional, List
+from dataclasses import replace
 from datetime import datetime
+from typing import Dict, Any, Optional, List
 import hashlib
+import itertools
+import time
 
 from .analyzer import TextAnalyzer
 from .scorer import RiskScorer
 from ..entities.analysis import AnalysisResult, RiskAssessment
 from ..entities.risk import RiskLevel, RiskClassification
+from ..utils.cache import TTLCache
+from ..llm_globals import LLM_CACHE_TTL
+
+
+# Distinct contents whose results are remembered (reposts, forwards)
+RESULT_CACHE_SIZE = 10_000
+
+# Hybrid results carry an LLM verdict, so they expire like LLM replies do
+RESULT_CACHE_TTL = LLM_CACHE_TTL
+
+
+def _content_digest(data: bytes) -> str:
+    """
+    content_hash of an analysis: truncated SHA-256 in every environment,
+    since the value is stored with results and compared across runs
+    """
+    return hashlib.sha256(data).hexdigest()[:32]
+
+
+def _copy_result(result: AnalysisResult, **changes) -> AnalysisResult:
+    """Copy of a result that shares no lists with the original"""
+    return replace(
+        result,
+        flags=list(result.flags),
+        detected_keywords=list(result.detected_keywords),
+        detected_patterns=list(result.detected_patterns),
+        llm_reasons=None if result.llm_reasons is None else list(result.llm_reasons),
+        llm_evidence_spans=None if result.llm_evidence_spans is None else list(result.llm_evidence_spans),
+        **changes
+    )
 
 
 class WeaponsDetector:
@@ -18,21 +51,39 @@ class WeaponsDetector:
     Coordinates rule-based analysis and optional LLM validation.
     """
     
-    def __init__(self, use_llm: bool = False, llm_operations=None):
+    def __init__(
+        self,
+        use_llm: bool = False,
+        llm_operations=None,
+        result_cache_size: int = RESULT_CACHE_SIZE
+    ):
         """
         Initialize the weapons detector
         
         Args:
             use_llm: Whether to use LLM for validation
             llm_operations: LLM operations module (if use_llm is True)
+            result_cache_size: Results kept per content hash (0 disables caching)
         """
         self.analyzer = TextAnalyzer()
         self.scorer = RiskScorer()
         self.use_llm = use_llm
         self.llm_operations = llm_operations
+        self._result_cache = (
+            TTLCache(maxsize=result_cache_size, ttl=RESULT_CACHE_TTL)
+            if result_cache_size else None
+        )
+        
+        # analysis_<creation time>_<n>: unique per detector, distinct across runs
+        self._id_prefix = f"analysis_{int(time.time())}_"
+        self._id_counter = itertools.count()
         
         print(f"WeaponsDetector initialized (LLM: {'enabled' if use_llm else 'disabled'})")
     
+    def new_analysis_id(self) -> str:
+        """Next analysis id, unique for this detector"""
+        return f"{self._id_prefix}{next(self._id_counter)}"
+    
     def analyze(
         self, 
         content: str,
@@ -50,17 +101,45 @@ class WeaponsDetector:
         Returns:
             RiskAssessment with complete analysis
         """
-        start_time = datetime.now()
-        
         # Generate content hash for deduplication
-        content_hash = hashlib.sha256(content.encode()).hexdigest()[:32]
-        analysis_id = f"analysis_{int(start_time.timestamp())}"
+        return self._analyze_hashed(
+            content,
+            _content_digest(content.encode()),
+            use_llm_override,
+            always_use_llm
+        )
+    
+    def _analyze_hashed(
+        self,
+        content: str,
+        content_hash: str,
+        use_llm_override: Optional[bool],
+        always_use_llm: bool
+    ) -> RiskAssessment:
+        """analyze() for content whose hash is already known"""
+        start_ns = time.perf_counter_ns()
+        analysis_id = self.new_analysis_id()
+        
+        # Determine if LLM may be used; it is part of the cache key since
+        # the same content can yield a rules-only or a hybrid result
+        use_llm = use_llm_override if use_llm_override is not None else self.use_llm
+        
+        # Reposted/forwarded content: reuse the earlier verdict, stamped
+        # with this analysis' time
+        cache_key = (content_hash, use_llm, always_use_llm)
+        if self._result_cache is not None:
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                return RiskAssessment(
+                    analysis_id=analysis_id,
+                    content_hash=content_hash,
+                    result=_copy_result(cached, analysis_time=datetime.now().isoformat()),
+                    processing_time_ms=(time.perf_counter_ns() - start_ns) / 1e6
+                )
         
         # Run rule-based analysis
         rule_result = self.analyzer.analyze_text(content)
         
-        # Determine if LLM should be used
-        use_llm = use_llm_override if use_llm_override is not None else self.use_llm
         should_use_llm = self.scorer.should_use_llm(
             rule_result.risk_score,
             use_llm,
@@ -108,8 +187,12 @@ class WeaponsDetector:
                     llm_error=str(e)
                 )
         
+        # LLM failures are transient, so only complete results are reused
+        if self._result_cache is not None and final_result.llm_error is None:
+            self._result_cache.set(cache_key, _copy_result(final_result))
+        
         # Calculate processing time
-        processing_time = (datetime.now() - start_time).total_seconds() * 1000
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e6
         
         return RiskAssessment(
             analysis_id=analysis_id,
@@ -133,9 +216,12 @@ class WeaponsDetector:
         Returns:
             List of RiskAssessments
         """
+        # Hash the whole batch in one pass before analyzing; the hashes
+        # feed the result cache, so reposts within the batch hit it too
+        hashes = list(map(_content_digest, map(str.encode, contents)))
         return [
-            self.analyze(content, use_llm_override) 
-            for content in contents
+            self._analyze_hashed(content, content_hash, use_llm_override, False)
+            for content, content_hash in zip(contents, hashes)
         ]
     
     def quick_scan(self, content: str) -> Dict[str, Any]:
@@ -160,6 +246,18 @@ class WeaponsDetector:
     
     def is_high_risk(self, content: str) -> bool:
         """Quick check if content is high risk"""
-        result = self.analyzer.analyze_text(content)
-        return result.risk_score >= 0.7
+        # One seed-term search decides the >= 0.7 threshold exactly; the
+        # rest of the analysis only adds flags on top of it
+        return self.analyzer.may_be_high_risk(content)
+
 
+def _warmup() -> None:
+    """
+    Run one throwaway rule-based analysis so pattern compilation and
+    first-call setup happen at import time instead of on the first request
+    """
+    import io
+    from contextlib import redirect_stdout
+    
+    with redirect_stdout(io.StringIO()):
+        TextAnalyzer().analyze_text("WTS glock 19, $500, DM me on telegram, ships today")
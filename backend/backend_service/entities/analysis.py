@@ -1,13 +1,13 @@
 """
 Analysis result entities
 """
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from enum import Enum
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Result of text analysis"""
     risk_score: float
@@ -25,7 +25,20 @@ class AnalysisResult:
     llm_error: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Explicit equivalent of asdict(): lists are copied, not shared
+        return {
+            "risk_score": self.risk_score,
+            "confidence": self.confidence,
+            "flags": list(self.flags),
+            "detected_keywords": list(self.detected_keywords),
+            "detected_patterns": list(self.detected_patterns),
+            "analysis_time": self.analysis_time,
+            "source": self.source,
+            "llm_reasons": _copy_list(self.llm_reasons),
+            "llm_evidence_spans": _copy_list(self.llm_evidence_spans),
+            "llm_misclassification_risk": self.llm_misclassification_risk,
+            "llm_error": self.llm_error
+        }
     
     @property
     def risk_level(self) -> str:
@@ -37,7 +50,7 @@ class AnalysisResult:
         return "LOW"
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskAssessment:
     """Complete risk assessment for a piece of content"""
     analysis_id: str
@@ -49,9 +62,15 @@ class RiskAssessment:
     processing_time_ms: Optional[float] = None
     
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
-        data['result'] = self.result.to_dict()
-        return data
+        return {
+            "analysis_id": self.analysis_id,
+            "content_hash": self.content_hash,
+            "result": self.result.to_dict(),
+            "post_id": self.post_id,
+            "platform": self.platform,
+            "processed_at": self.processed_at,
+            "processing_time_ms": self.processing_time_ms
+        }
     
     @property
     def is_high_risk(self) -> bool:
@@ -66,7 +85,7 @@ class RiskAssessment:
         return self.result.risk_score < 0.4
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractedEntities:
     """Entities extracted from content via LLM"""
     weapon_types: List[str] = field(default_factory=list)
@@ -78,10 +97,22 @@ class ExtractedEntities:
     time_references: List[str] = field(default_factory=list)
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Explicit equivalent of asdict(): lists are copied, not shared
+        return {
+            "weapon_types": list(self.weapon_types),
+            "weapon_models": list(self.weapon_models),
+            "locations": list(self.locations),
+            "contact_methods": list(self.contact_methods),
+            "prices": list(self.prices),
+            "quantities": list(self.quantities),
+            "time_references": list(self.time_references)
+        }
     
     @property
     def has_transaction_indicators(self) -> bool:
         """Check if there are indicators of a transaction"""
         return bool(self.prices or self.contact_methods or self.locations)
 
+
+def _copy_list(value: Optional[List[str]]) -> Optional[List[str]]:
+    return list(value) if value is not None else None
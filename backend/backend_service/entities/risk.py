@@ -1,7 +1,7 @@
 """
 Risk classification entities
 """
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field
 from typing import Optional, Dict, Any, List
 from enum import Enum
 
@@ -16,16 +16,22 @@ class RiskLevel(str, Enum):
     @classmethod
     def from_score(cls, score: float) -> 'RiskLevel':
         """Get risk level from numeric score"""
-        if score >= 0.9:
-            return cls.CRITICAL
-        elif score >= 0.7:
-            return cls.HIGH
-        elif score >= 0.4:
-            return cls.MEDIUM
+        for threshold, level in _SCORE_LEVELS:
+            if score >= threshold:
+                return level
         return cls.LOW
 
 
-@dataclass
+# (minimum score, level), highest first; the members are bound once here
+# because Enum class attribute lookups are comparatively slow
+_SCORE_LEVELS = (
+    (0.9, RiskLevel.CRITICAL),
+    (0.7, RiskLevel.HIGH),
+    (0.4, RiskLevel.MEDIUM)
+)
+
+
+@dataclass(slots=True)
 class RiskClassification:
     """LLM-provided risk classification"""
     final_label: str  # HIGH, MEDIUM, LOW
@@ -35,7 +41,14 @@ class RiskClassification:
     misclassification_risk: str  # LOW, MEDIUM, HIGH
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Explicit equivalent of asdict(): lists are copied, not shared
+        return {
+            "final_label": self.final_label,
+            "risk_adjustment": self.risk_adjustment,
+            "reasons": list(self.reasons),
+            "evidence_spans": list(self.evidence_spans),
+            "misclassification_risk": self.misclassification_risk
+        }
     
     @classmethod
     def from_llm_response(cls, response: Dict[str, Any]) -> 'RiskClassification':
@@ -49,7 +62,7 @@ class RiskClassification:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EvasionPatterns:
     """Detected evasion patterns in content"""
     patterns_detected: List[str]
@@ -58,14 +71,19 @@ class EvasionPatterns:
     original_terms: Dict[str, str]  # Maps detected pattern to likely original term
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "patterns_detected": list(self.patterns_detected),
+            "confidence": self.confidence,
+            "techniques": list(self.techniques),
+            "original_terms": dict(self.original_terms)
+        }
     
     @property
     def has_evasion(self) -> bool:
         return len(self.patterns_detected) > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationAnalysis:
     """Analysis of multi-message conversations"""
     conversation_id: str
@@ -80,5 +98,16 @@ class ConversationAnalysis:
     timeline_end: str
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {
+            "conversation_id": self.conversation_id,
+            "message_count": self.message_count,
+            "participants_count": self.participants_count,
+            "deal_progression": self.deal_progression,
+            "buyer_indicators": list(self.buyer_indicators),
+            "seller_indicators": list(self.seller_indicators),
+            "negotiation_patterns": list(self.negotiation_patterns),
+            "risk_score": self.risk_score,
+            "timeline_start": self.timeline_start,
+            "timeline_end": self.timeline_end
+        }
 
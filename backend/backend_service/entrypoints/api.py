@@ -5,9 +5,19 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from datetime import datetime
 
+# orjson encodes large collection/batch replies several times faster than
+# the stdlib json module; ORJSONResponse needs it installed at render time
+try:
+    import orjson  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:
+    from fastapi.responses import JSONResponse as DefaultResponse
+
 from ..config import config
 from ..globals import state
 from .routes import detection_router, collection_router, generation_router, llm_router
+from .routes.detection import get_llm_detector
+from .routes.llm import close_llm_operations, close_ollama_client
 
 
 def create_app() -> FastAPI:
@@ -22,7 +32,8 @@ def create_app() -> FastAPI:
         description="Academic research system for detecting illegal weapons trade patterns",
         version="2.2.0",
         docs_url="/docs",
-        redoc_url="/redoc"
+        redoc_url="/redoc",
+        default_response_class=DefaultResponse
     )
     
     # CORS middleware
@@ -106,6 +117,8 @@ def create_app() -> FastAPI:
     @app.on_event("startup")
     async def startup_event():
         state.mark_started()
+        # Build the shared LLM detector now rather than on the first request
+        get_llm_detector()
         print("=" * 50)
         print("Weapons Detection API v2.2.0 Started")
         print("=" * 50)
@@ -114,6 +127,12 @@ def create_app() -> FastAPI:
         print(f"LLM configured: {config.llm_configured}")
         print("=" * 50)
     
+    # Shutdown event
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        await close_llm_operations()
+        await close_ollama_client()
+    
     return app
 
 
@@ -4,7 +4,7 @@ Collection API Routes
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
 import os
 
@@ -19,6 +19,18 @@ router = APIRouter(prefix="/api", tags=["collection"])
 
 file_manager = FileManager(config.DATA_DIR)
 
+# Subreddits fetched concurrently; requests still share the handler's rate limiter
+REDDIT_COLLECT_WORKERS = 20
+
+# One pool for every collection request, so worker threads are reused
+# instead of being created and torn down per request. It lives as long as
+# the process (the router is shared by every app), so no app shutdown hook
+# closes it.
+collection_pool = ThreadPoolExecutor(
+    max_workers=REDDIT_COLLECT_WORKERS,
+    thread_name_prefix="reddit-collect"
+)
+
 
 def _init_reddit_handler():
     """Initialize Reddit handler with configured credentials"""
@@ -36,13 +48,30 @@ def _init_reddit_handler():
         return None
 
 
+def _empty_collection_response(sources: List[str], collection_summary: Dict[str, int]) -> CollectionResponse:
+    """Warning response for a Reddit collection that returned no posts"""
+    return CollectionResponse(
+        status="warning",
+        message="No posts collected",
+        total_collected=0,
+        high_risk_count=0,
+        medium_risk_count=0,
+        low_risk_count=0,
+        saved_files=[],
+        collection_timestamp=datetime.now().isoformat(),
+        platform="reddit",
+        collection_summary=collection_summary,
+        sources_collected=sources
+    )
+
+
 @router.post("/reddit/collect", response_model=CollectionResponse)
 async def collect_reddit_data(request: RedditCollectionRequest):
     """
     Collect Reddit data for academic research
     """
     if not config.reddit_configured:
-        missing = config.get_missing_reddit_config()
+        missing = config.missing_reddit_config
         raise HTTPException(
             status_code=500,
             detail=f"Reddit API not configured. Missing: {', '.join(missing)}"
@@ -67,53 +96,52 @@ async def collect_reddit_data(request: RedditCollectionRequest):
     
     subreddits = default_subreddits if params.include_all_defaults else params.subreddits
     
-    # Run collection in thread pool
-    loop = asyncio.get_event_loop()
-    with ThreadPoolExecutor() as executor:
-        all_posts = []
-        collection_summary = {}
-        
-        for subreddit in subreddits:
-            try:
-                if params.keywords:
-                    keywords = [k.strip() for k in params.keywords.split(',')]
-                    posts = await loop.run_in_executor(
-                        executor,
-                        lambda s=subreddit: handler.search_posts_by_keywords(
-                            s, keywords, params.timeFilter, params.limit_per_subreddit
-                        )
-                    )
-                else:
-                    posts = await loop.run_in_executor(
-                        executor,
-                        lambda s=subreddit: handler.collect_subreddit_posts(
-                            s, params.timeFilter, params.limit_per_subreddit, params.sortMethod
-                        )
-                    )
-                
-                all_posts.extend(posts)
-                collection_summary[subreddit] = len(posts)
-            except Exception as e:
-                collection_summary[subreddit] = 0
-                continue
+    # PRAW is blocking: run the per-subreddit round-trips concurrently in
+    # the shared collection pool. Each worker analyzes its subreddit's posts
+    # as soon as they arrive, overlapping the rule analysis with the other
+    # subreddits' network waits. gather() keeps results in subreddit order;
+    # a failed subreddit comes back as its exception and counts as 0 posts.
+    loop = asyncio.get_running_loop()
+    if params.keywords:
+        # One tuple shared by every worker; it also keys the handler's query cache
+        keywords = tuple(k.strip() for k in params.keywords.split(','))
+        calls = [
+            lambda s=subreddit: handler.search_posts_by_keywords(
+                s, keywords, params.timeFilter, params.limit_per_subreddit
+            )
+            for subreddit in subreddits
+        ]
+    else:
+        calls = [
+            lambda s=subreddit: handler.collect_subreddit_posts(
+                s, params.timeFilter, params.limit_per_subreddit, params.sortMethod
+            )
+            for subreddit in subreddits
+        ]
     
-    if not all_posts:
-        return CollectionResponse(
-            status="warning",
-            message="No posts collected",
-            total_collected=0,
-            high_risk_count=0,
-            medium_risk_count=0,
-            low_risk_count=0,
-            saved_files=[],
-            collection_timestamp=datetime.now().isoformat(),
-            platform="reddit",
-            collection_summary=collection_summary,
-            sources_collected=subreddits
-        )
+    def collect_and_analyze(collect):
+        posts = collect()
+        return posts, handler.analyze_posts(posts) if posts else []
     
-    # Analyze posts
-    analyzed_posts = handler.analyze_posts(all_posts)
+    results = await asyncio.gather(
+        *(loop.run_in_executor(collection_pool, collect_and_analyze, call) for call in calls),
+        return_exceptions=True
+    )
+    
+    all_posts = []
+    analyzed_posts = []
+    collection_summary = {}
+    for subreddit, result in zip(subreddits, results):
+        if isinstance(result, Exception):
+            collection_summary[subreddit] = 0
+            continue
+        posts, analyzed = result
+        all_posts.extend(posts)
+        analyzed_posts.extend(analyzed)
+        collection_summary[subreddit] = len(posts)
+    
+    if not all_posts:
+        return _empty_collection_response(subreddits, collection_summary)
     
     # Generate filename
     if params.include_all_defaults:
@@ -203,10 +231,18 @@ async def collect_telegram_data(request: TelegramCollectionRequest):
         # Analyze messages
         analyzed = handler.analyze_messages(all_messages)
         
-        # Categorize
-        high_risk = [m for m in analyzed if m.risk_analysis and m.risk_analysis.get('risk_score', 0) >= 0.7]
-        medium_risk = [m for m in analyzed if m.risk_analysis and 0.4 <= m.risk_analysis.get('risk_score', 0) < 0.7]
-        low_risk = [m for m in analyzed if m.risk_analysis and m.risk_analysis.get('risk_score', 0) < 0.4]
+        # Count risk levels in one pass; only the counts are reported
+        high_risk = medium_risk = low_risk = 0
+        for m in analyzed:
+            if not m.risk_analysis:
+                continue
+            score = m.risk_analysis.get('risk_score', 0)
+            if score >= 0.7:
+                high_risk += 1
+            elif score >= 0.4:
+                medium_risk += 1
+            else:
+                low_risk += 1
         
         # Save
         filename = f"telegram_collection_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -216,9 +252,9 @@ async def collect_telegram_data(request: TelegramCollectionRequest):
             "status": "success",
             "message": f"Collected {len(all_messages)} messages",
             "total_collected": len(all_messages),
-            "high_risk_count": len(high_risk),
-            "medium_risk_count": len(medium_risk),
-            "low_risk_count": len(low_risk),
+            "high_risk_count": high_risk,
+            "medium_risk_count": medium_risk,
+            "low_risk_count": low_risk,
             "saved_files": saved_files,
             "collection_timestamp": datetime.now().isoformat(),
             "platform": "telegram",
@@ -239,7 +275,7 @@ async def reddit_config_status():
     """Check Reddit API configuration status"""
     return {
         "is_configured": config.reddit_configured,
-        "missing_config": config.get_missing_reddit_config(),
+        "missing_config": config.missing_reddit_config,
         "user_agent": config.REDDIT_USER_AGENT or "Not configured",
         "data_directory": config.DATA_DIR
     }
@@ -250,7 +286,7 @@ async def telegram_config_status():
     """Check Telegram API configuration status"""
     return {
         "is_configured": config.telegram_configured,
-        "missing_config": config.get_missing_telegram_config(),
+        "missing_config": config.missing_telegram_config,
         "data_directory": config.DATA_DIR
     }
 
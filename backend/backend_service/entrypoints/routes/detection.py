@@ -3,12 +3,24 @@ Detection API Routes
 """
 from fastapi import APIRouter, HTTPException, Query
 from typing import Dict, Any
+from collections import Counter
+from dataclasses import replace
 from datetime import datetime
 
 from ...core.detector import WeaponsDetector
 from ...core.analyzer import TextAnalyzer
+from ...llm_globals import (
+    LLM_SEMANTIC_CACHE,
+    LLM_SEMANTIC_CACHE_SIZE,
+    LLM_SEMANTIC_CACHE_THRESHOLD,
+    LLM_SEMANTIC_CACHE_MODEL
+)
 from ...models.requests import AnalysisRequest, LLMAnalysisRequest
 from ...models.responses import AnalysisResponse
+from ...globals import state
+from ...entities.analysis import AnalysisResult
+from ...utils.cache import SemanticCache, load_embedder
+from .llm import get_llm_operations
 
 router = APIRouter(prefix="/api/detection", tags=["detection"])
 
@@ -16,6 +28,61 @@ router = APIRouter(prefix="/api/detection", tags=["detection"])
 analyzer = TextAnalyzer()
 detector = WeaponsDetector(use_llm=False)
 
+# Identical content is served from the detector's result cache. On top of
+# it, a near-duplicate tier for LLM verdicts (reworded reposts such as
+# "WTS AR-15 lower" / "selling AR15 lower"), opt-in via LLM_SEMANTIC_CACHE;
+# one cache per always_if_toggled setting. Only verdicts are cached: every
+# response gets its own analysis_id and timestamp.
+if LLM_SEMANTIC_CACHE:
+    _embed = load_embedder(LLM_SEMANTIC_CACHE_MODEL)
+    semantic_caches = {
+        always: SemanticCache(
+            maxsize=LLM_SEMANTIC_CACHE_SIZE,
+            threshold=LLM_SEMANTIC_CACHE_THRESHOLD,
+            embed=_embed
+        )
+        for always in (False, True)
+    }
+else:
+    semantic_caches = None
+
+
+def get_llm_detector() -> WeaponsDetector:
+    """
+    The process-wide LLM-enabled detector, created on first use
+    
+    Building a detector (and its LLM client) per request repeated all of the
+    setup work and discarded the detector's result cache every time. Falls
+    back to the rules-only detector when LLM support cannot be imported.
+    """
+    if state.llm_detector is None:
+        try:
+            state.llm_detector = WeaponsDetector(use_llm=True, llm_operations=get_llm_operations())
+        except ImportError:
+            state.llm_detector = detector
+    return state.llm_detector
+
+
+def _llm_response(analysis_id: str, result: AnalysisResult) -> AnalysisResponse:
+    """Build the /analyze_llm response for a detector result"""
+    return AnalysisResponse(
+        analysis_id=analysis_id,
+        status="completed",
+        risk_score=result.risk_score,
+        risk_level=result.risk_level,
+        confidence=result.confidence,
+        flags=result.flags,
+        detected_keywords=result.detected_keywords,
+        detected_patterns=result.detected_patterns,
+        summary=f"{'Hybrid' if result.source == 'hybrid' else 'Rules-only'}: {len(result.flags)} indicators found.",
+        timestamp=result.analysis_time,
+        source=result.source,
+        llm_reasons=result.llm_reasons,
+        llm_evidence_spans=result.llm_evidence_spans,
+        llm_misclassification_risk=result.llm_misclassification_risk,
+        llm_error=result.llm_error
+    )
+
 
 @router.post("/analyze", response_model=AnalysisResponse)
 async def analyze_content(request: Dict[str, Any]):
@@ -32,10 +99,8 @@ async def analyze_content(request: Dict[str, Any]):
     risk_score = analysis_results.risk_score
     risk_level = analysis_results.risk_level
     
-    analysis_id = f"analysis_{int(datetime.now().timestamp())}"
-    
     return AnalysisResponse(
-        analysis_id=analysis_id,
+        analysis_id=detector.new_analysis_id(),
         status="completed",
         risk_score=risk_score,
         risk_level=risk_level,
@@ -63,13 +128,18 @@ async def analyze_content_llm(
     if not content:
         raise HTTPException(status_code=400, detail="No content provided")
     
-    # Get LLM operations if available
-    try:
-        from ..._ai_operations import LLMOperations
-        llm_ops = LLMOperations()
-        llm_detector = WeaponsDetector(use_llm=use_llm, llm_operations=llm_ops)
-    except ImportError:
-        llm_detector = WeaponsDetector(use_llm=False)
+    llm_detector = get_llm_detector()
+    
+    # Rules-only results are cheap and exact, so only LLM verdicts are
+    # looked up by similarity
+    semantic_cache = semantic_caches[always_if_toggled] if use_llm and semantic_caches else None
+    if semantic_cache is not None:
+        cached = semantic_cache.get(content)
+        if cached is not None:
+            return _llm_response(
+                llm_detector.new_analysis_id(),
+                replace(cached, analysis_time=datetime.now().isoformat())
+            )
     
     assessment = llm_detector.analyze(
         content, 
@@ -79,23 +149,10 @@ async def analyze_content_llm(
     
     result = assessment.result
     
-    return AnalysisResponse(
-        analysis_id=assessment.analysis_id,
-        status="completed",
-        risk_score=result.risk_score,
-        risk_level=result.risk_level,
-        confidence=result.confidence,
-        flags=result.flags,
-        detected_keywords=result.detected_keywords,
-        detected_patterns=result.detected_patterns,
-        summary=f"{'Hybrid' if result.source == 'hybrid' else 'Rules-only'}: {len(result.flags)} indicators found.",
-        timestamp=result.analysis_time,
-        source=result.source,
-        llm_reasons=result.llm_reasons,
-        llm_evidence_spans=result.llm_evidence_spans,
-        llm_misclassification_risk=result.llm_misclassification_risk,
-        llm_error=result.llm_error
-    )
+    # LLM failures are transient, so only complete verdicts are reused
+    if semantic_cache is not None and result.source == "hybrid" and result.llm_error is None:
+        semantic_cache.set(content, result)
+    return _llm_response(assessment.analysis_id, result)
 
 
 @router.post("/batch")
@@ -112,25 +169,23 @@ async def analyze_batch(request: Dict[str, Any]):
         raise HTTPException(status_code=400, detail="Maximum 100 items per batch")
     
     results = []
-    for i, content in enumerate(contents):
-        analysis = analyzer.analyze_text(content)
+    level_counts = Counter()
+    for i, analysis in enumerate(analyzer.analyze_batch(contents)):
+        risk_level = analysis.risk_level
+        level_counts[risk_level] += 1
         results.append({
             "index": i,
             "risk_score": analysis.risk_score,
-            "risk_level": analysis.risk_level,
+            "risk_level": risk_level,
             "flags_count": len(analysis.flags)
         })
     
-    high_risk = sum(1 for r in results if r["risk_score"] >= 0.7)
-    medium_risk = sum(1 for r in results if 0.4 <= r["risk_score"] < 0.7)
-    low_risk = sum(1 for r in results if r["risk_score"] < 0.4)
-    
     return {
         "status": "completed",
         "total_analyzed": len(contents),
-        "high_risk_count": high_risk,
-        "medium_risk_count": medium_risk,
-        "low_risk_count": low_risk,
+        "high_risk_count": level_counts["HIGH"],
+        "medium_risk_count": level_counts["MEDIUM"],
+        "low_risk_count": level_counts["LOW"],
         "results": results,
         "timestamp": datetime.now().isoformat()
     }
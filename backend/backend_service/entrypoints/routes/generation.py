@@ -4,7 +4,7 @@ Generation API Routes
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from fastapi import APIRouter, HTTPException
-from datetime import datetime
+from fastapi.responses import Response
 
 from ...models.requests import (
     ContentGenerationRequest,
@@ -12,6 +12,8 @@ from ...models.requests import (
     BigDataGenerationRequest
 )
 from ...models.responses import GenerationResponse, BatchGenerationResponse, BigDataGenerationResponse
+from ...utils.timestamps import iso_now
+from ...utils import jsonio
 
 # Import the existing content generator
 import sys
@@ -33,6 +35,35 @@ if SyntheticContentGenerator:
 else:
     content_generator = None
 
+# Big-data generation runs off the event loop in one shared, bounded pool
+# rather than a new executor per request. It lives as long as the process
+# (the router is shared by every app), so no app shutdown hook closes it.
+BIG_DATA_WORKERS = min(8, os.cpu_count() or 4)
+generation_pool = ThreadPoolExecutor(
+    max_workers=BIG_DATA_WORKERS,
+    thread_name_prefix="big-data-gen"
+)
+
+
+def _templates_body() -> bytes:
+    """JSON body of /templates; the generator's vocabulary never changes"""
+    return jsonio.dumps({
+        "content_types": ["post", "message", "ad", "forum"],
+        "intensity_levels": ["low", "medium", "high"],
+        "vocabulary_sample": {
+            "low": content_generator.vocabulary["low"],
+            "medium": content_generator.vocabulary["medium"],
+            "high": content_generator.vocabulary["high"]
+        },
+        "platform_styles": content_generator.platform_styles,
+        "supported_languages": ["en"],
+        "max_quantity": 50
+    })
+
+
+# Serialized once at import and served as-is
+_TEMPLATES_BODY = _templates_body() if content_generator else None
+
 
 @router.post("/content", response_model=GenerationResponse)
 async def generate_content(request: ContentGenerationRequest):
@@ -62,7 +93,7 @@ async def generate_content(request: ContentGenerationRequest):
             generated_count=len(generated_content),
             content=generated_content,
             parameters=request.dict(),
-            timestamp=datetime.now().isoformat()
+            timestamp=iso_now()
         )
         
     except Exception as e:
@@ -90,7 +121,7 @@ async def generate_batch_content(request: BatchGenerationRequest):
             status="success",
             batch_results=batch_results,
             configuration=batch_config,
-            timestamp=datetime.now().isoformat()
+            timestamp=iso_now()
         )
         
     except Exception as e:
@@ -106,15 +137,13 @@ async def generate_big_data(request: BigDataGenerationRequest):
         raise HTTPException(status_code=500, detail="Content generator not available")
     
     try:
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            big_data_results = await loop.run_in_executor(
-                executor,
-                content_generator.generate_big_data_batch,
-                request.total_quantity,
-                request.platforms,
-                request.content_lengths
-            )
+        big_data_results = await asyncio.get_running_loop().run_in_executor(
+            generation_pool,
+            content_generator.generate_big_data_batch,
+            request.total_quantity,
+            request.platforms,
+            request.content_lengths
+        )
         
         return BigDataGenerationResponse(
             status="success",
@@ -126,7 +155,7 @@ async def generate_big_data(request: BigDataGenerationRequest):
                 "platforms": request.platforms,
                 "content_lengths": request.content_lengths
             },
-            timestamp=datetime.now().isoformat()
+            timestamp=iso_now()
         )
         
     except Exception as e:
@@ -138,19 +167,8 @@ async def get_generation_templates():
     """
     Get available templates and vocabulary for content generation
     """
-    if not content_generator:
+    if _TEMPLATES_BODY is None:
         raise HTTPException(status_code=500, detail="Content generator not available")
     
-    return {
-        "content_types": ["post", "message", "ad", "forum"],
-        "intensity_levels": ["low", "medium", "high"],
-        "vocabulary_sample": {
-            "low": content_generator.vocabulary["low"],
-            "medium": content_generator.vocabulary["medium"],
-            "high": content_generator.vocabulary["high"]
-        },
-        "platform_styles": content_generator.platform_styles,
-        "supported_languages": ["en"],
-        "max_quantity": 50
-    }
+    return Response(content=_TEMPLATES_BODY, media_type="application/json")
 
@@ -1,12 +1,25 @@
 """
 LLM API Routes
 """
+import asyncio
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
-from datetime import datetime
 import os
 
+from ...globals import state
 from ...models.responses import LLMStatusResponse
+from ...utils.timestamps import iso_now
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+# Ollama probes are awaited on httpx's async client when it is installed
+try:
+    import httpx
+except ImportError:
+    httpx = None
 
 router = APIRouter(prefix="/api/llm", tags=["llm"])
 
@@ -15,6 +28,62 @@ LLM_PROVIDER = os.getenv("LLM_PROVIDER", "ollama").lower()
 OLLAMA_BASE = os.getenv("OLLAMA_BASE", "http://localhost:11434")
 OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.1:8b")
 
+# One keep-alive client for the Ollama probes instead of a new connection
+# per /status or /models call. httpx's AsyncClient keeps the event loop
+# free while Ollama answers; without httpx the requests session is run in
+# a worker thread. The client is created on first use and closed by an
+# app's shutdown event, so the next app to serve these routes gets a new one.
+_TAGS_URL = f"{OLLAMA_BASE}/api/tags"
+_client = None
+_session = requests.Session() if requests is not None and httpx is None else None
+
+
+def _get_client():
+    """The shared Ollama AsyncClient, created if missing"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(timeout=5.0, limits=httpx.Limits(max_keepalive_connections=8))
+    return _client
+
+
+async def _fetch_tags(timeout: float):
+    """GET Ollama's model list without blocking the event loop"""
+    if httpx is not None:
+        return await _get_client().get(_TAGS_URL, timeout=timeout)
+    return await asyncio.to_thread(_session.get, _TAGS_URL, timeout=timeout)
+
+
+def get_llm_operations():
+    """
+    The process-wide AsyncLLMOperations, created on first use
+    
+    One instance keeps its pooled sessions and response caches across
+    requests: the routes below await its async methods, and the LLM
+    detector uses its sync ones. Raises ImportError when LLM support
+    cannot be imported.
+    """
+    if state.llm_operations is None:
+        from ..._ai_operations import AsyncLLMOperations
+        state.llm_operations = AsyncLLMOperations()
+    return state.llm_operations
+
+
+async def close_llm_operations() -> None:
+    """Close the shared LLM operations; the next app builds new ones"""
+    llm_ops, state.llm_operations = state.llm_operations, None
+    if llm_ops is not None:
+        # The detector holds the same instance
+        state.llm_detector = None
+        await llm_ops.aclose()
+
+
+async def close_ollama_client() -> None:
+    """Close the shared Ollama client; a later request opens a new one"""
+    global _client
+    client, _client = _client, None
+    if client is not None:
+        await client.aclose()
+
 
 @router.get("/status", response_model=LLMStatusResponse)
 async def llm_status():
@@ -24,13 +93,10 @@ async def llm_status():
     ok = True
     problems = []
     reachable = False
-    requests_installed = False
+    requests_installed = requests is not None
     
     # Check if requests is installed
-    try:
-        import requests
-        requests_installed = True
-    except ImportError:
+    if not requests_installed:
         problems.append("python-requests not installed")
         ok = False
     
@@ -40,10 +106,9 @@ async def llm_status():
         ok = False
     
     # Try to reach Ollama
-    if requests_installed and LLM_PROVIDER == "ollama":
+    if (httpx is not None or _session is not None) and LLM_PROVIDER == "ollama":
         try:
-            import requests
-            r = requests.get(f"{OLLAMA_BASE}/api/tags", timeout=3)
+            r = await _fetch_tags(timeout=3)
             reachable = r.status_code == 200
             
             if reachable:
@@ -72,9 +137,11 @@ async def list_models():
     """
     List available Ollama models
     """
+    if httpx is None and _session is None:
+        raise HTTPException(status_code=500, detail="requests or httpx library not installed")
+    
     try:
-        import requests
-        r = requests.get(f"{OLLAMA_BASE}/api/tags", timeout=5)
+        r = await _fetch_tags(timeout=5)
         
         if r.status_code != 200:
             return {"models": [], "error": "Failed to fetch models"}
@@ -91,11 +158,9 @@ async def list_models():
                 for m in models
             ],
             "current_model": OLLAMA_MODEL,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_now()
         }
         
-    except ImportError:
-        raise HTTPException(status_code=500, detail="requests library not installed")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -111,9 +176,7 @@ async def classify_content(request: Dict[str, Any]):
         raise HTTPException(status_code=400, detail="No content provided")
     
     try:
-        from ..._ai_operations import LLMOperations
-        
-        llm_ops = LLMOperations()
+        llm_ops = get_llm_operations()
         
         # First run rule-based analysis
         from ...core.analyzer import TextAnalyzer
@@ -121,7 +184,7 @@ async def classify_content(request: Dict[str, Any]):
         rule_result = analyzer.analyze_text(content)
         
         # Then get LLM classification
-        classification = llm_ops.classify_risk(content, rule_result)
+        classification = await llm_ops.aclassify_risk(content, rule_result)
         
         return {
             "status": "success",
@@ -131,7 +194,7 @@ async def classify_content(request: Dict[str, Any]):
                 "flags": rule_result.flags
             },
             "llm_classification": classification.to_dict() if classification else None,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_now()
         }
         
     except ImportError as e:
@@ -151,16 +214,14 @@ async def extract_entities(request: Dict[str, Any]):
         raise HTTPException(status_code=400, detail="No content provided")
     
     try:
-        from ..._ai_operations import LLMOperations
-        
-        llm_ops = LLMOperations()
-        entities = llm_ops.extract_entities(content)
+        llm_ops = get_llm_operations()
+        entities = await llm_ops.aextract_entities(content)
         
         return {
             "status": "success",
             "entities": entities.to_dict() if entities else {},
             "has_transaction_indicators": entities.has_transaction_indicators if entities else False,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_now()
         }
         
     except ImportError:
@@ -181,15 +242,13 @@ async def explain_flags(request: Dict[str, Any]):
         raise HTTPException(status_code=400, detail="No content provided")
     
     try:
-        from ..._ai_operations import LLMOperations
-        
-        llm_ops = LLMOperations()
-        explanation = llm_ops.explain_flags(content, flags)
+        llm_ops = get_llm_operations()
+        explanation = await llm_ops.aexplain_flags(content, flags)
         
         return {
             "status": "success",
             "explanation": explanation,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": iso_now()
         }
         
     except ImportError:
@@ -18,6 +18,11 @@ class GlobalState:
         self._errors_count: int = 0
         self._last_collection_time: Optional[datetime] = None
         self._last_analysis_time: Optional[datetime] = None
+        # Shared LLM-enabled WeaponsDetector, created once (see
+        # routes.detection.get_llm_detector)
+        self.llm_detector: Optional[Any] = None
+        # Shared AsyncLLMOperations (see routes.llm.get_llm_operations)
+        self.llm_operations: Optional[Any] = None
     
     def mark_started(self):
         """Mark application start"""
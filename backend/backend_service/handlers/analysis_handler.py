@@ -1,14 +1,20 @@
 """
 Analysis Handler - Orchestrates analysis across platforms
 """
-from datetime import datetime
+from bisect import bisect_right
+from collections import Counter
+from operator import attrgetter
 from typing import List, Dict, Any, Optional, Union
-from dataclasses import asdict
 
 from ..entities.post import Post, RedditPost, TelegramMessage
 from ..entities.analysis import AnalysisResult, RiskAssessment
 from ..core.detector import WeaponsDetector
 from ..utils.file_manager import FileManager
+from ..utils.timestamps import iso_now
+
+
+# Lower score bounds of the medium and high categories
+_CATEGORY_BOUNDS = (0.4, 0.7)
 
 
 class AnalysisHandler:
@@ -49,6 +55,13 @@ class AnalysisHandler:
         """
         return self.detector.analyze(text, use_llm_override=use_llm)
     
+    @staticmethod
+    def _post_content(post: Union[RedditPost, TelegramMessage]) -> str:
+        """Text to analyze for a post ('' or '.' when there is nothing to analyze)"""
+        if isinstance(post, RedditPost):
+            return f"{post.title}. {post.content}".strip()
+        return post.content
+    
     def analyze_post(
         self, 
         post: Union[RedditPost, TelegramMessage],
@@ -64,11 +77,7 @@ class AnalysisHandler:
         Returns:
             Post with risk_analysis attached
         """
-        # Get content based on post type
-        if isinstance(post, RedditPost):
-            content = f"{post.title}. {post.content}".strip()
-        else:
-            content = post.content
+        content = self._post_content(post)
         
         if not content or content == ".":
             return post
@@ -95,21 +104,27 @@ class AnalysisHandler:
         """
         print(f"Analyzing batch of {len(posts)} posts...")
         
-        analyzed = []
-        high_risk_count = 0
+        # Gather the analyzable texts first so the detector sees one batch;
+        # posts without content are returned as they are
+        targets = []
+        contents = []
+        for post in posts:
+            content = self._post_content(post)
+            if content and content != ".":
+                targets.append(post)
+                contents.append(content)
         
-        for i, post in enumerate(posts):
-            result = self.analyze_post(post, use_llm)
-            analyzed.append(result)
-            
-            if result.risk_analysis and result.risk_analysis.get('risk_score', 0) >= 0.7:
+        assessments = self.detector.analyze_batch(contents, use_llm_override=use_llm)
+        
+        high_risk_count = 0
+        for post, assessment in zip(targets, assessments):
+            result = assessment.result
+            post.risk_analysis = result.to_dict()
+            if result.risk_score >= 0.7:
                 high_risk_count += 1
-            
-            if (i + 1) % 100 == 0:
-                print(f"Analyzed {i + 1}/{len(posts)} posts...")
         
         print(f"Analysis complete. Found {high_risk_count} high-risk posts.")
-        return analyzed
+        return list(posts)
     
     def categorize_by_risk(
         self,
@@ -124,43 +139,43 @@ class AnalysisHandler:
         Returns:
             Dictionary with 'high', 'medium', 'low' keys
         """
-        categories = {
-            'high': [],
-            'medium': [],
-            'low': [],
-            'unanalyzed': []
-        }
+        low, medium, high, unanalyzed = [], [], [], []
+        # Indexed by bisect_right(_CATEGORY_BOUNDS, score): one C-level
+        # search per post instead of a chain of comparisons
+        buckets = (low, medium, high)
         
         for post in posts:
-            if not post.risk_analysis:
-                categories['unanalyzed'].append(post)
+            risk_analysis = post.risk_analysis
+            if not risk_analysis:
+                unanalyzed.append(post)
                 continue
             
-            score = post.risk_analysis.get('risk_score', 0)
-            
-            if score >= 0.7:
-                categories['high'].append(post)
-            elif score >= 0.4:
-                categories['medium'].append(post)
-            else:
-                categories['low'].append(post)
-        
-        return categories
+            buckets[bisect_right(_CATEGORY_BOUNDS, risk_analysis.get('risk_score', 0))].append(post)
+        
+        return {
+            'high': high,
+            'medium': medium,
+            'low': low,
+            'unanalyzed': unanalyzed
+        }
     
     def generate_summary(
         self,
-        posts: List[Union[RedditPost, TelegramMessage]]
+        posts: List[Union[RedditPost, TelegramMessage]],
+        categories: Optional[Dict[str, List[Union[RedditPost, TelegramMessage]]]] = None
     ) -> Dict[str, Any]:
         """
         Generate analysis summary
         
         Args:
             posts: List of analyzed posts
+            categories: categorize_by_risk(posts), when the caller already has it
             
         Returns:
             Summary dictionary
         """
-        categories = self.categorize_by_risk(posts)
+        if categories is None:
+            categories = self.categorize_by_risk(posts)
         
         # Calculate statistics
         total = len(posts)
@@ -168,23 +183,21 @@ class AnalysisHandler:
         medium_count = len(categories['medium'])
         low_count = len(categories['low'])
         
-        # Get common keywords across high-risk posts
-        all_keywords = []
-        all_patterns = []
+        # Most frequent keywords and patterns across high-risk posts
+        keyword_counts = Counter()
+        pattern_counts = Counter()
         
         for post in categories['high']:
-            if post.risk_analysis:
-                all_keywords.extend(post.risk_analysis.get('detected_keywords', []))
-                all_patterns.extend(post.risk_analysis.get('detected_patterns', []))
+            risk_analysis = post.risk_analysis
+            if risk_analysis:
+                keyword_counts.update(risk_analysis.get('detected_keywords', ()))
+                pattern_counts.update(risk_analysis.get('detected_patterns', ()))
         
-        # Count platforms
-        platform_counts = {}
-        for post in posts:
-            platform = getattr(post, 'platform', 'unknown')
-            platform_counts[platform] = platform_counts.get(platform, 0) + 1
+        # Count platforms (every post type has one)
+        platform_counts = dict(Counter(map(attrgetter('platform'), posts)))
         
         summary = {
-            "analysis_timestamp": datetime.now().isoformat(),
+            "analysis_timestamp": iso_now(),
             "total_posts": total,
             "risk_distribution": {
                 "high_risk": high_count,
@@ -193,8 +206,8 @@ class AnalysisHandler:
                 "high_risk_percentage": round(high_count / total * 100, 2) if total > 0 else 0
             },
             "platform_distribution": platform_counts,
-            "common_keywords": list(set(all_keywords))[:20],
-            "common_patterns": list(set(all_patterns))[:10],
+            "common_keywords": [k for k, _ in keyword_counts.most_common(20)],
+            "common_patterns": [p for p, _ in pattern_counts.most_common(10)],
             "llm_enabled": self.use_llm
         }
         
@@ -215,14 +228,16 @@ class AnalysisHandler:
         Returns:
             Summary dictionary
         """
+        # One categorization pass shared with the summary; the writer
+        # serializes the dataclasses directly
         categories = self.categorize_by_risk(posts)
-        summary = self.generate_summary(posts)
+        summary = self.generate_summary(posts, categories)
         
         results = {
             "summary": summary,
-            "high_risk_posts": [asdict(p) for p in categories['high']],
-            "medium_risk_posts": [asdict(p) for p in categories['medium']],
-            "low_risk_posts": [asdict(p) for p in categories['low']]
+            "high_risk_posts": categories['high'],
+            "medium_risk_posts": categories['medium'],
+            "low_risk_posts": categories['low']
         }
         
         self.file_manager.save_json(results, f"{filename}_analyzed", "analyzed")
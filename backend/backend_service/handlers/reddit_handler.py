@@ -3,8 +3,8 @@ Reddit Handler - Reddit data collection and processing
 """
 import time
 from datetime import datetime
-from typing import List, Dict, Any, Optional
-from dataclasses import asdict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Sequence, Tuple
 
 from ..entities.post import RedditPost
 from ..entities.analysis import AnalysisResult
@@ -14,6 +14,33 @@ from ..utils.file_manager import FileManager
 from ..core.analyzer import TextAnalyzer
 
 
+# Reddit rejects search queries longer than this
+MAX_SEARCH_QUERY_LENGTH = 512
+
+
+@lru_cache(maxsize=128)
+def _keyword_queries(keywords: Tuple[str, ...], max_length: int = MAX_SEARCH_QUERY_LENGTH) -> Tuple[str, ...]:
+    """
+    Pack keywords into as few OR-joined search queries as fit the length limit
+    
+    Multi-word keywords are quoted so they still match as phrases. Cached
+    per keyword tuple: a collection searches every subreddit with the same
+    keywords.
+    """
+    queries = []
+    current = ""
+    for keyword in keywords:
+        term = f'"{keyword}"' if " " in keyword else keyword
+        candidate = f"{current} OR {term}" if current else term
+        if current and len(candidate) > max_length:
+            queries.append(current)
+            candidate = term
+        current = candidate
+    if current:
+        queries.append(current)
+    return tuple(queries)
+
+
 class RedditHandler:
     """
     Handles Reddit data collection and processing
@@ -84,6 +111,7 @@ class RedditHandler:
         try:
             subreddit = self.reddit.subreddit(subreddit_name)
             collected_posts = []
+            collected_at = datetime.now().isoformat()
             
             # Choose sorting method
             if sort_method == "hot":
@@ -110,7 +138,7 @@ class RedditHandler:
                 )
                 
                 # Use the enhanced from_praw_submission method for image extraction
-                reddit_post = RedditPost.from_praw_submission(post, author_hash)
+                reddit_post = RedditPost.from_praw_submission(post, author_hash, collected_at)
                 
                 collected_posts.append(reddit_post)
             
@@ -124,7 +152,7 @@ class RedditHandler:
     def search_posts_by_keywords(
         self,
         subreddit_name: str,
-        keywords: List[str],
+        keywords: Sequence[str],
         time_filter: str = "week",
         limit: int = 50
     ) -> List[RedditPost]:
@@ -135,7 +163,7 @@ class RedditHandler:
             subreddit_name: Name of subreddit
             keywords: List of keywords to search
             time_filter: Time filter for search
-            limit: Maximum results per keyword
+            limit: Maximum number of results
             
         Returns:
             List of unique RedditPost objects
@@ -146,14 +174,17 @@ class RedditHandler:
             subreddit = self.reddit.subreddit(subreddit_name)
             collected_posts = []
             seen_ids = set()
+            collected_at = datetime.now().isoformat()
             
-            for keyword in keywords:
+            # One search request covers every keyword instead of one per keyword
+            queries = _keyword_queries(tuple(keywords))
+            for query in queries:
                 self.rate_limiter.acquire()
                 
                 search_results = subreddit.search(
-                    keyword,
+                    query,
                     time_filter=time_filter,
-                    limit=limit // len(keywords)
+                    limit=max(1, limit // len(queries))
                 )
                 
                 for post in search_results:
@@ -170,7 +201,7 @@ class RedditHandler:
                     )
                     
                     # Use the enhanced from_praw_submission method for image extraction
-                    reddit_post = RedditPost.from_praw_submission(post, author_hash)
+                    reddit_post = RedditPost.from_praw_submission(post, author_hash, collected_at)
                     
                     collected_posts.append(reddit_post)
             
@@ -233,16 +264,14 @@ class RedditHandler:
         """
         saved_files = []
         
-        posts_data = [asdict(post) for post in posts]
-        
-        # Save JSON
+        # Save JSON (the writer serializes the dataclasses directly)
         json_data = {
             "collection_info": {
                 "collected_at": datetime.now().isoformat(),
                 "total_posts": len(posts),
                 "disclaimer": self.disclaimer.strip()
             },
-            "posts": posts_data
+            "posts": posts
         }
         
         json_path = self.file_manager.save_json(json_data, filename, "raw")
@@ -250,7 +279,7 @@ class RedditHandler:
         
         # Save CSV
         if include_csv:
-            csv_path = self.file_manager.save_csv(posts_data, filename, "raw")
+            csv_path = self.file_manager.save_csv([post.to_dict() for post in posts], filename, "raw")
             saved_files.append(csv_path)
         
         return saved_files
@@ -270,10 +299,18 @@ class RedditHandler:
         Returns:
             Summary dictionary
         """
-        # Categorize by risk level
-        high_risk = [p for p in posts if p.risk_analysis and p.risk_analysis.get('risk_score', 0) >= 0.7]
-        medium_risk = [p for p in posts if p.risk_analysis and 0.4 <= p.risk_analysis.get('risk_score', 0) < 0.7]
-        low_risk = [p for p in posts if p.risk_analysis and p.risk_analysis.get('risk_score', 0) < 0.4]
+        # Categorize by risk level in one pass (unanalyzed posts are skipped)
+        high_risk, medium_risk, low_risk = [], [], []
+        for p in posts:
+            if not p.risk_analysis:
+                continue
+            score = p.risk_analysis.get('risk_score', 0)
+            if score >= 0.7:
+                high_risk.append(p)
+            elif score >= 0.4:
+                medium_risk.append(p)
+            else:
+                low_risk.append(p)
         
         summary = {
             "analysis_info": {
@@ -284,9 +321,9 @@ class RedditHandler:
                 "low_risk_count": len(low_risk),
                 "disclaimer": self.disclaimer.strip()
             },
-            "high_risk_posts": [asdict(p) for p in high_risk],
-            "medium_risk_posts": [asdict(p) for p in medium_risk],
-            "low_risk_posts": [asdict(p) for p in low_risk]
+            "high_risk_posts": high_risk,
+            "medium_risk_posts": medium_risk,
+            "low_risk_posts": low_risk
         }
         
         self.file_manager.save_json(summary, f"{filename}_analyzed", "analyzed")
@@ -5,7 +5,6 @@ Uses the Bot API (simpler, works with bot token from @BotFather)
 import requests
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from dataclasses import asdict
 
 from ..entities.post import TelegramMessage
 from ..utils.hashing import hash_username
@@ -200,6 +199,7 @@ class TelegramBotHandler:
         updates = self.get_updates(limit=limit)
         
         collected_messages = []
+        collected_at = datetime.now().isoformat()
         
         for update in updates:
             message = update.get('message') or update.get('channel_post')
@@ -242,7 +242,7 @@ class TelegramBotHandler:
                 replies=None,
                 media_type=self._get_media_type(message),
                 url=url,
-                collected_at=datetime.now().isoformat(),
+                collected_at=collected_at,
                 platform="telegram"
             )
             
@@ -302,8 +302,7 @@ class TelegramBotHandler:
         """
         saved_files = []
         
-        messages_data = [asdict(msg) for msg in messages]
-        
+        # The JSON writer serializes the dataclasses directly
         json_data = {
             "collection_info": {
                 "collected_at": datetime.now().isoformat(),
@@ -312,14 +311,14 @@ class TelegramBotHandler:
                 "method": "bot_api",
                 "disclaimer": self.disclaimer.strip()
             },
-            "messages": messages_data
+            "messages": messages
         }
         
         json_path = self.file_manager.save_json(json_data, filename, "raw")
         saved_files.append(json_path)
         
         if include_csv:
-            csv_path = self.file_manager.save_csv(messages_data, filename, "raw")
+            csv_path = self.file_manager.save_csv([msg.to_dict() for msg in messages], filename, "raw")
             saved_files.append(csv_path)
         
         return saved_files
@@ -5,7 +5,6 @@ Uses Telethon library for async Telegram API access
 import asyncio
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from dataclasses import asdict
 
 from ..entities.post import TelegramMessage
 from ..entities.analysis import AnalysisResult
@@ -125,6 +124,7 @@ class TelegramHandler:
             }
             
             collected_messages = []
+            collected_at = datetime.now().isoformat()
             
             async for message in self.client.iter_messages(
                 channel,
@@ -153,7 +153,7 @@ class TelegramHandler:
                     replies=getattr(message.replies, 'replies', None) if message.replies else None,
                     media_type=self._get_media_type(message),
                     url=f"https://t.me/{channel_username}/{message.id}",
-                    collected_at=datetime.now().isoformat(),
+                    collected_at=collected_at,
                     platform="telegram"
                 )
                 
@@ -193,6 +193,7 @@ class TelegramHandler:
             }
             
             collected_messages = []
+            collected_at = datetime.now().isoformat()
             
             async for message in self.client.iter_messages(group, limit=limit):
                 await self.rate_limiter.acquire_async()
@@ -216,7 +217,7 @@ class TelegramHandler:
                     replies=getattr(message.replies, 'replies', None) if message.replies else None,
                     media_type=self._get_media_type(message),
                     url=f"https://t.me/c/{message.chat_id}/{message.id}",
-                    collected_at=datetime.now().isoformat(),
+                    collected_at=collected_at,
                     platform="telegram"
                 )
                 
@@ -265,6 +266,7 @@ class TelegramHandler:
             ))
             
             collected_messages = []
+            collected_at = datetime.now().isoformat()
             
             for message in results.messages:
                 if not hasattr(message, 'message') or not message.message:
@@ -286,7 +288,7 @@ class TelegramHandler:
                     replies=None,
                     media_type=None,
                     url="",
-                    collected_at=datetime.now().isoformat(),
+                    collected_at=collected_at,
                     platform="telegram"
                 )
                 
@@ -383,8 +385,7 @@ class TelegramHandler:
         """
         saved_files = []
         
-        messages_data = [asdict(msg) for msg in messages]
-        
+        # The JSON writer serializes the dataclasses directly
         json_data = {
             "collection_info": {
                 "collected_at": datetime.now().isoformat(),
@@ -392,14 +393,14 @@ class TelegramHandler:
                 "platform": "telegram",
                 "disclaimer": self.disclaimer.strip()
             },
-            "messages": messages_data
+            "messages": messages
         }
         
         json_path = self.file_manager.save_json(json_data, filename, "raw")
         saved_files.append(json_path)
         
         if include_csv:
-            csv_path = self.file_manager.save_csv(messages_data, filename, "raw")
+            csv_path = self.file_manager.save_csv([msg.to_dict() for msg in messages], filename, "raw")
             saved_files.append(csv_path)
         
         return saved_files
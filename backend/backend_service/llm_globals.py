@@ -11,6 +11,27 @@ LLM_TIMEOUT = int(os.getenv("LLM_TIMEOUT", "120"))
 LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
 LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0"))
 
+# Max concurrent requests issued by AsyncLLMOperations. The Ollama server only
+# runs them in parallel when started with the same OLLAMA_NUM_PARALLEL value;
+# otherwise requests are queued and served one at a time.
+OLLAMA_NUM_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "4"))
+
+# Response cache for identical (model, system prompt, prompt) requests
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "10000"))
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", "3600"))
+
+# Posts packed into one analyze_batch() prompt by the analysis workflow
+LLM_BATCH_SIZE = int(os.getenv("LLM_BATCH_SIZE", "4"))
+
+# Near-duplicate cache for classify_risk/extract_entities: reuse the verdict
+# for texts whose similarity to a cached text reaches the threshold.
+# LLM_SEMANTIC_CACHE_MODEL optionally names a sentence-transformers model;
+# otherwise cheap hashed word n-gram vectors are used.
+LLM_SEMANTIC_CACHE = os.getenv("LLM_SEMANTIC_CACHE", "false").lower() == "true"
+LLM_SEMANTIC_CACHE_SIZE = int(os.getenv("LLM_SEMANTIC_CACHE_SIZE", "2048"))
+LLM_SEMANTIC_CACHE_THRESHOLD = float(os.getenv("LLM_SEMANTIC_CACHE_THRESHOLD", "0.95"))
+LLM_SEMANTIC_CACHE_MODEL = os.getenv("LLM_SEMANTIC_CACHE_MODEL", "")
+
 # Triage thresholds
 TRIAGE_LOW_THRESHOLD = float(os.getenv("TRIAGE_LOW_THRESHOLD", "0.35"))
 TRIAGE_HIGH_THRESHOLD = float(os.getenv("TRIAGE_HIGH_THRESHOLD", "0.75"))
@@ -77,3 +98,48 @@ FLAGS: {flags}
 Explain each flag in 1-2 sentences.
 """
 
+
+BATCH_ANALYSIS_PROMPT = """You are validating *suspected illegal weapons trade* in academic research text.
+Analyze each ITEM below independently.
+
+Return STRICT JSON exactly with this schema (no prose, no backticks):
+{
+  "results": [
+    {
+      "item": <item number>,
+      "classification": {
+        "final_label": "HIGH"|"MEDIUM"|"LOW",
+        "risk_adjustment": <number between -1.0 and 1.0>,
+        "reasons": ["short bullet 1"],
+        "evidence_spans": ["verbatim span 1"],
+        "misclassification_risk": "LOW"|"MEDIUM"|"HIGH"
+      },
+      "entities": {
+        "weapon_types": [], "weapon_models": [], "locations": [], "contact_methods": [],
+        "prices": [], "quantities": [], "time_references": []
+      },
+      "explanation": "1-2 sentences per rule flag explaining why it was raised"
+    }
+  ]
+}
+
+Return exactly one result per ITEM.
+
+Constraints:
+- Do NOT invent evidence; spans and entities must appear verbatim in the item text.
+- Consider benign contexts (airsoft, cosplay, museums, video games, news quotes) as LOW unless there is clear transaction intent.
+- Strong indicators: weapon mention + transaction intent (buy/sell/price/contact), quantity, shipping/delivery, obfuscation.
+
+ITEMS
+-----
+{items}
+"""
+
+ANALYSIS_ITEM_TEMPLATE = """ITEM {index}:
+TEXT:
+\"\"\"{text}\"\"\"
+RULE_FLAGS: {rule_flags}
+KEYWORDS: {keywords}
+PATTERNS: {patterns}
+CURRENT_RULE_RISK: {rule_risk}
+"""
@@ -5,10 +5,16 @@ Utils Module - Utility functions
 from .hashing import hash_username, hash_content
 from .rate_limiter import RateLimiter
 from .file_manager import FileManager
+from .cache import TTLCache, SemanticCache
+from .timestamps import iso_now
+from . import jsonio
 
 __all__ = [
     "hash_username", "hash_content",
     "RateLimiter",
-    "FileManager"
+    "FileManager",
+    "TTLCache", "SemanticCache",
+    "iso_now",
+    "jsonio"
 ]
 
@@ -0,0 +1,203 @@
+"""
+In-memory caching utilities
+"""
+import math
+import re
+import time
+import threading
+from collections import OrderedDict, defaultdict
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple, Union
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with per-entry time-to-live
+    
+    Entries expire `ttl` seconds after insertion. When the cache is
+    full the least recently used entry is evicted.
+    """
+    
+    def __init__(self, maxsize: int = 10_000, ttl: Optional[float] = 3600):
+        """
+        Initialize the cache
+        
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Entry lifetime in seconds (None for no expiry)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, or default on miss/expiry"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return default
+            
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Insert or replace a cached value"""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_MISSING = object()
+
+_WORD_RE = re.compile(r"\w+")
+
+Embedding = Union[Dict[int, float], Sequence[float]]
+
+
+def hashed_ngram_embedding(text: str, dim: int = 1024) -> Dict[int, float]:
+    """
+    Cheap sparse text embedding: hashed word unigrams and bigrams, L2-normalized
+    
+    Python's str hash is salted per process, so vectors are only
+    comparable within one process - which is all an in-memory cache needs.
+    """
+    tokens = _WORD_RE.findall(text.lower())
+    counts: Dict[int, float] = defaultdict(float)
+    for token in tokens:
+        counts[hash(token) % dim] += 1.0
+    for pair in zip(tokens, tokens[1:]):
+        counts[hash(pair) % dim] += 1.0
+    
+    norm = math.sqrt(sum(v * v for v in counts.values()))
+    if not norm:
+        return {}
+    return {k: v / norm for k, v in counts.items()}
+
+
+def _cosine(a: Embedding, b: Embedding) -> float:
+    """Dot product of two L2-normalized embeddings (sparse dicts or dense sequences)"""
+    if isinstance(a, dict):
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(v * b.get(k, 0.0) for k, v in a.items())
+    return float(sum(x * y for x, y in zip(a, b)))
+
+
+def load_embedder(model_name: str) -> Optional[Callable[[str], Embedding]]:
+    """
+    sentence-transformers encoder for SemanticCache
+    
+    Returns None (use the hashed n-gram default) when no model is named or
+    sentence-transformers is not installed.
+    """
+    if not model_name:
+        return None
+    try:
+        from sentence_transformers import SentenceTransformer
+        model = SentenceTransformer(model_name)
+    except ImportError:
+        print("Warning: sentence-transformers not installed. Using hashed n-gram similarity.")
+        return None
+    return lambda text: model.encode(text, normalize_embeddings=True).tolist()
+
+
+class SemanticCache:
+    """
+    Thread-safe LRU cache keyed by text similarity
+    
+    A lookup returns the value of the most similar cached text when its
+    cosine similarity reaches `threshold`, so near-duplicate inputs
+    (reposted or lightly rephrased content) reuse an earlier result.
+    """
+    
+    def __init__(
+        self,
+        maxsize: int = 2048,
+        threshold: float = 0.95,
+        embed: Optional[Callable[[str], Embedding]] = None
+    ):
+        """
+        Initialize the cache
+        
+        Args:
+            maxsize: Maximum number of entries
+            threshold: Minimum cosine similarity for a hit
+            embed: Text -> L2-normalized embedding (defaults to hashed_ngram_embedding)
+        """
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self._embed = embed or hashed_ngram_embedding
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[str, Tuple[Embedding, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, text: str, default: Any = None) -> Any:
+        """Get the value cached for `text` or a near-duplicate of it"""
+        with self._lock:
+            entry = self._data.get(text)
+            if entry is not None:
+                self._data.move_to_end(text)
+                self.hits += 1
+                return entry[1]
+        
+        vector = self._embed(text)
+        best_key, best_score = None, self.threshold
+        with self._lock:
+            for key, (other, _) in self._data.items():
+                score = _cosine(vector, other)
+                if score >= best_score:
+                    best_key, best_score = key, score
+            
+            if best_key is None:
+                self.misses += 1
+                return default
+            
+            self._data.move_to_end(best_key)
+            self.hits += 1
+            return self._data[best_key][1]
+    
+    def set(self, text: str, value: Any) -> None:
+        """Cache a value for `text`"""
+        vector = self._embed(text)
+        with self._lock:
+            self._data[text] = (vector, value)
+            self._data.move_to_end(text)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._data)
@@ -9,6 +9,8 @@ from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 
+from . import jsonio
+
 
 class FileManager:
     """
@@ -50,8 +52,7 @@ class FileManager:
         target_dir = dir_map.get(directory, self.raw_dir)
         filepath = target_dir / f"{filename}.json"
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+        jsonio.dump_file(data, filepath)
         
         return str(filepath)
     
@@ -134,8 +135,7 @@ class FileManager:
         if not filepath.exists():
             return None
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return jsonio.load_file(filepath)
     
     def list_files(self, directory: str = "raw", extension: str = None) -> List[str]:
         """
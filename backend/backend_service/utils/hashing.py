@@ -2,9 +2,17 @@
 Hashing utilities for privacy protection
 """
 import hashlib
+import re
+from collections import Counter
 from typing import Optional
 
 
+_TOKEN_RE = re.compile(r"\w+")
+
+# Differing bits up to which two SimHash fingerprints are near-duplicates
+SIMHASH_MAX_DISTANCE = 3
+
+
 def hash_username(username: str, salt: str = "") -> str:
     """
     Hash usernames for privacy protection
@@ -82,3 +90,72 @@ def hash_phone(phone: str) -> str:
     hidden_part = hashlib.sha256(digits[:-4].encode()).hexdigest()[:4]
     return f"***{hidden_part}{digits[-4:]}"
 
+
+
+def simhash64(text: str) -> int:
+    """
+    64-bit SimHash of text for near-duplicate detection
+    
+    Word tokens are weighted by frequency, so texts differing only in
+    case, punctuation or whitespace hash identically and small edits
+    flip few bits.
+    
+    Args:
+        text: The text to hash
+    
+    Returns:
+        Unsigned 64-bit fingerprint (0 for text without words)
+    """
+    lanes = [0] * 64
+    for token, weight in Counter(_TOKEN_RE.findall(text.lower())).items():
+        h = int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), 'little')
+        for bit in range(64):
+            if h >> bit & 1:
+                lanes[bit] += weight
+            else:
+                lanes[bit] -= weight
+    
+    fingerprint = 0
+    for bit, lane in enumerate(lanes):
+        if lane > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+class SimHashIndex:
+    """
+    Set of SimHash fingerprints with near-duplicate lookup
+    
+    Fingerprints are split into max_distance + 1 bands; two fingerprints
+    within max_distance bits of each other agree on at least one band, so
+    only the fingerprints sharing a band value are compared.
+    """
+    
+    def __init__(self, max_distance: int = SIMHASH_MAX_DISTANCE):
+        """
+        Initialize the index
+        
+        Args:
+            max_distance: Largest Hamming distance counted as a near-duplicate
+        """
+        self.max_distance = max_distance
+        bands = max_distance + 1
+        bounds = [64 * i // bands for i in range(bands + 1)]
+        self._bands = [(lo, (1 << (hi - lo)) - 1) for lo, hi in zip(bounds, bounds[1:])]
+        self._buckets = [{} for _ in self._bands]
+    
+    def add(self, fingerprint: int) -> bool:
+        """
+        Store a fingerprint unless a near-duplicate is already stored
+        
+        Returns:
+            True if the fingerprint was new and stored
+        """
+        keys = [fingerprint >> lo & mask for lo, mask in self._bands]
+        for buckets, key in zip(self._buckets, keys):
+            for other in buckets.get(key, ()):
+                if (fingerprint ^ other).bit_count() <= self.max_distance:
+                    return False
+        for buckets, key in zip(self._buckets, keys):
+            buckets.setdefault(key, []).append(fingerprint)
+        return True
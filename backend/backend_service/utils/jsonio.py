@@ -0,0 +1,84 @@
+"""
+JSON encode/decode helpers with an optional orjson fast path
+"""
+import json
+import mmap
+from dataclasses import asdict, is_dataclass
+from pathlib import Path
+from typing import Any, Union
+
+try:
+    import orjson
+    # numpy arrays/scalars serialize natively; int/float dict keys are
+    # stringified like the json module does
+    _DUMPS_OPTION = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
+
+
+# Raised by loads()/load_file() on malformed input (orjson's error subclasses it)
+JSONDecodeError = json.JSONDecodeError
+
+
+def _default(obj: Any) -> Any:
+    """json fallback for types orjson handles natively (dataclasses) or via str()"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    return str(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON from str or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes
+    
+    Args:
+        obj: Object to serialize; dataclass instances are written field
+            by field and other non-JSON types are converted with str()
+        indent: Pretty-print with 2-space indentation
+    """
+    if orjson is not None:
+        option = _DUMPS_OPTION | orjson.OPT_INDENT_2 if indent else _DUMPS_OPTION
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        ensure_ascii=False,
+        default=_default
+    ).encode('utf-8')
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """
+    Read and parse a JSON file in one pass over its bytes
+    
+    With orjson the file is memory-mapped and parsed straight from the page
+    cache, so large collections are not first copied into a bytes object.
+    """
+    with open(path, 'rb') as f:
+        if orjson is None:
+            return loads(f.read())
+        
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return loads(f.read())
+        
+        with mm:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def dump_file(obj: Any, path: Union[str, Path], indent: bool = True) -> None:
+    """Serialize obj and write it to path"""
+    with open(path, 'wb') as f:
+        f.write(dumps(obj, indent=indent))
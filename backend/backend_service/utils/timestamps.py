@@ -0,0 +1,32 @@
+"""
+Timestamp helpers
+"""
+import time
+from datetime import datetime
+
+
+# (time_ns, formatted) of the last iso_now() call, swapped as one tuple so
+# concurrent callers never see a time paired with another time's string
+_last = (0, "")
+
+# How long a formatted timestamp is reused
+_RESOLUTION_NS = 1_000_000
+
+
+def iso_now() -> str:
+    """
+    Local time as an ISO 8601 string, like datetime.now().isoformat()
+    
+    The formatted string is reused for calls within the same millisecond,
+    which is all the precision response timestamps need; a reuse costs a
+    clock read instead of a datetime construction and format.
+    """
+    global _last
+    now_ns = time.time_ns()
+    last_ns, last_iso = _last
+    if now_ns - last_ns < _RESOLUTION_NS:
+        return last_iso
+    
+    iso = datetime.fromtimestamp(now_ns / 1e9).isoformat()
+    _last = (now_ns, iso)
+    return iso
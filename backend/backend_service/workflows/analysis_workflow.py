@@ -12,6 +12,7 @@ from ..handlers.analysis_handler import AnalysisHandler
 from ..core.detector import WeaponsDetector
 from ..utils.file_manager import FileManager
 from ..config import config
+from ..llm_globals import LLM_BATCH_SIZE
 
 
 @dataclass
@@ -132,33 +133,40 @@ class AnalysisWorkflow:
         self, 
         posts: List[Union[RedditPost, TelegramMessage]]
     ) -> List[Dict[str, Any]]:
-        """Extract entities from high-risk posts"""
-        entities = []
+        """Extract entities from high-risk posts, LLM_BATCH_SIZE posts per LLM call"""
+        candidates = [
+            post for post in posts
+            if post.risk_analysis
+            and post.risk_analysis.get('risk_score', 0) >= self.config.high_risk_threshold
+        ]
         
-        for post in posts:
-            if not post.risk_analysis:
-                continue
-            
-            score = post.risk_analysis.get('risk_score', 0)
-            if score < self.config.high_risk_threshold:
-                continue
+        entities = []
+        for start in range(0, len(candidates), LLM_BATCH_SIZE):
+            batch = candidates[start:start + LLM_BATCH_SIZE]
             
             # Get content
-            if isinstance(post, RedditPost):
-                content = f"{post.title}. {post.content}"
-            else:
-                content = post.content
+            texts = [
+                f"{post.title}. {post.content}" if isinstance(post, RedditPost) else post.content
+                for post in batch
+            ]
+            rule_results = [AnalysisResult(**post.risk_analysis) for post in batch]
             
             try:
-                extracted = self.llm_ops.extract_entities(content)
-                entities.append({
+                results = self.llm_ops.analyze_batch(texts, rule_results)
+            except Exception as e:
+                print(f"Entity extraction failed for {', '.join(post.id for post in batch)}: {e}")
+                continue
+            
+            for post, (_, extracted, explanation) in zip(batch, results):
+                entry = {
                     "post_id": post.id,
                     "platform": post.platform,
-                    "risk_score": score,
+                    "risk_score": post.risk_analysis['risk_score'],
                     "entities": extracted.to_dict()
-                })
-            except Exception as e:
-                print(f"Entity extraction failed for {post.id}: {e}")
+                }
+                if self.config.generate_explanations:
+                    entry["explanation"] = explanation
+                entities.append(entry)
         
         return entities
     
@@ -211,8 +219,6 @@ class AnalysisWorkflow:
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
         # Save full results
-        from dataclasses import asdict
-        
         output_data = {
             "workflow_id": results["workflow_id"],
             "started_at": results["started_at"],
@@ -224,7 +230,7 @@ class AnalysisWorkflow:
         }
         
         for post in results["analyzed_posts"]:
-            post_data = asdict(post)
+            post_data = post.to_dict()
             score = post.risk_analysis.get('risk_score', 0) if post.risk_analysis else 0
             
             if score >= self.config.high_risk_threshold:
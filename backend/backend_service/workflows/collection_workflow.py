@@ -215,7 +215,6 @@ class CollectionWorkflow:
         
         # Save Reddit posts
         if results["reddit_posts"]:
-            from dataclasses import asdict
             reddit_data = {
                 "collection_info": {
                     "workflow_id": results["workflow_id"],
@@ -223,14 +222,13 @@ class CollectionWorkflow:
                     "platform": "reddit",
                     "count": len(results["reddit_posts"])
                 },
-                "posts": [asdict(p) for p in results["reddit_posts"]]
+                "posts": results["reddit_posts"]
             }
             path = self.file_manager.save_json(reddit_data, f"{prefix}_reddit", "raw")
             saved_files.append(path)
         
         # Save Telegram messages
         if results["telegram_messages"]:
-            from dataclasses import asdict
             telegram_data = {
                 "collection_info": {
                     "workflow_id": results["workflow_id"],
@@ -238,7 +236,7 @@ class CollectionWorkflow:
                     "platform": "telegram",
                     "count": len(results["telegram_messages"])
                 },
-                "messages": [asdict(m) for m in results["telegram_messages"]]
+                "messages": results["telegram_messages"]
             }
             path = self.file_manager.save_json(telegram_data, f"{prefix}_telegram", "raw")
             saved_files.append(path)
@@ -85,6 +85,9 @@ class WeaponsTextAnalyzer:
             r'\b(?:self\s+defense|protection|security)\s+(?:weapon|gun|firearm)\b',
             r'\b(?:hunting|sport|target\s+practice)\s+(?:rifle|gun|firearm)\b'
         ]
+        
+        # Transaction words that combine with weapon keywords
+        self.intent_words = ('buy', 'sell', 'trade', 'purchase', 'want', 'need', 'get')
     
     def clean_text(self, text: str) -> str:
         """Clean and normalize text for analysis"""
@@ -111,6 +114,7 @@ class WeaponsTextAnalyzer:
         }
         
         # Check for high-risk keywords (each adds significant risk)
+        found_categories = set()
         for category, keywords in self.high_risk_keywords.items():
             found_keywords = []
             for keyword in keywords:
@@ -120,6 +124,7 @@ class WeaponsTextAnalyzer:
                     results['flags'].append(f"HIGH RISK: Detected {category} keyword '{keyword}'")
             
             if found_keywords:
+                found_categories.add(category)
                 results['detected_keywords'].append(f"{category}: {', '.join(found_keywords)}")
         
         # Check for high-risk patterns (each adds major risk)
@@ -140,13 +145,11 @@ class WeaponsTextAnalyzer:
                     results['risk_score'] += 0.3  # Medium risk patterns
                     results['flags'].append(f"MEDIUM RISK: Pattern detected: '{match}'")
         
-        # Special combinations that boost risk
-        has_weapon_keyword = any(category in ['firearms', 'explosives'] 
-                               for category in self.high_risk_keywords.keys() 
-                               if any(kw in cleaned_text for kw in self.high_risk_keywords[category]))
-        
-        has_buy_sell_intent = any(word in cleaned_text for word in ['buy', 'sell', 'trade', 'purchase', 'want', 'need', 'get'])
-        has_violence_keyword = any(kw in cleaned_text for kw in self.high_risk_keywords['violence'])
+        # Special combinations that boost risk (categories come from the
+        # keyword scan above rather than a second pass over every list)
+        has_weapon_keyword = not found_categories.isdisjoint(('firearms', 'explosives'))
+        has_buy_sell_intent = any(word in cleaned_text for word in self.intent_words)
+        has_violence_keyword = 'violence' in found_categories
         
         # Boost score for dangerous combinations
         if has_weapon_keyword and has_buy_sell_intent:
@@ -8,7 +8,7 @@ import os
 import hashlib
 from dataclasses import dataclass, asdict
 
-@dataclass
+@dataclass(slots=True)
 class RedditPost:
     """Data structure for collected Reddit posts"""
     id: str
@@ -262,10 +262,18 @@ class AcademicRedditCollector:
         """Save analyzed posts with risk assessments"""
         filepath = os.path.join(self.data_dir, "analyzed_posts", f"{filename}_analyzed.json")
         
-        # Separate posts by risk level
-        high_risk = [p for p in posts if p.risk_analysis and p.risk_analysis.get('risk_score', 0) >= 0.7]
-        medium_risk = [p for p in posts if p.risk_analysis and 0.4 <= p.risk_analysis.get('risk_score', 0) < 0.7]
-        low_risk = [p for p in posts if p.risk_analysis and p.risk_analysis.get('risk_score', 0) < 0.4]
+        # Separate posts by risk level in one pass (unanalyzed posts are skipped)
+        high_risk, medium_risk, low_risk = [], [], []
+        for p in posts:
+            if not p.risk_analysis:
+                continue
+            score = p.risk_analysis.get('risk_score', 0)
+            if score >= 0.7:
+                high_risk.append(p)
+            elif score >= 0.4:
+                medium_risk.append(p)
+            else:
+                low_risk.append(p)
         
         analysis_summary = {
             "analysis_info": {
@@ -0,0 +1,204 @@
+"""
+Tests for LLM operations helpers (no network access required)
+"""
+import asyncio
+import json
+import pytest
+import sys
+import os
+
+# Add backend_service to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend_service._ai_operations import LLMOperations, AsyncLLMOperations, _extract_json_object
+from backend_service.entities.analysis import AnalysisResult
+
+
+class TestJsonParsing:
+    """Tests for parsing JSON out of LLM replies"""
+    
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.ops = LLMOperations(base_url="http://localhost:0")
+    
+    def test_direct_json(self):
+        """Test that plain JSON is parsed directly"""
+        assert self.ops._safe_json_parse('{"final_label": "HIGH"}') == {"final_label": "HIGH"}
+    
+    def test_json_wrapped_in_prose(self):
+        """Test extraction of a JSON object surrounded by text"""
+        text = 'Here you go: {"a": {"b": 1}, "c": "}"} hope that helps {x}'
+        assert self.ops._safe_json_parse(text) == {"a": {"b": 1}, "c": "}"}
+    
+    def test_json_in_code_fence(self):
+        """Test that fenced JSON replies are parsed"""
+        text = 'Sure:\n```json\n{"a": {"b": 1}}\n```\n'
+        assert self.ops._safe_json_parse(text) == {"a": {"b": 1}}
+    
+    def test_escaped_quotes_in_strings(self):
+        """Test that escaped quotes do not end a string early"""
+        text = 'reply {"reason": "said \\"{\\" here"} done'
+        assert _extract_json_object(text) == '{"reason": "said \\"{\\" here"}'
+    
+    def test_unbalanced_falls_back(self):
+        """Test that unparseable replies return the fallback verdict"""
+        result = self.ops._safe_json_parse("no json here {")
+        assert result["reasons"] == ["fallback-parser"]
+        assert _extract_json_object("nothing") is None
+
+
+
+class TestPromptTemplates:
+    """Tests for precompiled prompt templates"""
+    
+    def test_classification_prompt_renders(self):
+        """Test that placeholders are filled and JSON braces kept"""
+        ops = LLMOperations(base_url="http://localhost:0")
+        rule_result = AnalysisResult(
+            risk_score=0.5,
+            confidence=0.9,
+            flags=["flag"],
+            detected_keywords=["firearms: gun"],
+            detected_patterns=[],
+            analysis_time="2024-01-01T00:00:00"
+        )
+        prompt, system_prompt = ops._classification_request("selling a gun", rule_result)
+        assert '"final_label": "HIGH"|"MEDIUM"|"LOW"' in prompt
+        assert '"""selling a gun"""' in prompt
+        assert "CURRENT_RULE_RISK: 0.5" in prompt
+        assert "{text}" not in prompt
+    
+    def test_entity_prompt_renders(self):
+        """Test entity extraction prompt rendering"""
+        ops = LLMOperations(base_url="http://localhost:0")
+        prompt, _ = ops._entities_request("meet at the dock")
+        assert '"weapon_types"' in prompt
+        assert "meet at the dock" in prompt
+
+
+class TestCombinedAnalysis:
+    """Tests for batched combined analysis"""
+    
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.ops = LLMOperations(base_url="http://localhost:0")
+        self.rule_result = AnalysisResult(
+            risk_score=0.5,
+            confidence=0.9,
+            flags=["flag"],
+            detected_keywords=[],
+            detected_patterns=[],
+            analysis_time="2024-01-01T00:00:00"
+        )
+        self.prompts = []
+    
+    def _respond_with(self, response):
+        def fake_call(prompt, system_prompt=None):
+            self.prompts.append(prompt)
+            return response
+        self.ops._call_ollama = fake_call
+    
+    def test_analyze_batch_maps_items(self):
+        """Test that batch results are matched by item number"""
+        self._respond_with({"results": [
+            {"item": 2, "classification": {"final_label": "HIGH"}, "explanation": "b"}
+        ]})
+        results = self.ops.analyze_batch(["a", "b"], [self.rule_result, self.rule_result])
+        assert len(self.prompts) == 1
+        assert "ITEM 1:" in self.prompts[0] and "ITEM 2:" in self.prompts[0]
+        assert results[1][0].final_label == "HIGH"
+        assert results[1][2] == "b"
+        assert results[0][0].final_label == "MEDIUM"
+
+
+class TestAvailability:
+    """Tests for the cached health check"""
+    
+    def test_is_available_cached(self):
+        """Test that repeated checks within the TTL reuse one probe"""
+        ops = LLMOperations(base_url="http://localhost:0")
+        calls = []
+        
+        class FakeSession:
+            def get(self, url, timeout=None):
+                calls.append(url)
+                return type("Response", (), {"status_code": 200})()
+        
+        ops._requests = object()
+        ops._session = FakeSession()
+        assert ops.is_available() is True
+        assert ops.is_available() is True
+        assert len(calls) == 1
+    
+    def test_background_health_monitor(self):
+        """Test that the async client serves availability from its monitor"""
+        async def scenario():
+            ops = AsyncLLMOperations(base_url="http://localhost:0")
+            
+            async def probe():
+                return True
+            
+            ops._probe = probe
+            ops.start_health_monitor(interval=60)
+            await asyncio.sleep(0)
+            available = ops.is_available()
+            await ops.aclose()
+            return available
+        
+        assert asyncio.run(scenario()) is True
+
+
+
+class TestReplyCache:
+    """Tests for the in-process LLM reply cache"""
+    
+    def setup_method(self):
+        """Setup an LLMOperations instance with a scripted chat endpoint"""
+        self.ops = LLMOperations(base_url="http://localhost:0")
+        self.replies = []
+        self.posts = []
+        
+        def post_chat(data=None):
+            self.posts.append(data)
+            body = json.dumps({"message": {"content": self.replies.pop(0)}}).encode()
+            return type("Response", (), {"content": body, "raise_for_status": lambda self: None})()
+        
+        self.ops._requests = object()
+        self.ops._post_chat = post_chat
+    
+    def test_fallback_reply_not_cached(self):
+        """Test that an unparseable reply is retried instead of cached"""
+        self.replies = ["not json", '{"final_label": "HIGH"}']
+        assert self.ops._call_ollama("p")["reasons"] == ["fallback-parser"]
+        assert self.ops._call_ollama("p") == {"final_label": "HIGH"}
+        assert len(self.posts) == 2
+    
+    def test_cached_reply_isolated_from_callers(self):
+        """Test that mutating a returned result does not change later hits"""
+        self.replies = ['{"reasons": ["a"]}']
+        first = self.ops._call_ollama("p")
+        first["reasons"].append("mutated")
+        assert self.ops._call_ollama("p") == {"reasons": ["a"]}
+        assert len(self.posts) == 1
+    
+    def test_async_classify_uses_semantic_cache(self):
+        """Test the async path reuses verdicts stored by the sync path"""
+        ops = AsyncLLMOperations(base_url="http://localhost:0")
+        ops._semantic = ops._build_semantic_caches()
+        rule_result = AnalysisResult(
+            risk_score=0.5, confidence=0.9, flags=[], detected_keywords=[],
+            detected_patterns=[], analysis_time=""
+        )
+        ops._call_ollama_parsed = lambda prompt, system_prompt=None: {"final_label": "HIGH"}
+        assert ops.classify_risk("WTS glock 19, DM me", rule_result).final_label == "HIGH"
+        
+        async def unreachable(prompt, system_prompt=None):
+            raise AssertionError("semantic cache should have answered")
+        
+        ops._acall_ollama_parsed = unreachable
+        classification = asyncio.run(ops.aclassify_risk("WTS glock 19, DM me", rule_result))
+        assert classification.final_label == "HIGH"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -63,6 +63,20 @@ class TestTextAnalyzer:
         # Third should be low risk
         assert results[2].risk_score < 0.4
     
+    def test_threaded_batch_matches_sequential(self):
+        """Test threaded batch analysis keeps input order and results"""
+        texts = ["Looking to sell my glock", "Hello world", "cash only, ar15 for sale"] * 5
+        sequential = self.analyzer.analyze_batch(texts, max_workers=1)
+        threaded = self.analyzer.analyze_batch(texts, max_workers=4)
+        
+        assert [r.risk_score for r in threaded] == [r.risk_score for r in sequential]
+        assert [r.flags for r in threaded] == [r.flags for r in sequential]
+    
+    def test_batch_shares_timestamp(self):
+        """Test a batch records one analysis time for all texts"""
+        results = self.analyzer.analyze_batch(["Hello world", "Looking to sell my glock"])
+        assert results[0].analysis_time == results[1].analysis_time
+    
     def test_empty_text(self):
         """Test handling of empty text"""
         result = self.analyzer.analyze_text("")
@@ -79,6 +93,68 @@ class TestTextAnalyzer:
         assert result.analysis_time is not None
         assert len(result.analysis_time) > 0
 
+    def test_high_risk_prefilter(self):
+        """Test that texts rejected by the pre-filter score zero"""
+        texts = [
+            "Selling an AK-47, DM me",
+            "Weather is great, going for a walk",
+            "Need a weapon",
+            "The museum opened a new wing",
+            "Self defense firearm question",
+        ]
+        for text in texts:
+            if not self.analyzer.may_be_high_risk(text):
+                assert self.analyzer.analyze_text(text).risk_score == 0
+        
+        assert self.analyzer.may_be_high_risk("Selling an AK-47, DM me")
+        assert not self.analyzer.may_be_high_risk("The museum opened a new wing")
+    
+    def test_keywords_match_at_word_start(self):
+        """Test keywords count only where a word starts, so plurals still match"""
+        assert "violence: ice" not in self.analyzer.analyze_text("Weather is nice today").detected_keywords
+        assert self.analyzer.analyze_text("Weather is nice today").risk_score == 0.0
+        assert not self.analyzer.may_be_high_risk("Weather is nice today")
+        
+        result = self.analyzer.analyze_text("two guns for sale")
+        assert "firearms: gun" in result.detected_keywords
+        assert self.analyzer.may_be_high_risk("two guns for sale")
+    
+    def test_pattern_anchor_only_text(self):
+        """Test a pattern whose anchor is not itself a keyword still matches"""
+        result = self.analyzer.analyze_text("No question about it, that was fun")
+        assert "no question" in result.detected_patterns
+    
+    def test_keyword_flags_shared_across_instances(self):
+        """Test keyword flags are the same string objects for every analyzer"""
+        first = self.analyzer.analyze_text("selling a glock").flags[0]
+        second = TextAnalyzer().analyze_text("selling a glock").flags[0]
+        assert first == "HIGH RISK: Detected firearms keyword 'glock'"
+        assert first is second
+    
+    def test_pattern_without_keyword_anchor_still_matches(self):
+        """Test 'ammunition' reaches the pattern gate though no anchor literal like 'ammo' is in it"""
+        result = self.analyzer.analyze_text("selling ammunition")
+        assert result.detected_patterns == ["selling ammunition"]
+        assert result.risk_score == 1.0
+        assert "ammunition" in self.analyzer.pattern_anchors
+    
+    def test_unmatchable_text_scores_zero(self):
+        """Test short, emoji-only and non-Latin texts short-circuit to a zero score"""
+        assert self.analyzer.min_keyword_len == 2
+        for text in ("k", "👍🔥", "!!!", "Привет, как дела?"):
+            result = self.analyzer.analyze_text(text)
+            assert result.risk_score == 0.0
+            assert result.flags == []
+        
+        assert self.analyzer.analyze_text("C4!").risk_score >= 0.7
+    
+    def test_compiled_rules_shared_across_instances(self):
+        """Test a new analyzer reuses the compiled patterns and keyword matcher"""
+        other = TextAnalyzer()
+        assert other._keyword_matcher is self.analyzer._keyword_matcher
+        assert other._text_patterns[0] is self.analyzer._text_patterns[0]
+        assert other._seed_regex is self.analyzer._seed_regex
+
 
 class TestRiskScorer:
     """Tests for RiskScorer class"""
@@ -111,6 +187,69 @@ class TestRiskScorer:
         assert not self.scorer.should_use_llm(0.5, llm_enabled=False)
 
 
+
+class TestWeaponsDetector:
+    """Tests for WeaponsDetector result caching"""
+    
+    def setup_method(self):
+        """Setup test fixtures"""
+        from backend_service.core.detector import WeaponsDetector
+        self.detector = WeaponsDetector()
+    
+    def test_repeated_content_reuses_result(self, monkeypatch):
+        """Test identical content skips the rule analysis the second time"""
+        calls = []
+        analyze_text = self.detector.analyzer.analyze_text
+        monkeypatch.setattr(
+            self.detector.analyzer, "analyze_text",
+            lambda text: calls.append(text) or analyze_text(text)
+        )
+        
+        first = self.detector.analyze("Selling my glock, cash only")
+        second = self.detector.analyze("Selling my glock, cash only")
+        
+        assert len(calls) == 1
+        assert second.content_hash == first.content_hash
+        assert second.result.risk_score == first.result.risk_score
+    
+    def test_cached_result_is_fresh_copy(self):
+        """Test a cache hit gets its own lists and timestamp"""
+        first = self.detector.analyze("Selling my glock, cash only")
+        first.result.flags.append("mutated")
+        second = self.detector.analyze("Selling my glock, cash only")
+        
+        assert "mutated" not in second.result.flags
+        assert second.result is not first.result
+        assert second.result.analysis_time >= first.result.analysis_time
+    
+    def test_llm_setting_is_part_of_key(self):
+        """Test cached rules-only results are not reused for LLM requests"""
+        self.detector.analyze("Selling my glock", use_llm_override=False)
+        assert len(self.detector._result_cache) == 1
+        
+        self.detector.analyze("Selling my glock", use_llm_override=True)
+        assert len(self.detector._result_cache) == 2
+    
+    def test_is_high_risk_matches_full_analysis(self):
+        """Test the short-circuit agrees with the full score threshold"""
+        for text in ("Hello world", "a weapon", "selling my glock", "nice weather", "cash only"):
+            expected = self.detector.analyze(text).result.risk_score >= 0.7
+            assert self.detector.is_high_risk(text) == expected
+    
+    def test_analysis_ids_unique(self):
+        """Test analyses within the same second get distinct ids"""
+        ids = {self.detector.analyze("Hello world").analysis_id for _ in range(3)}
+        assert len(ids) == 3
+    
+    def test_batch_hashes_match_single_analysis(self):
+        """Test batch analysis records the same content hashes as analyze()"""
+        texts = ["Selling my glock", "Hello world", "Selling my glock"]
+        batch = self.detector.analyze_batch(texts)
+        
+        assert [a.content_hash for a in batch] == [self.detector.analyze(t).content_hash for t in texts]
+        assert batch[2].result.risk_score == batch[0].result.risk_score
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
 
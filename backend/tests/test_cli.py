@@ -0,0 +1,141 @@
+"""
+Tests for CLI argument parsing
+"""
+import pytest
+import sys
+import os
+
+# Add backend_service to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend_service.cli import analyze, collect
+from backend_service.cli._argv import fast_parse
+from backend_service.cli.analyze import _match_files
+
+
+class TestFastParse:
+    """Tests that the fast parser matches argparse"""
+    
+    def _assert_matches_argparse(self, commands, dest, parser, argv):
+        fast = fast_parse(commands, dest, argv)
+        assert fast is not None
+        assert vars(fast) == vars(parser.parse_args(argv))
+    
+    def test_analyze_commands(self):
+        """Test analyze subcommands against argparse"""
+        parser = analyze.AnalysisCLI().parser
+        for argv in (
+            ["file", "data_raw.json", "--use-llm", "-o", "out"],
+            ["text", "selling a rifle", "-v"],
+            ["batch", "data", "--pattern", "*.json"],
+            ["summary", "data"],
+        ):
+            self._assert_matches_argparse(analyze.COMMANDS, "command", parser, argv)
+    
+    def test_collect_commands(self):
+        """Test collect subcommands against argparse"""
+        parser = collect.CollectionCLI().parser
+        for argv in (
+            ["reddit"],
+            ["reddit", "-s", "news", "guns", "-t", "week", "-l", "5", "--analyze"],
+            ["telegram", "-g", "-1001234", "42", "-c", "channel", "--search-global"],
+            ["telegram", "--limit=7", "-o", "out"],
+        ):
+            self._assert_matches_argparse(collect.COMMANDS, "platform", parser, argv)
+    
+    def test_defers_to_argparse(self):
+        """Test that help, errors and abbreviations fall back to argparse"""
+        for argv in (
+            [],
+            ["reddit", "-h"],
+            ["reddit", "-t", "decade"],
+            ["telegram", "-g", "abc"],
+            ["reddit", "--sub", "news"],
+        ):
+            assert fast_parse(collect.COMMANDS, "platform", argv) is None
+        
+        assert fast_parse(analyze.COMMANDS, "command", ["text"]) is None
+        assert fast_parse(analyze.COMMANDS, "command", ["file", "a", "b"]) is None
+    
+    def test_defaults_not_shared(self):
+        """Test that list defaults are copied per parse"""
+        first = fast_parse(collect.COMMANDS, "platform", ["telegram"])
+        first.channels.append("x")
+        second = fast_parse(collect.COMMANDS, "platform", ["telegram"])
+        assert second.channels == []
+    
+    def test_parser_shared_between_instances(self):
+        """Test the argparse fallback is built once per CLI class"""
+        assert analyze.AnalysisCLI().parser is analyze.AnalysisCLI().parser
+        assert collect.CollectionCLI().parser is collect.CollectionCLI().parser
+
+
+class TestMatchFiles:
+    """Tests for batch file discovery"""
+    
+    def test_matches_like_glob(self, tmp_path):
+        """Test pattern matching and hidden-file handling"""
+        for name in ("a_raw.json", "b_raw.json", "a_analyzed.json", ".c_raw.json"):
+            (tmp_path / name).write_text("{}")
+        
+        found = sorted(os.path.basename(p) for p in _match_files(tmp_path, "*_raw.json"))
+        assert found == ["a_raw.json", "b_raw.json"]
+
+
+class FakeHandler:
+    """Records the posts an analysis run receives"""
+    
+    def __init__(self):
+        self.posts = []
+    
+    def analyze_posts_batch(self, posts):
+        self.posts.extend(posts)
+        return posts
+    
+    def save_analysis_results(self, posts, output_name):
+        return {
+            "total_posts": len(posts),
+            "risk_distribution": {
+                "high_risk": 0, "medium_risk": 0, "low_risk": 0, "high_risk_percentage": 0
+            }
+        }
+
+
+class TestAnalyzeFile:
+    """Tests for 'analyze file'"""
+    
+    def test_mixed_platform_file(self, tmp_path):
+        """Test each record is built as its own platform's post type"""
+        path = tmp_path / "mixed_raw.json"
+        path.write_text(
+            '{"posts": [{"id": "r1", "title": "t", "content": "a", "subreddit": "guns"},'
+            ' {"id": "m1", "content": "b", "chat_id": 7, "chat_title": "market"}]}'
+        )
+        handler = FakeHandler()
+        args = analyze._file_args(str(path))
+        analyze.AnalysisCLI()._analyze_file(args, handler=handler)
+        
+        assert [p.platform for p in handler.posts] == ["reddit", "telegram"]
+        assert handler.posts[1].chat_id == 7
+
+    
+    def test_batch_continues_after_bad_file(self, tmp_path, monkeypatch, capsys):
+        """Test a failing file is reported and the rest run, in input order"""
+        (tmp_path / "a_raw.json").write_text('{"posts": []}')
+        (tmp_path / "b_raw.json").write_text('{"posts": [{"id": "m1", "content": "b"}]}')
+        handler = FakeHandler()
+        monkeypatch.setattr(analyze, "_worker_handler", handler)
+        monkeypatch.setattr(analyze, "_init_worker", lambda: None)
+        monkeypatch.setattr(analyze, "_match_files", lambda directory, pattern: sorted(
+            str(p) for p in directory.glob(pattern)
+        ))
+        
+        analyze.AnalysisCLI().run(["batch", str(tmp_path), "-j", "1"])
+        
+        out = capsys.readouterr().out
+        assert out.index("a_raw.json") < out.index("No posts found") < out.index("b_raw.json")
+        assert [p.id for p in handler.posts] == ["m1"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
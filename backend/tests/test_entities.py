@@ -9,7 +9,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend_service.entities.post import Post, RedditPost, TelegramMessage
-from backend_service.entities.analysis import AnalysisResult, RiskAssessment
+from backend_service.entities.analysis import AnalysisResult, RiskAssessment, ExtractedEntities
 from backend_service.entities.risk import RiskLevel, RiskClassification
 
 
@@ -56,6 +56,66 @@ class TestRedditPost:
         assert isinstance(data, dict)
         assert data["id"] == "abc123"
         assert data["platform"] == "reddit"
+    
+    def test_from_praw_submission_media(self):
+        """Test media detection on submissions missing optional attributes"""
+        from types import SimpleNamespace
+        
+        base = dict(permalink="/r/test/abc", id="abc", title="t", subreddit="test",
+                    score=1, num_comments=0, created_utc=1.0)
+        image = RedditPost.from_praw_submission(
+            SimpleNamespace(url="https://i.redd.it/x.jpg", thumbnail="self", **base), "h"
+        )
+        video = RedditPost.from_praw_submission(
+            SimpleNamespace(url="https://v.redd.it/x", is_video=True,
+                            media={"reddit_video": {"fallback_url": "f.mp4"}}, **base), "h"
+        )
+        
+        assert (image.media_type, image.image_url, image.thumbnail) == ("image", "https://i.redd.it/x.jpg", None)
+        assert image.content == ""
+        assert (video.media_type, video.video_url) == ("video", "f.mp4")
+    
+    def test_post_to_dict_matches_asdict(self):
+        """Test the explicit post to_dict methods cover every field like asdict()"""
+        from dataclasses import asdict
+        
+        post = RedditPost(
+            id="abc123", content="c", author_hash="h", created_at=0.0, url="",
+            collected_at="", platform="reddit", gallery_images=["a.jpg"],
+            risk_analysis={"risk_score": 0.8, "flags": ["f"]}
+        )
+        message = TelegramMessage(
+            id="1", content="c", author_hash="h", created_at=0.0, url="",
+            collected_at="", platform="telegram", chat_id=5, views=3
+        )
+        
+        assert post.to_dict() == asdict(post)
+        assert message.to_dict() == asdict(message)
+        assert post.to_dict()["risk_analysis"]["flags"] is not post.risk_analysis["flags"]
+
+    def test_reddit_post_from_dict(self):
+        """Test building a Reddit post from saved data"""
+        post = RedditPost.from_dict({
+            "id": "abc123",
+            "title": "Test",
+            "subreddit": "test",
+            "created_utc": 1234567890.0
+        })
+        
+        assert post.title == "Test"
+        assert post.created_at == 1234567890.0
+        assert post.content == ""
+        assert post.platform == "reddit"
+    
+    def test_from_dict_interns_repeated_fields(self):
+        """Test low-cardinality fields share one string object across posts"""
+        first, second = (
+            RedditPost.from_dict({"id": str(i), "subreddit": "".join(["gun", "deals"])})
+            for i in range(2)
+        )
+        
+        assert first.subreddit == "gundeals"
+        assert first.subreddit is second.subreddit
 
 
 class TestTelegramMessage:
@@ -79,6 +139,14 @@ class TestTelegramMessage:
         assert msg.id == "123"
         assert msg.platform == "telegram"
         assert msg.chat_type == "channel"
+    
+    def test_telegram_message_from_dict(self):
+        """Test building a Telegram message from saved data"""
+        msg = TelegramMessage.from_dict({"id": "123", "content": "hi", "chat_id": 42})
+        
+        assert msg.chat_id == 42
+        assert msg.chat_title == ""
+        assert msg.platform == "telegram"
 
 
 class TestAnalysisResult:
@@ -116,6 +184,24 @@ class TestAnalysisResult:
                               detected_keywords=[], detected_patterns=[],
                               analysis_time="", source="rules")
         assert high.risk_level == "HIGH"
+    
+    def test_to_dict_matches_asdict(self):
+        """Test the explicit to_dict methods cover every field like asdict()"""
+        from dataclasses import asdict
+        
+        result = AnalysisResult(
+            risk_score=0.75, confidence=0.9, flags=["f"], detected_keywords=["k"],
+            detected_patterns=["p"], analysis_time="", llm_reasons=["r"]
+        )
+        assessment = RiskAssessment(analysis_id="a", content_hash="h", result=result)
+        
+        assert result.to_dict() == asdict(result)
+        assert assessment.to_dict() == asdict(assessment)
+        assert result.to_dict()["flags"] is not result.flags
+        
+        entities = ExtractedEntities(prices=["$500"], locations=["Dallas"])
+        assert entities.to_dict() == asdict(entities)
+        assert entities.to_dict()["prices"] is not entities.prices
 
 
 class TestRiskLevel:
@@ -147,6 +233,16 @@ class TestRiskClassification:
         assert classification.final_label == "HIGH"
         assert classification.risk_adjustment == 0.3
         assert len(classification.reasons) == 2
+    
+    def test_to_dict_matches_asdict(self):
+        """Test the explicit to_dict covers every field like asdict()"""
+        from dataclasses import asdict
+        
+        classification = RiskClassification(
+            final_label="HIGH", risk_adjustment=0.1, reasons=["r"],
+            evidence_spans=["e"], misclassification_risk="LOW"
+        )
+        assert classification.to_dict() == asdict(classification)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,112 @@
+"""
+Tests for the analysis handler
+"""
+import pytest
+import sys
+import os
+
+# Add backend_service to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend_service.entities.post import RedditPost, TelegramMessage
+from backend_service.handlers.analysis_handler import AnalysisHandler
+
+
+def _reddit_post(post_id: str, title: str, content: str) -> RedditPost:
+    return RedditPost(
+        id=post_id, title=title, content=content, subreddit="test",
+        author_hash="hash", created_at=0.0, url="", collected_at="",
+        platform="reddit"
+    )
+
+
+def _telegram_message(message_id: str, content: str) -> TelegramMessage:
+    return TelegramMessage(
+        id=message_id, content=content, author_hash="hash", created_at=0.0,
+        url="", collected_at="", platform="telegram"
+    )
+
+
+def _unanalyzed_copy(post):
+    data = post.to_dict()
+    data.pop("risk_analysis")
+    return type(post)(**data)
+
+
+class TestAnalysisHandler:
+    """Tests for AnalysisHandler class"""
+    
+    @pytest.fixture
+    def handler(self, tmp_path):
+        return AnalysisHandler(data_dir=str(tmp_path))
+    
+    @pytest.fixture
+    def posts(self):
+        return [
+            _reddit_post("1", "WTS glock", "cash only, no questions"),
+            _reddit_post("2", "Weekend hike", "Great views from the ridge"),
+            _reddit_post("3", "", ""),
+            _telegram_message("4", "selling ammo and a rifle"),
+            _telegram_message("5", "")
+        ]
+    
+    def test_batch_matches_single_analysis(self, handler, posts):
+        """Test the batch path attaches the same analysis as analyze_post"""
+        analyzed = handler.analyze_posts_batch(posts)
+        
+        assert analyzed == posts
+        for post in analyzed:
+            expected = handler.analyze_post(_unanalyzed_copy(post)).risk_analysis
+            if expected is None:
+                assert post.risk_analysis is None
+            else:
+                assert post.risk_analysis["risk_score"] == expected["risk_score"]
+                assert post.risk_analysis["flags"] == expected["flags"]
+
+    
+    def test_categorize_by_risk_boundaries(self, handler):
+        """Test scores on the 0.4 and 0.7 bounds go to the higher category"""
+        posts = [_telegram_message(str(i), "x") for i in range(5)]
+        for post, score in zip(posts, (0.0, 0.39, 0.4, 0.7, 1.0)):
+            post.risk_analysis = {"risk_score": score}
+        unanalyzed = _telegram_message("6", "x")
+        
+        categories = handler.categorize_by_risk(posts + [unanalyzed])
+        
+        assert categories["low"] == posts[:2]
+        assert categories["medium"] == [posts[2]]
+        assert categories["high"] == posts[3:]
+        assert categories["unanalyzed"] == [unanalyzed]
+
+    
+    def test_summary_common_keywords_by_frequency(self, handler):
+        """Test common keywords are the most frequent ones, most frequent first"""
+        posts = [_telegram_message(str(i), "x") for i in range(3)]
+        for post, keywords in zip(posts, (["a", "b"], ["b", "c"], ["b", "c"])):
+            post.risk_analysis = {"risk_score": 0.9, "detected_keywords": keywords}
+        
+        summary = handler.generate_summary(posts)
+        
+        assert summary["common_keywords"] == ["b", "c", "a"]
+        assert summary["common_patterns"] == []
+        assert summary["risk_distribution"]["high_risk"] == 3
+
+    
+    def test_save_analysis_results(self, handler, posts, tmp_path):
+        """Test saved results hold the summary and the posts by category"""
+        from dataclasses import asdict
+        from backend_service.utils import jsonio
+        
+        analyzed = handler.analyze_posts_batch(posts)
+        summary = handler.save_analysis_results(analyzed, "run")
+        saved = jsonio.load_file(tmp_path / "analyzed_posts" / "run_analyzed.json")
+        
+        categories = handler.categorize_by_risk(analyzed)
+        assert saved["summary"] == summary
+        assert summary["platform_distribution"] == {"reddit": 3, "telegram": 2}
+        assert saved["high_risk_posts"] == [asdict(p) for p in categories["high"]]
+        assert saved["low_risk_posts"] == [asdict(p) for p in categories["low"]]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
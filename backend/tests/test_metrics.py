@@ -0,0 +1,131 @@
+"""
+Tests for the metrics collector
+"""
+import gc
+import pytest
+import sys
+import os
+import threading
+
+# Add backend_service to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend_service._metrics import MetricsCollector, MetricNames
+
+
+class TestMetricsCollector:
+    """Tests for MetricsCollector class"""
+    
+    def setup_method(self):
+        """Setup test fixtures"""
+        self.metrics = MetricsCollector()
+    
+    def test_counters(self):
+        """Test counter increments"""
+        self.metrics.increment("a")
+        self.metrics.increment("a", 4)
+        assert self.metrics.get_counter("a") == 5
+        assert self.metrics.get_counter("missing") == 0
+    
+    def test_counters_across_threads(self):
+        """Test that per-thread counter shards are merged on read"""
+        def work():
+            for _ in range(1000):
+                self.metrics.increment("a")
+        
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert self.metrics.get_counter("a") == 4000
+        assert self.metrics.get_all_metrics()["counters"] == {"a": 4000}
+        
+        self.metrics.reset()
+        assert self.metrics.get_counter("a") == 0
+    
+    def test_exited_thread_shards_are_folded(self):
+        """Test that shards of finished threads are merged into base totals"""
+        def work():
+            self.metrics.increment("a", 2)
+        
+        for _ in range(5):
+            t = threading.Thread(target=work)
+            t.start()
+            t.join()
+        gc.collect()
+        
+        assert len(self.metrics._counter_shards) == 0
+        assert self.metrics.get_counter("a") == 10
+        assert self.metrics.get_all_metrics()["counters"] == {"a": 10}
+    
+    def test_counter_slots(self):
+        """Test incrementing predefined and new counters by slot"""
+        slot = self.metrics.slot(MetricNames.ANALYSES_TOTAL)
+        self.metrics.increment_slot(slot)
+        self.metrics.increment(MetricNames.ANALYSES_TOTAL, 2)
+        assert self.metrics.get_counter(MetricNames.ANALYSES_TOTAL) == 3
+        
+        self.metrics.increment("first")
+        new_slot = self.metrics.slot("second")
+        self.metrics.increment_slot(new_slot, 5)
+        assert self.metrics.get_counter("second") == 5
+        assert self.metrics.get_all_metrics()["counters"] == {
+            MetricNames.ANALYSES_TOTAL: 3,
+            "first": 1,
+            "second": 5
+        }
+    
+    def test_histogram_stats(self):
+        """Test histogram statistics"""
+        for value in range(100):
+            self.metrics.record_histogram("latency", float(value))
+        
+        stats = self.metrics.get_histogram_stats("latency")
+        assert stats["count"] == 100
+        assert stats["min"] == 0
+        assert stats["max"] == 99
+        assert stats["avg"] == 49.5
+        assert stats["p50"] == 50
+        assert stats["p95"] == 95
+    
+    def test_histogram_keeps_last_1000(self):
+        """Test that histograms are bounded to the most recent values"""
+        for value in range(1500):
+            self.metrics.record_histogram("latency", float(value))
+        
+        stats = self.metrics.get_histogram_stats("latency")
+        assert stats["count"] == 1000
+        assert stats["min"] == 500
+        assert stats["max"] == 1499
+    
+    def test_histogram_size_configurable(self):
+        """Test a custom histogram capacity"""
+        metrics = MetricsCollector(histogram_size=10)
+        for value in range(25):
+            metrics.record_histogram("latency", float(value))
+        
+        stats = metrics.get_histogram_stats("latency")
+        assert stats["count"] == 10
+        assert stats["min"] == 15
+    
+    def test_empty_histogram(self):
+        """Test stats of an unknown histogram"""
+        assert self.metrics.get_histogram_stats("missing")["count"] == 0
+    
+    def test_get_all_metrics(self):
+        """Test the full metrics snapshot"""
+        self.metrics.increment("a")
+        self.metrics.set_gauge("g", 2.5)
+        self.metrics.record_histogram("h", 1.0)
+        
+        snapshot = self.metrics.get_all_metrics()
+        assert snapshot["counters"] == {"a": 1}
+        assert snapshot["gauges"] == {"g": 2.5}
+        assert snapshot["histograms"]["h"]["count"] == 1
+        assert snapshot["uptime_seconds"] >= 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,201 @@
+"""
+Tests for utility modules
+"""
+import pytest
+import sys
+import os
+
+# Add backend_service to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from backend_service.utils.cache import TTLCache, SemanticCache, load_embedder
+from backend_service.utils import jsonio
+from backend_service.utils.file_manager import FileManager
+from backend_service.entities.post import RedditPost
+from backend_service.utils.hashing import hash_username, simhash64, SimHashIndex
+from backend_service.utils.timestamps import iso_now
+
+
+class TestTTLCache:
+    """Tests for TTLCache"""
+    
+    def test_set_and_get(self):
+        """Test storing and retrieving a value"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("a", {"x": 1})
+        assert cache.get("a") == {"x": 1}
+        assert "a" in cache
+        assert cache.get("missing") is None
+    
+    def test_lru_eviction(self):
+        """Test that least recently used entries are evicted"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+    
+    def test_expiry(self):
+        """Test that expired entries are not returned"""
+        cache = TTLCache(maxsize=10, ttl=-1)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestSemanticCache:
+    """Tests for SemanticCache"""
+    
+    def test_near_duplicate_hit(self):
+        """Test that lightly rephrased text reuses a cached value"""
+        cache = SemanticCache(maxsize=10, threshold=0.8)
+        cache.set("Selling AR-15 rifles, DM me for price, shipping worldwide", {"label": "HIGH"})
+        assert cache.get("selling AR-15 rifles - DM me for price, shipping worldwide!") == {"label": "HIGH"}
+        assert cache.hits == 1
+    
+    def test_unrelated_text_misses(self):
+        """Test that dissimilar text is not served from the cache"""
+        cache = SemanticCache(maxsize=10, threshold=0.95)
+        cache.set("Selling AR-15 rifles, DM me for price", {"label": "HIGH"})
+        assert cache.get("The museum opens a new exhibit on medieval armor") is None
+        assert cache.misses == 1
+    
+    def test_eviction(self):
+        """Test that the cache is bounded"""
+        cache = SemanticCache(maxsize=2)
+        for text in ("one apple", "two bananas", "three cherries"):
+            cache.set(text, text)
+        assert len(cache) == 2
+        assert cache.get("one apple") is None
+    
+    def test_no_model_uses_default_embedding(self):
+        """Test load_embedder leaves the hashed n-gram default in place"""
+        assert load_embedder("") is None
+
+
+
+class TestFileManager:
+    """Tests for FileManager JSON round-trips"""
+    
+    def test_save_and_load_json(self, tmp_path):
+        """Test saved JSON loads back with non-ASCII text and non-str keys"""
+        manager = FileManager(str(tmp_path))
+        path = manager.save_json({"title": "café", "counts": {1: 2}}, "sample")
+        
+        assert path.endswith("sample.json")
+        assert manager.load_json("sample") == {"title": "café", "counts": {"1": 2}}
+        with open(path, encoding="utf-8") as f:
+            assert "café" in f.read()
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dataclasses_serialized_directly(self, monkeypatch, use_orjson):
+        """Test posts can be saved without converting them to dicts first"""
+        if not use_orjson:
+            monkeypatch.setattr(jsonio, "orjson", None)
+        post = RedditPost(
+            id="abc", content="text", author_hash="h", created_at=1.0, url="u",
+            collected_at="2024-01-01T00:00:00", platform="reddit", subreddit="guns"
+        )
+        
+        data = jsonio.loads(jsonio.dumps({"posts": [post]}))
+        assert data["posts"] == [post.to_dict()]
+
+
+
+class TestJsonIO:
+    """Tests for jsonio file helpers"""
+    
+    def test_load_file_round_trip(self, tmp_path):
+        """Test files written by dump_file load back unchanged"""
+        path = tmp_path / "data.json"
+        jsonio.dump_file({"posts": [{"id": "1", "title": "café"}]}, path)
+        
+        assert jsonio.load_file(path) == {"posts": [{"id": "1", "title": "café"}]}
+    
+    def test_load_empty_file_raises(self, tmp_path):
+        """Test an empty file raises a decode error rather than a mapping error"""
+        path = tmp_path / "empty.json"
+        path.write_bytes(b"")
+        
+        with pytest.raises(jsonio.JSONDecodeError):
+            jsonio.load_file(path)
+
+
+class TestSimHash:
+    """Tests for simhash64"""
+    
+    def test_normalized_text_matches(self):
+        """Test case, punctuation and whitespace do not change the hash"""
+        a = simhash64("Selling AK-47, DM me for price")
+        b = simhash64("selling  ak 47 dm me for price!!")
+        
+        assert a == b
+        assert 0 < a < 2 ** 64
+    
+    def test_distinct_text_differs(self):
+        """Test unrelated texts hash differently"""
+        assert simhash64("Selling AK-47, DM me") != simhash64("Great hunting trip this weekend")
+        assert simhash64("") == 0
+
+
+class TestSimHashIndex:
+    """Tests for SimHashIndex near-duplicate lookup"""
+    
+    def test_lightly_edited_texts_collapse(self):
+        """Test that a lightly edited repost is found as a near-duplicate"""
+        original = (
+            "WTS Glock 19 gen 5 with two mags and a holster, barely used, asking 450 cash. "
+            "Pickup only in the Dallas area, DM me on telegram for pics and details"
+        )
+        edited = original.replace("barely used", "lightly used")
+        a, b = simhash64(original), simhash64(edited)
+        assert a != b
+        
+        index = SimHashIndex()
+        assert index.add(a) is True
+        assert index.add(b) is False
+        assert index.add(simhash64("Great hunting trip this weekend with my dad, saw three deer")) is True
+    
+    def test_distance_boundary(self):
+        """Test that fingerprints are compared by Hamming distance across bands"""
+        index = SimHashIndex(max_distance=3)
+        index.add(0)
+        # Three differing bits in three bands still share the fourth band
+        assert index.add((1 << 0) | (1 << 20) | (1 << 40)) is False
+        assert index.add((1 << 0) | (1 << 20) | (1 << 40) | (1 << 60)) is True
+
+
+class TestHashUsername:
+    """Tests for hash_username"""
+    
+    def test_stable_pseudonym(self):
+        """Test plain and salted calls hash like SHA-256"""
+        import hashlib
+        
+        expected = hashlib.sha256(b"some_user").hexdigest()[:16]
+        assert hash_username("some_user") == expected
+        assert hash_username("some_user") == expected
+        assert hash_username("some_user", "salt") == hashlib.sha256(b"saltsome_user").hexdigest()[:16]
+        assert hash_username("[deleted]") == "anonymous"
+
+
+class TestIsoNow:
+    """Tests for iso_now"""
+    
+    def test_close_to_datetime_now(self):
+        """Test the cached timestamp is within a few milliseconds of datetime.now()"""
+        from datetime import datetime
+        
+        before = datetime.now()
+        stamp = datetime.fromisoformat(iso_now())
+        after = datetime.now()
+        
+        assert (before - stamp).total_seconds() < 0.01
+        assert stamp <= after
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])